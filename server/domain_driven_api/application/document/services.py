@@ -1,9 +1,18 @@
-from typing import Dict, Any
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+from typing import Dict, Any, Iterator, List, Optional, Union
 from django.conf import settings
+from django.db.models import Count, Max, OuterRef, Subquery
 from django.db.models.query import QuerySet
 from django.db import transaction
+from django.utils import timezone
+from django.utils.functional import cached_property
 from domain_driven_api.application.file.services import FileAppServices
 
+from domain_driven_api.domain.company.company_division.models import CompanyID
 from domain_driven_api.domain.document.models import Document
 from domain_driven_api.domain.document.services import DocumentServices
 from domain_driven_api.domain.user.models import User
@@ -11,10 +20,19 @@ from domain_driven_api.application.direct_report.services import DirectReportApp
 from domain_driven_api.application.user.services import UserAppServices
 from domain_driven_api.application.roles.services import UserRolesAppServices
 from domain_driven_api.application.company.services import CompanyDivisionAppServices
+from domain_driven_api.application.stored_object.services import (
+    StoredObjectAppServices,
+)
+from domain_driven_api.application.instance_permission.services import (
+    InstancePermissionAppServices,
+)
+from .tasks import propagate_document_permissions
 from utils.django.exceptions import (
+    BaseExceptionWithLogs,
     DoNotHavePermissionException,
     DocumentException,
     DocumentNotExistsException,
+    DirectUploadException,
     FileExtensionNotAllowedException,
     NotFromSameCompanyException,
     UserNotExistException,
@@ -27,34 +45,162 @@ from utils.global_methods.check_instance_permissions import (
 )
 from utils.global_methods.instance_permissions_generator import (
     generate_instance_permissions,
-    generate_permissions_for_all_users,
+)
+from domain_driven_api.infrastructure.identity_map.services import (
+    DIRECT_REPORT,
+    USER,
+    USER_ROLE,
+    load_once,
 )
 from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from domain_driven_api.infrastructure.permission_cache.services import (
+    PermissionDecisionCache,
+)
+from domain_driven_api.infrastructure.service_container.services import get_service
+from domain_driven_api.infrastructure.storages.direct_uploads import (
+    create_direct_upload,
+    get_direct_upload,
+)
 
 
 class DocumentAppServices:
     def __init__(self, log: AttributeLogger) -> None:
         self.log = log
         self.document_services = DocumentServices()
-        self.user_app_services = UserAppServices(log=self.log)
-        self.file_app_services = FileAppServices(
-            log=self.log, user_app_service=self.user_app_services
+        self.permission_decision_cache = PermissionDecisionCache()
+
+    # collaborators are built on first use, once per request through the service container
+
+    @cached_property
+    def user_app_services(self) -> UserAppServices:
+        return get_service(UserAppServices, log=self.log)
+
+    @cached_property
+    def file_app_services(self) -> FileAppServices:
+        return FileAppServices(log=self.log, user_app_service=self.user_app_services)
+
+    @cached_property
+    def stored_object_app_services(self) -> StoredObjectAppServices:
+        return get_service(StoredObjectAppServices, log=self.log)
+
+    @cached_property
+    def user_roles_app_service(self) -> UserRolesAppServices:
+        return get_service(UserRolesAppServices, log=self.log)
+
+    @cached_property
+    def direct_report_app_services(self) -> DirectReportAppServices:
+        return get_service(DirectReportAppServices, log=self.log)
+
+    @cached_property
+    def company_division_app_service(self) -> CompanyDivisionAppServices:
+        return get_service(CompanyDivisionAppServices, log=self.log)
+
+    @cached_property
+    def instance_access_permission(self) -> InstanceAccessPermission:
+        return get_service(InstanceAccessPermission, log=self.log)
+
+    @cached_property
+    def instance_permission_app_services(self) -> InstancePermissionAppServices:
+        return get_service(InstancePermissionAppServices, log=self.log)
+
+    def _get_user_by_id(self, user_id: str) -> Optional[User]:
+        """
+        Returns the user with the given id, loaded at most once per request through the identity map.
+        """
+        return load_once(
+            USER,
+            user_id,
+            lambda: self.user_app_services.list_users().filter(id=str(user_id)).first(),
+        )
+
+    def _get_user_role_by_user_id(self, user_id: str):
+        """
+        Returns the user role of the given user, loaded at most once per request through the identity map.
+        """
+        return load_once(
+            USER_ROLE,
+            user_id,
+            lambda: self.user_roles_app_service.get_user_role_by_user_id(
+                user_id=user_id
+            ),
+        )
+
+    def _get_direct_report_by_id(self, direct_report_id: str):
+        """
+        Returns the direct report with the given id, loaded at most once per request through the identity map.
+        """
+        return load_once(
+            DIRECT_REPORT,
+            direct_report_id,
+            lambda: self.direct_report_app_services.get_direct_report_by_id(
+                direct_report_id=direct_report_id
+            ),
+        )
+
+    def _check_document_write_access(
+        self, user: User, document_id: str, company_id=None
+    ) -> None:
+        """
+        Checks that a user can write a document, through the permission decision cache.
+
+        The decisions are invalidated by every permission change of the document (see
+        `InstancePermissionAppServices`), so repeated mutations skip the role and direct report lookups.
+
+        Raises:
+            DoNotHavePermissionException: If the user does not have write access to the document.
+        """
+        self.permission_decision_cache.check(
+            user_id=str(user.id),
+            module_type=ModuleInstanceType.DOCUMENTS,
+            instance_id=str(document_id),
+            company_id=company_id,
+            check=lambda: self.instance_access_permission.has_write_access(
+                user_id=str(user.id),
+                instance_id=str(document_id),
+                module_type=ModuleInstanceType.DOCUMENTS,
+                company_id=company_id,
+            ),
+        )
+
+    def _grant_document_permission_to_users(
+        self,
+        document_obj_ids: List[str],
+        read_permission: bool,
+        write_permission: bool,
+        users_list: Union[QuerySet, List[str]],
+    ) -> None:
+        """
+        Grants a permission on documents to a list of users, on their direct reports and in the instance permission store.
+
+        Parameters:
+            document_obj_ids (List[str]): The IDs of the document objects.
+            read_permission (bool): Whether the users can read the documents.
+            write_permission (bool): Whether the users can write the documents.
+            users_list (Union[QuerySet, List[str]]): The IDs of the users receiving the permission, a queryset is used as a subquery.
+
+        Returns:
+            None
+        """
+        self.instance_permission_app_services.propagate_instance_permissions(
+            user_ids=users_list,
+            module_type="documents",
+            instance_ids=document_obj_ids,
+            read_permission=read_permission,
+            write_permission=write_permission,
         )
-        self.user_roles_app_service = UserRolesAppServices(log=self.log)
-        self.direct_report_app_services = DirectReportAppServices(log=self.log)
-        self.company_division_app_service = CompanyDivisionAppServices(log=self.log)
-        self.instance_access_permission = InstanceAccessPermission(log=self.log)
 
     def _generate_document_permission_as_per_owner_role(
-        self, user_is_ceo: bool, owner: User, document_obj_id: str
+        self, user_is_ceo: bool, owner: User, document_obj_ids: List[str]
     ) -> None:
         """
         Generates document permissions based on the owner's role.
 
+        The seniors or reportees of the owner are resolved once for all the given documents.
+
         Parameters:
             user_is_ceo (bool): Flag indicating if the user is a CEO.
-            owner (User): The owner of the document.
-            document_obj_id (str): The ID of the document object.
+            owner (User): The owner of the documents.
+            document_obj_ids (List[str]): The IDs of the document objects.
 
         Returns:
             None
@@ -63,23 +209,12 @@ class DocumentAppServices:
             all_reportee_of_ceo = self.user_app_services.reportee_tracker_app_services.get_reportee_trackers_from_senior_id(
                 senior_id=str(owner.id)
             )
-            if all_reportee_of_ceo:
-                user_id_list_of_c_level = list(
-                    map(
-                        lambda user_id: str(user_id),
-                        all_reportee_of_ceo.values_list("reportee_id", flat=True),
-                    )
-                )
-
-                generate_permissions_for_all_users(
-                    log=self.log,
-                    user=owner,
-                    instance_id=document_obj_id,
-                    module_type="documents",
-                    read_permission=True,
-                    write_permission=False,  # C-level user can only read(View) this documents
-                    users_list=user_id_list_of_c_level,
-                )
+            self._grant_document_permission_to_users(
+                document_obj_ids=document_obj_ids,
+                read_permission=True,
+                write_permission=False,  # C-level user can only read(View) this documents
+                users_list=all_reportee_of_ceo.values_list("reportee_id", flat=True),
+            )
         else:
             # Get seniors of new owner
             all_seniors = (
@@ -89,16 +224,177 @@ class DocumentAppServices:
             )
             # All seniors can read and write the documents of their junior
             if all_seniors:
-                generate_permissions_for_all_users(
-                    log=self.log,
-                    user=owner,
-                    instance_id=document_obj_id,
-                    module_type="documents",
+                self._grant_document_permission_to_users(
+                    document_obj_ids=document_obj_ids,
                     read_permission=True,
                     write_permission=True,
                     users_list=all_seniors,
                 )
 
+    def _propagate_document_permissions(
+        self, document_objs: List[Document], owner: User
+    ) -> None:
+        """
+        Shares documents of the same owner with the seniors or the reportees of the owner, in the request or in celery tasks.
+
+        With `DOCUMENT_PERMISSION_PROPAGATION_ASYNC` a propagation is queued for each document once the transaction
+        commits and the documents are marked pending; the owner's own permission is always written in the request.
+
+        Parameters:
+            document_objs (List[Document]): The documents to share.
+            owner (User): The owner of the documents.
+
+        Returns:
+            None
+        """
+        if not settings.DOCUMENT_PERMISSION_PROPAGATION_ASYNC:
+            self._generate_document_permission_as_per_owner_role(
+                user_is_ceo=self.user_app_services.is_user_role_ceo(user=owner),
+                owner=owner,
+                document_obj_ids=[str(document_obj.id) for document_obj in document_objs],
+            )
+            return
+
+        for document_obj in document_objs:
+            document_obj.permission_propagation_id = uuid.uuid4()
+            document_obj.permission_propagation_status = Document.PROPAGATION_PENDING
+        self.document_services.get_document_repo().bulk_update(
+            document_objs,
+            fields=["permission_propagation_id", "permission_propagation_status"],
+        )
+        propagations = [
+            (str(document_obj.id), str(document_obj.permission_propagation_id))
+            for document_obj in document_objs
+        ]
+        # robust: a broker outage must not fail the committed request, the stale propagations are re-queued
+        transaction.on_commit(
+            lambda: [
+                propagate_document_permissions.delay(
+                    document_id=document_id, propagation_id=propagation_id
+                )
+                for document_id, propagation_id in propagations
+            ],
+            robust=True,
+        )
+
+    def requeue_stale_document_permission_propagations(self, stale_after: int) -> int:
+        """
+        Queues again the propagations of the documents left pending for longer than `stale_after` seconds.
+
+        A propagation is lost when the broker was unavailable at the commit or the task was dropped; the task
+        is idempotent through `permission_propagation_id`, so queuing a propagation still running is harmless.
+
+        Parameters:
+            stale_after (int): The number of seconds after the last change of a pending document to queue it again.
+
+        Returns:
+            int: The number of propagations queued.
+        """
+        propagations = (
+            self.document_services.get_document_repo()
+            .filter(
+                permission_propagation_status=Document.PROPAGATION_PENDING,
+                modified_at__lt=timezone.now() - timedelta(seconds=stale_after),
+            )
+            .values_list("id", "permission_propagation_id")
+        )
+        queued_count = 0
+        for document_id, propagation_id in propagations.iterator():
+            propagate_document_permissions.delay(
+                document_id=str(document_id), propagation_id=str(propagation_id)
+            )
+            queued_count += 1
+        return queued_count
+
+    def run_document_permission_propagation(
+        self, document_id: str, propagation_id: str
+    ) -> bool:
+        """
+        Grants the permissions matching the current state of a document to the seniors or reportees of its owner.
+
+        Parameters:
+            document_id (str): The ID of the document.
+            propagation_id (str): The ID of the queued propagation.
+
+        Returns:
+            bool: True if the permissions were propagated, False if the document is gone or a newer propagation was queued.
+        """
+        with transaction.atomic():
+            document_obj = (
+                self.document_services.get_document_repo()
+                .select_for_update()
+                .filter(id=document_id, is_active=True)
+                .first()
+            )
+            if not document_obj or str(document_obj.permission_propagation_id) != str(
+                propagation_id
+            ):
+                return False
+            if document_obj.status == Document.SHARED:
+                owner = self._get_user_by_id(user_id=str(document_obj.owner))
+                self._generate_document_permission_as_per_owner_role(
+                    user_is_ceo=self.user_app_services.is_user_role_ceo(user=owner),
+                    owner=owner,
+                    document_obj_ids=[str(document_obj.id)],
+                )
+            document_obj.permission_propagation_status = Document.PROPAGATION_COMPLETED
+            # modified_at is part of the list validators, the status is listed
+            document_obj.save(
+                update_fields=["permission_propagation_status", "modified_at"]
+            )
+            return True
+
+    def mark_document_permission_propagation_failed(
+        self, document_id: str, propagation_id: str
+    ) -> None:
+        """
+        Marks a propagation as failed, unless a newer propagation was queued in the meantime.
+
+        Parameters:
+            document_id (str): The ID of the document.
+            propagation_id (str): The ID of the failed propagation.
+
+        Returns:
+            None
+        """
+        self.document_services.get_document_repo().filter(
+            id=document_id, permission_propagation_id=propagation_id
+        ).update(
+            permission_propagation_status=Document.PROPAGATION_FAILED,
+            modified_at=timezone.now(),
+        )
+
+    def get_document_permission_propagation_status(
+        self, user: User, document_id: str, company_id=None
+    ) -> Dict[str, Any]:
+        """
+        Returns the permission propagation status of a document of the user's company.
+
+        Parameters:
+            user (User): The user object.
+            document_id (str): The ID of the document.
+            company_id (Optional[int]): The ID of the company. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: The "id" and the "permission_propagation_status" of the document.
+
+        Raises:
+            DocumentNotExistsException: If the document with the given ID does not exist.
+        """
+        document_status = (
+            self.list_all_documents(user=user, company_id=company_id)
+            .filter(id=document_id)
+            .values("id", "permission_propagation_status")
+            .first()
+        )
+        if not document_status:
+            raise DocumentNotExistsException(
+                "document-not-found-exception",
+                "Document not found",
+                self.log,
+            )
+        return document_status
+
     def create_document_from_dict(
         self,
         user: User,
@@ -164,21 +460,31 @@ class DocumentAppServices:
 
                 user_id = user.id
                 user_name = user.username
+                owner_name = user.first_name
 
                 if document_owner:
-                    owner_details = self.user_app_services.user_services.get_user_by_id(
-                        id=document_owner
+                    owner_details = load_once(
+                        USER,
+                        document_owner,
+                        lambda: self.user_app_services.user_services.get_user_by_id(
+                            id=document_owner
+                        ),
                     )
                     user_id = owner_details.id
                     user_name = owner_details.username
+                    owner_name = owner_details.first_name
 
+                file_id = None
                 if not link:
+                    # an identical file already uploaded is reused instead of stored again
+                    self.stored_object_app_services.reference_content(file_obj)
                     file_instance = (
                         self.file_app_services.create_or_update_file_from_file_obj(
                             file_obj=file_obj, user=user, user_name=user_name
                         )
                     )
                     link = file_instance.url
+                    file_id = file_instance.id
 
                 document_obj = document_factory_method.build_entity_with_id(
                     title=title,
@@ -188,6 +494,11 @@ class DocumentAppServices:
                     link=link,
                     is_file_uploaded=True if file_obj else False,
                     file_name=file_obj.name if file_obj else None,
+                    owner_name=owner_name,
+                    company_id=CompanyID(
+                        value=self._get_user_role_by_user_id(user_id=user_id).company_id
+                    ),
+                    file_id=file_id,
                 )
                 document_obj.save()
 
@@ -196,64 +507,211 @@ class DocumentAppServices:
                 )
 
                 #  update direct report of document creator
-                self.direct_report_app_services.update_direct_report_by_user_id(
-                    user=owner_details if document_owner else user,
+                self.instance_permission_app_services.grant_instance_permission(
+                    user_id=str(user_id),
                     module_type="documents",
                     instance=document_instance,
                 )
 
                 if status == Document.SHARED:
-
-                    owner_is_ceo = self.user_app_services.is_user_role_ceo(
-                        user=owner_details if document_owner else user
+                    self._propagate_document_permissions(
+                        document_objs=[document_obj],
+                        owner=owner_details if document_owner else user,
                     )
-                    if owner_is_ceo:
-                        all_reportee_of_ceo = self.user_app_services.reportee_tracker_app_services.get_reportee_trackers_from_senior_id(
-                            senior_id=(
-                                str(owner_details.id)
-                                if document_owner
-                                else str(user.id)
-                            )
-                        )
-
-                        all_user_of_ceo_reportee = list(
-                            map(
-                                lambda user_id: str(user_id),
-                                all_reportee_of_ceo.values_list(
-                                    "reportee_id", flat=True
-                                ),
-                            )
-                        )
-                        if all_user_of_ceo_reportee:
-                            generate_permissions_for_all_users(
-                                log=self.log,
-                                user=owner_details if document_owner else user,
-                                instance_id=document_obj.id,
-                                module_type="documents",
-                                read_permission=True,
-                                write_permission=False,
-                                users_list=all_user_of_ceo_reportee,
-                            )
-                    else:
-                        # get seniors
-                        all_seniors = self.user_app_services.reportee_tracker_app_services.get_all_seniors(
-                            reportee_id=str(user_id)
-                        )
-                        # All seniors can read and write the documents of their junior
-                        if all_seniors:
-                            generate_permissions_for_all_users(
-                                log=self.log,
-                                user=owner_details if document_owner else user,
-                                instance_id=document_obj.id,
-                                module_type="documents",
-                                read_permission=True,
-                                write_permission=True,
-                                users_list=all_seniors,
-                            )
                 return document_obj
         except Exception as e:
             raise e
 
+    def create_document_upload(
+        self, user: User, file_name: str, content_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Issues a presigned upload of a document file, uploaded by the client straight to the bucket.
+
+        Parameters:
+            user (User): The user uploading the file.
+            file_name (str): The name of the file.
+            content_type (str, optional): The content type of the file.
+
+        Returns:
+            Dict[str, Any]: The upload url, the form fields of the upload and the token for `finalize_document_upload`.
+
+        Raises:
+            DirectUploadException: If the media files are not stored in a bucket.
+            FileExtensionNotAllowedException: If the file extension is not allowed.
+        """
+        if not settings.ENABLE_AWS_S3_BUCKET:
+            raise DirectUploadException(
+                "direct-upload-exception",
+                "Direct uploads are not available, please upload the file with the document.",
+                self.log,
+            )
+        return create_direct_upload(
+            user_id=user.id, file_name=file_name, content_type=content_type
+        )
+
+    def finalize_document_upload(
+        self,
+        user: User,
+        data: Dict[str, Any],
+        upload_token: str,
+        company_id=None,
+        is_success_manager=False,
+    ) -> Document:
+        """
+        Creates a document with the file uploaded through `create_document_upload`.
+
+        The file is not read by the worker, it is moved to its final name in the bucket.
+
+        Parameters:
+            user (User): The user who uploaded the file.
+            data (Dict[str, Any]): A dictionary containing the document data.
+            upload_token (str): The token returned by `create_document_upload`.
+            company_id (Optional): The ID of the company. Defaults to None.
+            is_success_manager (bool): Flag indicating if the user is a success manager. Defaults to False.
+
+        Returns:
+            Document: The created document object.
+
+        Raises:
+            DirectUploadException: If the token is invalid or expired, or the file was not uploaded.
+            FileExtensionNotAllowedException: If the content of the file does not match its extension.
+            FileSizeNotAllowedException: If the file is too large.
+        """
+        file_obj = get_direct_upload(user_id=user.id, upload_token=upload_token)
+        return self.create_document_from_dict(
+            user=user,
+            data=data,
+            file_obj=file_obj,
+            company_id=company_id,
+            is_success_manager=is_success_manager,
+        )
+
+    def bulk_create_documents_from_list(
+        self,
+        user: User,
+        items: List[Dict[str, Any]],
+        company_id=None,
+        is_success_manager=False,
+    ) -> List[Union[Document, BaseExceptionWithLogs]]:
+        """
+        Creates many link documents at once.
+
+        Every item is validated before anything is written: the owners and their companies are resolved with one
+        query each, then the valid documents are inserted with a single `bulk_create`. The owners' permissions are
+        granted with one direct report update per owner, and the shared documents are propagated once per
+        distinct owner, whose seniors or reportees are resolved a single time for all of their documents.
+
+        Parameters:
+            user (User): The user object creating the documents.
+            items (List[Dict[str, Any]]): The validated data of each document, as for `create_document_from_dict`.
+            company_id (Optional): The ID of the company. Defaults to None.
+            is_success_manager (bool): Flag indicating if the user is a success manager. Defaults to False.
+
+        Returns:
+            List[Union[Document, BaseExceptionWithLogs]]: For each item, in order, the created document or the
+            exception explaining why it was not created.
+        """
+        if company_id and is_success_manager:
+            ceo_user_obj = self.user_app_services.get_ceo_user_object(
+                company_id=company_id
+            )
+            user = ceo_user_obj if ceo_user_obj else user
+
+        owners = {
+            str(owner.id): owner
+            for owner in self.user_app_services.list_users().filter(
+                id__in={str(item["owner"]) for item in items if item.get("owner")}
+            )
+        }
+        owners[str(user.id)] = user
+        owner_company_ids = {
+            str(user_id): owner_company_id
+            for user_id, owner_company_id in self.user_roles_app_service.list_user_roles()
+            .filter(user_id__in=list(owners))
+            .values_list("user_id", "company_id")
+        }
+        user_company_id = owner_company_ids.get(str(user.id))
+
+        document_factory_method = self.document_services.get_document_factory()
+        results = []
+        for item in items:
+            document_owner = item.get("owner", None)
+            owner_id = str(document_owner) if document_owner else str(user.id)
+            if not item.get("link"):
+                results.append(
+                    DocumentException(
+                        "document-exception", "The link is required.", self.log
+                    )
+                )
+            elif document_owner and item.get("status") == Document.PRIVATE:
+                results.append(
+                    DocumentException(
+                        "document-exception",
+                        "You cannot create private documents for other users.",
+                        self.log,
+                    )
+                )
+            elif owner_id not in owners:
+                results.append(
+                    UserNotExistException(
+                        "user-not-exist-exception", "Owner does not exist.", self.log
+                    )
+                )
+            elif owner_company_ids.get(owner_id) != user_company_id:
+                results.append(
+                    NotFromSameCompanyException(
+                        "not-from-same-company-exception",
+                        "Owner does not belongs to same user company",
+                        self.log,
+                    )
+                )
+            else:
+                document_obj = document_factory_method.build_entity_with_id(
+                    title=item.get("title"),
+                    priority=item.get("priority"),
+                    status=item.get("status"),
+                    owner=UserID(value=owner_id),
+                    link=item.get("link"),
+                    is_file_uploaded=False,
+                    owner_name=owners[owner_id].first_name,
+                    company_id=CompanyID(value=user_company_id),
+                )
+                # bulk_create does not call save(), which maintains the sort keys
+                document_obj.refresh_sort_keys()
+                results.append(document_obj)
+
+        document_objs = [
+            result for result in results if isinstance(result, Document)
+        ]
+        if not document_objs:
+            return results
+        with transaction.atomic():
+            self.document_services.get_document_repo().bulk_create(document_objs)
+            documents_by_owner = defaultdict(list)
+            for document_obj in document_objs:
+                documents_by_owner[str(document_obj.owner)].append(document_obj)
+            for owner_id, owner_document_objs in documents_by_owner.items():
+                #  update direct report of the documents owner
+                self.instance_permission_app_services.grant_instance_permissions(
+                    user_id=owner_id,
+                    module_type="documents",
+                    instances=[
+                        generate_instance_permissions(instance_id=document_obj.id)
+                        for document_obj in owner_document_objs
+                    ],
+                )
+                shared_document_objs = [
+                    document_obj
+                    for document_obj in owner_document_objs
+                    if document_obj.status == Document.SHARED
+                ]
+                if shared_document_objs:
+                    self._propagate_document_permissions(
+                        document_objs=shared_document_objs, owner=owners[owner_id]
+                    )
+        return results
+
     def list_all_documents(self, user: User, company_id=None) -> QuerySet[Document]:
         """
         Returns a QuerySet of all documents based on the user and company ID.
@@ -266,21 +724,96 @@ class DocumentAppServices:
             QuerySet[Document]: A QuerySet of all documents.
 
         """
-        user_role = self.user_roles_app_service.get_user_role_by_user_id(
-            user_id=user.id
+        return self.document_services.get_company_documents(
+            **self._get_company_scope(user=user, company_id=company_id)
         )
-        users_list = (
-            self.user_roles_app_service.list_user_roles()
-            .filter(
-                company_id=(
-                    company_id
-                    if (company_id and user_role.is_success_manager)
-                    else user_role.company_id
-                )
+
+    def _get_company_id(self, user: User, company_id=None):
+        # the company of the user, or the one asked for by a success manager
+        user_role = self._get_user_role_by_user_id(user_id=user.id)
+        if company_id and user_role.is_success_manager:
+            return company_id
+        return user_role.company_id
+
+    def _get_company_scope(self, user: User, company_id=None) -> Dict[str, Any]:
+        # the documents without a company, until `backfill_document_company_ids` has run, go by their owner's role
+        company_id = self._get_company_id(user=user, company_id=company_id)
+        return dict(
+            company_id=company_id,
+            company_user_ids=self.user_roles_app_service.list_user_roles()
+            .filter(company_id=company_id)
+            .values("user_id"),
+        )
+
+    def _schedule_document_file_deletion(self, document_objs: List[Document]) -> None:
+        # each upload took its own reference on the stored object, one is released per document
+        self.stored_object_app_services.schedule_file_deletion(
+            reduce(or_, (document_obj.get_file() for document_obj in document_objs)),
+            urls=[
+                document_obj.link
+                for document_obj in document_objs
+                if document_obj.is_file_uploaded
+            ],
+        )
+
+    def _get_document_for_mutation(
+        self, user: User, document_id: str, company_id=None
+    ) -> Optional[Document]:
+        """
+        Loads and locks a document the user is about to update or delete, checking their write access.
+
+        The instance permission store is only a copy of the direct reports, so it does not decide the access:
+        every mutation goes through `has_write_access`, whose decisions are cached until a permission of the
+        document changes. Must be called inside a transaction.
+
+        Returns:
+            Optional[Document]: The locked document, or None if it does not exist in the company.
+
+        Raises:
+            DoNotHavePermissionException: If the user does not have write access to the document.
+        """
+        document_obj = self.document_services.get_document_for_mutation(
+            id=document_id, **self._get_company_scope(user=user, company_id=company_id)
+        )
+        if document_obj is not None:
+            self._check_document_write_access(
+                user=user, document_id=document_id, company_id=company_id
             )
-            .values_list("user_id", flat=True)
+        return document_obj
+
+    def backfill_document_company_ids(self, batch_size: int = 1000) -> Iterator[int]:
+        """
+        Fills the company of the documents without one from the role of their owner, one batch at a time.
+
+        The documents are walked in primary key order, so a document whose owner has no role is skipped instead
+        of being picked up again.
+
+        Parameters:
+            batch_size (int): The number of documents updated per statement.
+
+        Returns:
+            Iterator[int]: The number of documents updated by each batch.
+        """
+        document_repo = self.document_services.get_document_repo()
+        owner_company_id = (
+            self.user_roles_app_service.list_user_roles()
+            .filter(user_id=OuterRef("owner"))
+            .values("company_id")[:1]
         )
-        return self.document_services.get_document_repo().filter(owner__in=users_list)
+        last_document_id = None
+        while True:
+            documents = document_repo.filter(company_id__isnull=True)
+            if last_document_id is not None:
+                documents = documents.filter(id__gt=last_document_id)
+            document_ids = list(
+                documents.order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not document_ids:
+                return
+            yield document_repo.filter(id__in=document_ids).update(
+                company_id=Subquery(owner_company_id)
+            )
+            last_document_id = document_ids[-1]
 
     def list_documents(
         self,
@@ -298,39 +831,74 @@ class DocumentAppServices:
             QuerySet[Document]: A QuerySet of documents.
 
         """
-        direct_report = self.direct_report_app_services.get_direct_report_by_id(
+        direct_report = self._get_direct_report_by_id(
             direct_report_id=direct_report_id
         )
-        if not direct_report.documents:
-            return self.document_services.get_document_repo().none()
-
-        permissions_dict = {
-            item["id"]: item["permissions"] for item in direct_report.documents
-        }
-
-        if str(direct_report.user_id) != str(user.id):
-            private_documents = self.document_services.get_document_repo().filter(
-                owner=direct_report.user_id, status=Document.PRIVATE
-            )
-            if private_documents:
-                for document in private_documents:
-                    if str(document.id) in permissions_dict.keys():
-                        permissions_dict.pop(str(document.id))
 
         queryset = (
             self.document_services.get_document_repo()
-            .annotate_by_direct_report_permission(
-                permissions=direct_report.documents,
-                filters=dict(
-                    is_active=True,
-                    id__in=list(permissions_dict.keys()),
+            .annotate_by_instance_permission(
+                permissions=self.instance_permission_app_services.list_instance_permissions(
+                    user_id=str(direct_report.user_id), module_type="documents"
                 ),
+                filters=dict(is_active=True),
             )
-            .order_by("-created_at")
+            .order_by("-created_at", "-id")
         )
+        if str(direct_report.user_id) != str(user.id):
+            # private documents of the report are only listed to the report themself
+            queryset = queryset.exclude(
+                owner=direct_report.user_id, status=Document.PRIVATE
+            )
 
         return queryset
 
+    def get_documents_version(
+        self, queryset: QuerySet[Document], direct_report_id: str
+    ) -> str:
+        """
+        Returns a version of a set of documents listed through a direct report.
+
+        The version changes whenever a document of the set is created, updated or deleted, and whenever a
+        permission of the direct report's user changes, since it decides which documents are listed and with which
+        permissions, and whenever an owner of the documents changes, since the owners are listed with them. It is
+        computed with three aggregate queries, without loading any document. The latest
+        modification alone is no version: a deleted document or permission can leave it unchanged or move it back.
+
+        Parameters:
+            queryset (QuerySet[Document]): The documents, as returned by `list_documents` and filtered.
+            direct_report_id (str): The ID of the direct report the documents are listed through.
+
+        Returns:
+            str: The version.
+        """
+        direct_report = self._get_direct_report_by_id(
+            direct_report_id=direct_report_id
+        )
+        documents = queryset.order_by().aggregate(
+            last_modified=Max("modified_at"), count=Count("id")
+        )
+        # a revoked permission is deleted, the count catches it
+        permissions = self.instance_permission_app_services.list_instance_permissions(
+            user_id=str(direct_report.user_id), module_type="documents"
+        ).aggregate(last_modified=Max("modified_at"), count=Count("id"))
+        # the owner data of the list, e.g. a profile change
+        owners = (
+            self.user_app_services.list_users()
+            .filter(id__in=queryset.order_by().values("owner"))
+            .aggregate(last_modified=Max("modified_at"))
+        )
+        return ":".join(
+            str(value)
+            for value in (
+                documents["count"],
+                documents["last_modified"],
+                permissions["count"],
+                permissions["last_modified"],
+                owners["last_modified"],
+            )
+        )
+
     def update_document_from_dict(
         self,
         user: User,
@@ -365,37 +933,31 @@ class DocumentAppServices:
         status = data.get("status", None)
         new_owner_id = data.get("owner", None)
 
-        # Update with common global service
-        self.instance_access_permission.has_write_access(
-            user_id=str(user.id),
-            instance_id=str(document_id),
-            module_type=ModuleInstanceType.DOCUMENTS,
-            company_id=company_id,
-        )
-
-        document_obj = (
-            self.list_all_documents(user=user, company_id=company_id)
-            .filter(id=document_id)
-            .first()
-        )
-        if not document_obj:
-            raise DocumentNotExistsException(
-                "document-not-found-exception",
-                "Document not found",
-                self.log,
-            )
-        if company_id and is_success_manager:
-            ceo_user_obj = self.user_app_services.get_ceo_user_object(
-                company_id=company_id
-            )
-            user = ceo_user_obj if ceo_user_obj else user
-
         try:
             with transaction.atomic():
+                document_obj = self._get_document_for_mutation(
+                    user=user, document_id=document_id, company_id=company_id
+                )
+                if not document_obj:
+                    # the access is checked first, a document out of reach is a permission error
+                    self._check_document_write_access(
+                        user=user, document_id=document_id, company_id=company_id
+                    )
+                    raise DocumentNotExistsException(
+                        "document-not-found-exception",
+                        "Document not found",
+                        self.log,
+                    )
+                if company_id and is_success_manager:
+                    ceo_user_obj = self.user_app_services.get_ceo_user_object(
+                        company_id=company_id
+                    )
+                    user = ceo_user_obj if ceo_user_obj else user
+
                 if data.get("link", None) is not None or file_obj is not None:
-                    document_file_obj = document_obj.get_file()
-                    if document_file_obj:
-                        document_file_obj.delete()
+                    # the replaced object is deleted from the storage after the commit
+                    self._schedule_document_file_deletion([document_obj])
+                    document_obj.file_id = None
                     if file_obj:
                         file_extension = file_obj.name.split(".")[-1]
                         if file_extension not in settings.ALLOWED_FILE_EXTENSIONS:
@@ -404,14 +966,17 @@ class DocumentAppServices:
                                 f"{file_extension} type file is not allowed. Please try to upload a different type of file.",
                                 self.log,
                             )
+                        self.stored_object_app_services.reference_content(file_obj)
                         file_instance = (
                             self.file_app_services.create_or_update_file_from_file_obj(
                                 user=user, file_obj=file_obj
                             )
                         )
                         data["link"] = file_instance.url
-                document_obj.is_file_uploaded = True if file_obj else False
-                document_obj.file_name = file_obj.name if file_obj else None
+                        document_obj.file_id = file_instance.id
+                    # a title or status change keeps the uploaded file
+                    document_obj.is_file_uploaded = True if file_obj else False
+                    document_obj.file_name = file_obj.name if file_obj else None
 
                 if status:
                     if new_owner_id:
@@ -420,10 +985,8 @@ class DocumentAppServices:
                             f"You can not update the owner and status of document at same time.",
                             self.log,
                         )
-                    document_existing_owner = (
-                        self.user_app_services.list_users()
-                        .filter(id=str(document_obj.owner))
-                        .first()
+                    document_existing_owner = self._get_user_by_id(
+                        user_id=str(document_obj.owner)
                     )
 
                     if (
@@ -431,17 +994,15 @@ class DocumentAppServices:
                         and status == Document.PRIVATE
                     ):
                         # Remove instance from all company user
-                        self.direct_report_app_services.remove_instance_from_direct_report(
-                            user=document_existing_owner,
-                            module_type="documents",
-                            instance=str(document_obj.id),
+                        self.instance_permission_app_services.revoke_instance_permissions(
+                            module_type="documents", instance_id=str(document_obj.id)
                         )
                         # Add permission for specific user
                         document_instance = generate_instance_permissions(
                             instance_id=document_obj.id
                         )
                         #  update direct report of document creator
-                        self.direct_report_app_services.update_direct_report_by_user_id_as_str(
+                        self.instance_permission_app_services.grant_instance_permission(
                             user_id=str(document_obj.owner),
                             module_type="documents",
                             instance=document_instance,
@@ -451,21 +1012,12 @@ class DocumentAppServices:
                         document_obj.status == Document.PRIVATE
                         and status == Document.SHARED
                     ):
-                        is_user_ceo = self.user_app_services.is_user_role_ceo(
-                            user=document_existing_owner
-                        )
-                        self._generate_document_permission_as_per_owner_role(
-                            user_is_ceo=is_user_ceo,
-                            owner=document_existing_owner,
-                            document_obj_id=str(document_obj.id),
+                        self._propagate_document_permissions(
+                            document_objs=[document_obj], owner=document_existing_owner
                         )
 
                 if new_owner_id:
-                    new_owner = (
-                        self.user_app_services.list_users()
-                        .filter(id=str(new_owner_id))
-                        .first()
-                    )
+                    new_owner = self._get_user_by_id(user_id=str(new_owner_id))
                     if not new_owner:
                         raise UserNotExistException(
                             "user-not-exist-exception",
@@ -483,33 +1035,29 @@ class DocumentAppServices:
                         )
 
                     document_obj.owner = str(new_owner.id)
+                    document_obj.owner_name = new_owner.first_name
+                    document_obj.company_id = self._get_user_role_by_user_id(
+                        user_id=str(new_owner.id)
+                    ).company_id
 
                     # Remove instance from all company user
-                    self.direct_report_app_services.remove_instance_from_direct_report(
-                        user=user,
-                        module_type="documents",
-                        instance=str(document_obj.id),
+                    self.instance_permission_app_services.revoke_instance_permissions(
+                        module_type="documents", instance_id=str(document_obj.id)
                     )
 
                     # Add permission and Update direct report of new owner
                     document_instance = generate_instance_permissions(
                         instance_id=document_obj.id
                     )
-                    self.direct_report_app_services.update_direct_report_by_user_id(
-                        user=new_owner,
+                    self.instance_permission_app_services.grant_instance_permission(
+                        user_id=str(new_owner.id),
                         module_type="documents",
                         instance=document_instance,
                     )
 
                     if document_obj.status == Document.SHARED:
-                        is_user_ceo = self.user_app_services.is_user_role_ceo(
-                            user=new_owner
-                        )
-
-                        self._generate_document_permission_as_per_owner_role(
-                            user_is_ceo=is_user_ceo,
-                            owner=new_owner,
-                            document_obj_id=str(document_obj.id),
+                        self._propagate_document_permissions(
+                            document_objs=[document_obj], owner=new_owner
                         )
 
                 #  Update document entity
@@ -535,40 +1083,139 @@ class DocumentAppServices:
 
         Raises:
             DocumentNotExistsException: If the document with the given ID does not exist.
+            DoNotHavePermissionException: If the user does not have write access to the document.
 
         """
-        document_queryset = self.list_all_documents(
-            user=user, company_id=company_id
-        ).filter(id=document_id)
-        if not document_queryset:
-            raise DocumentNotExistsException(
-                "document-not-found-exception",
-                "Document not found",
-                self.log,
-            )
-
-        # Update with common service
-        self.instance_access_permission.has_write_access(
-            user_id=str(user.id),
-            instance_id=str(document_id),
-            module_type=ModuleInstanceType.DOCUMENTS,
-            company_id=company_id,
-        )
-
         try:
             with transaction.atomic():
+                document_obj = self._get_document_for_mutation(
+                    user=user, document_id=document_id, company_id=company_id
+                )
+                if not document_obj:
+                    raise DocumentNotExistsException(
+                        "document-not-found-exception",
+                        "Document not found",
+                        self.log,
+                    )
 
-                file_obj = document_queryset.first().get_file()
-                if file_obj:
-                    file_obj.delete()
+                # the object is deleted from the storage after the commit
+                self._schedule_document_file_deletion([document_obj])
 
                 # Remove all user's permission instance
-                self.direct_report_app_services.remove_instance_from_direct_report(
-                    user=user,
-                    module_type="documents",
-                    instance=str(document_queryset.first().id),
+                self.instance_permission_app_services.revoke_instance_permissions(
+                    module_type="documents", instance_id=str(document_id)
                 )
-                document_queryset.delete()
+                document_obj.delete()
                 return True
         except Exception as e:
             raise e
+
+    def bulk_update_documents_from_list(
+        self,
+        user: User,
+        items: List[Dict[str, Any]],
+        company_id=None,
+        is_success_manager=False,
+    ) -> List[Union[Document, BaseExceptionWithLogs]]:
+        """
+        Updates many documents, each one in its own transaction.
+
+        An update may move a document to another owner or status, so each item goes through
+        `update_document_from_dict`; the users, roles and permission decisions it looks up are shared by the
+        items through the identity map and the permission decision cache. A failing item does not roll back
+        the others.
+
+        Parameters:
+            user (User): The user object updating the documents.
+            items (List[Dict[str, Any]]): The validated data of each update, with the "id" of the document.
+            company_id (Optional): The ID of the company. Defaults to None.
+            is_success_manager (bool): Flag indicating if the user is a success manager. Defaults to False.
+
+        Returns:
+            List[Union[Document, BaseExceptionWithLogs]]: For each item, in order, the updated document or the
+            exception explaining why it was not updated.
+        """
+        results = []
+        for item in items:
+            data = dict(item)
+            document_id = data.pop("id")
+            try:
+                results.append(
+                    self.update_document_from_dict(
+                        user=user,
+                        data=data,
+                        document_id=str(document_id),
+                        company_id=company_id,
+                        is_success_manager=is_success_manager,
+                    )
+                )
+            except (
+                DocumentNotExistsException,
+                DocumentException,
+                DoNotHavePermissionException,
+                UserNotExistException,
+                NotFromSameCompanyException,
+            ) as e:
+                results.append(e)
+        return results
+
+    def bulk_delete_documents_by_ids(
+        self, user: User, document_ids: List[str], company_id=None
+    ) -> List[Union[bool, BaseExceptionWithLogs]]:
+        """
+        Deletes many documents at once.
+
+        The documents are loaded and locked with one query, and the ones the user can write are deleted together:
+        one update of the direct reports, one delete of the stored permissions, of the files and of the documents.
+
+        Parameters:
+            user (User): The user object deleting the documents.
+            document_ids (List[str]): The IDs of the documents to delete.
+            company_id (Optional[int]): The ID of the company. Defaults to None.
+
+        Returns:
+            List[Union[bool, BaseExceptionWithLogs]]: For each ID, in order, True if the document was deleted or
+            the exception explaining why it was not.
+        """
+        document_ids = [str(document_id) for document_id in document_ids]
+        results = {}
+        with transaction.atomic():
+            deletable_document_objs = []
+            for document_obj in self.document_services.get_documents_for_mutation(
+                ids=document_ids,
+                **self._get_company_scope(user=user, company_id=company_id),
+            ):
+                try:
+                    self._check_document_write_access(
+                        user=user,
+                        document_id=str(document_obj.id),
+                        company_id=company_id,
+                    )
+                except DoNotHavePermissionException as e:
+                    results[str(document_obj.id)] = e
+                    continue
+                deletable_document_objs.append(document_obj)
+
+            if deletable_document_objs:
+                deletable_document_ids = [
+                    str(document_obj.id) for document_obj in deletable_document_objs
+                ]
+                # the objects are deleted from the storage after the commit
+                self._schedule_document_file_deletion(deletable_document_objs)
+                # Remove all user's permission instances
+                self.instance_permission_app_services.revoke_many_instance_permissions(
+                    module_type="documents", instance_ids=deletable_document_ids
+                )
+                self.document_services.get_document_repo().filter(
+                    id__in=deletable_document_ids
+                ).delete()
+                results.update(dict.fromkeys(deletable_document_ids, True))
+
+        return [
+            results[document_id]
+            if document_id in results
+            else DocumentNotExistsException(
+                "document-not-found-exception", "Document not found", self.log
+            )
+            for document_id in document_ids
+        ]
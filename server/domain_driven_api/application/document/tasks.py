@@ -0,0 +1,62 @@
+import logging
+from celery import shared_task
+from django.conf import settings
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+MAX_RETRIES = 5
+
+
+@shared_task(bind=True, max_retries=MAX_RETRIES, acks_late=True)
+def propagate_document_permissions(self, document_id: str, propagation_id: str):
+    """
+    Shares a document with the seniors or the reportees of its owner, outside of the request that changed it.
+
+    The task is idempotent: it grants the permissions matching the current state of the document, and does
+    nothing when a newer change has queued another propagation. Failures are retried with a backoff, the
+    propagation is marked failed once the retries are exhausted.
+
+    Parameters:
+        document_id (str): The ID of the document.
+        propagation_id (str): The ID of the propagation, as stored on the document when it was queued.
+
+    Returns:
+        bool: True if the permissions were propagated, False if the propagation was stale.
+    """
+    # imported here, the app services queue this task
+    from .services import DocumentAppServices
+
+    document_app_services = DocumentAppServices(log=log)
+    try:
+        return document_app_services.run_document_permission_propagation(
+            document_id=document_id, propagation_id=propagation_id
+        )
+    except Exception as e:
+        if self.request.retries >= MAX_RETRIES:
+            document_app_services.mark_document_permission_propagation_failed(
+                document_id=document_id, propagation_id=propagation_id
+            )
+            raise e
+        raise self.retry(exc=e, countdown=2**self.request.retries)
+
+
+@shared_task(acks_late=True)
+def requeue_stale_document_permission_propagations():
+    """
+    Queues again the permission propagations of the documents left pending, whose task was lost.
+
+    Run periodically; the documents pending for longer than `DOCUMENT_PERMISSION_PROPAGATION_STALE_AFTER`
+    seconds are queued again, the propagation task ignores the ones already done.
+
+    Returns:
+        int: The number of propagations queued.
+    """
+    # imported here, the app services queue the tasks of this module
+    from .services import DocumentAppServices
+
+    return DocumentAppServices(
+        log=log
+    ).requeue_stale_document_permission_propagations(
+        stale_after=settings.DOCUMENT_PERMISSION_PROPAGATION_STALE_AFTER
+    )
@@ -1,9 +1,21 @@
 import logging
+import uuid
+from datetime import timedelta
+from unittest import mock
 
 # django imports
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models.query import QuerySet
 from domain_driven_api.domain.document.models import Document
+from domain_driven_api.domain.stored_object.models import StoredObject
+from domain_driven_api.domain.instance_permission.models import InstancePermission
+from domain_driven_api.infrastructure.identity_map.services import identity_map_scope
+from domain_driven_api.infrastructure.permission_cache.services import (
+    PermissionDecisionCache,
+)
 from domain_driven_api.domain.user.models import UserBasePermissions, UserPersonalData
 from domain_driven_api.domain.user.services import UserServices
 from domain_driven_api.application.roles.services import RolesAppServices
@@ -23,6 +35,14 @@ from domain_driven_api.application.document.services import DocumentAppServices
 from domain_driven_api.application.direct_report.services import DirectReportAppServices
 
 from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from utils.global_methods.check_instance_permissions import (
+    InstanceAccessPermission,
+)
+from utils.django.exceptions import (
+    DocumentException,
+    DocumentNotExistsException,
+    DoNotHavePermissionException,
+)
 
 log = AttributeLogger(logging.getLogger(__name__))
 
@@ -36,6 +56,9 @@ class DocumentAppServicesTests(TestCase):
     - test_list_documents: Tests the list_documents method of DocumentAppServices.
     - test_update_document_from_dict: Tests the update_document_from_dict method of DocumentAppServices.
     - test_delete_document_by_id: Tests the delete_document_by_id method of DocumentAppServices.
+    - test_bulk_create_documents_from_list: Tests the bulk_create_documents_from_list method of DocumentAppServices.
+    - test_bulk_update_documents_from_list: Tests the bulk_update_documents_from_list method of DocumentAppServices.
+    - test_bulk_delete_documents_by_ids: Tests the bulk_delete_documents_by_ids method of DocumentAppServices.
 
     """
 
@@ -170,12 +193,240 @@ class DocumentAppServicesTests(TestCase):
                 data=dict(title="Doc Title", priority="High", status="Shared"),
             )
 
+    def test_document_company_is_stored_and_backfilled(self):
+        document = self.document_app_service.create_document_from_dict(
+            user=self.user_obj_01,
+            data=dict(
+                title="Doc Title",
+                priority="High",
+                status="Shared",
+                link="www.google.com",
+            ),
+        )
+        self.assertEqual(document.company_id, self.company.id)
+        self.assertIn(
+            document,
+            self.document_app_service.list_all_documents(user=self.user_obj_01),
+        )
+
+        Document.objects.filter(id=document.id).update(company_id=None)
+        # a document created before its company was stored is reached through its owner until the backfill
+        self.assertIn(
+            document,
+            self.document_app_service.list_all_documents(user=self.user_obj_01),
+        )
+        document = self.document_app_service.update_document_from_dict(
+            user=self.user_obj_01, data=dict(title="New Title"), document_id=document.id
+        )
+        self.assertEqual(document.title, "New Title")
+        self.assertEqual(
+            sum(self.document_app_service.backfill_document_company_ids(batch_size=1)),
+            1,
+        )
+        document.refresh_from_db()
+        self.assertEqual(document.company_id, self.company.id)
+
     def test_list_documents(self):
         list_documents = self.document_app_service.list_documents(
             user=self.user_obj_01, direct_report_id=self.direct_report_01.id
         )
         self.assertEqual(type(list_documents), QuerySet)
 
+    def test_list_documents_joins_instance_permissions(self):
+        document = self.document_app_service.create_document_from_dict(
+            user=self.user_obj_01,
+            data=dict(
+                title="Doc Title",
+                priority="High",
+                status="Private",
+                link="www.google.com",
+            ),
+        )
+        list_documents = self.document_app_service.list_documents(
+            user=self.user_obj_01, direct_report_id=self.direct_report_01.id
+        )
+        self.assertIn(document.id, list_documents.values_list("id", flat=True))
+        self.assertIsNotNone(list_documents.get(id=document.id).permissions)
+
+        # private documents are hidden from other users of the same direct report
+        list_documents = self.document_app_service.list_documents(
+            user=self.user_obj_02, direct_report_id=self.direct_report_01.id
+        )
+        self.assertNotIn(document.id, list_documents.values_list("id", flat=True))
+
+    def test_list_documents_loads_the_direct_report_once_per_request(self):
+        with identity_map_scope():
+            self.document_app_service.list_documents(
+                user=self.user_obj_01, direct_report_id=self.direct_report_01.id
+            )
+            with CaptureQueriesContext(connection) as context:
+                DocumentAppServices(log=log).list_documents(
+                    user=self.user_obj_01, direct_report_id=self.direct_report_01.id
+                )
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_list_documents_excludes_private_documents_in_the_query(self):
+        for _ in range(3):
+            self.document_app_service.create_document_from_dict(
+                user=self.user_obj_01,
+                data=dict(
+                    title="Doc Title",
+                    priority="High",
+                    status="Private",
+                    link="www.google.com",
+                ),
+            )
+        with CaptureQueriesContext(connection) as context:
+            list_documents = self.document_app_service.list_documents(
+                user=self.user_obj_02, direct_report_id=self.direct_report_01.id
+            )
+        # the private documents are not loaded to build the list query
+        self.assertFalse(
+            any('FROM "document"' in query["sql"] for query in context.captured_queries)
+        )
+        self.assertFalse(list_documents.filter(status="Private").exists())
+
+    @override_settings(DOCUMENT_PERMISSION_PROPAGATION_ASYNC=True)
+    def test_create_document_queues_permission_propagation(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            document = self.document_app_service.create_document_from_dict(
+                user=self.user_obj_01,
+                data=dict(
+                    title="Doc Title",
+                    priority="High",
+                    status="Shared",
+                    link="www.google.com",
+                ),
+            )
+        self.assertEqual(len(callbacks), 1)
+        document.refresh_from_db()
+        self.assertEqual(
+            document.permission_propagation_status, Document.PROPAGATION_PENDING
+        )
+        # the owner's permission is written in the request
+        self.assertTrue(
+            self.document_app_service.instance_permission_app_services.list_instance_permissions(
+                user_id=str(self.user_obj_01.id), module_type="documents"
+            )
+            .filter(instance_id=document.id)
+            .exists()
+        )
+
+        self.assertFalse(
+            self.document_app_service.run_document_permission_propagation(
+                document_id=str(document.id), propagation_id=str(uuid.uuid4())
+            )
+        )
+        self.assertTrue(
+            self.document_app_service.run_document_permission_propagation(
+                document_id=str(document.id),
+                propagation_id=str(document.permission_propagation_id),
+            )
+        )
+        status = self.document_app_service.get_document_permission_propagation_status(
+            user=self.user_obj_01, document_id=str(document.id)
+        )
+        self.assertEqual(
+            status["permission_propagation_status"], Document.PROPAGATION_COMPLETED
+        )
+
+    @override_settings(DOCUMENT_PERMISSION_PROPAGATION_ASYNC=True)
+    def test_stale_permission_propagation_is_queued_again(self):
+        # the callback is dropped, as when the broker is unavailable at the commit
+        with self.captureOnCommitCallbacks(execute=False):
+            document = self.document_app_service.create_document_from_dict(
+                user=self.user_obj_01,
+                data=dict(
+                    title="Doc Title",
+                    priority="High",
+                    status="Shared",
+                    link="www.google.com",
+                ),
+            )
+        document.refresh_from_db()
+
+        with mock.patch(
+            "domain_driven_api.application.document.services.propagate_document_permissions"
+        ) as propagate_document_permissions:
+            self.assertEqual(
+                self.document_app_service.requeue_stale_document_permission_propagations(
+                    stale_after=60
+                ),
+                0,
+            )
+            Document.objects.filter(id=document.id).update(
+                modified_at=document.modified_at - timedelta(minutes=2)
+            )
+            self.assertEqual(
+                self.document_app_service.requeue_stale_document_permission_propagations(
+                    stale_after=60
+                ),
+                1,
+            )
+        propagate_document_permissions.delay.assert_called_once_with(
+            document_id=str(document.id),
+            propagation_id=str(document.permission_propagation_id),
+        )
+
+    def get_bumped_permission_versions(self, write):
+        with mock.patch.object(
+            PermissionDecisionCache, "bump_version", autospec=True
+        ) as bump_version:
+            with self.captureOnCommitCallbacks(execute=True):
+                result = write()
+        bumped_instance_ids = {
+            instance_id
+            for call in bump_version.call_args_list
+            for instance_id in call.kwargs["instance_ids"]
+        }
+        return result, bumped_instance_ids
+
+    @override_settings(DOCUMENT_PERMISSION_PROPAGATION_ASYNC=True)
+    def test_every_permission_write_path_bumps_the_permission_version(self):
+        def create_document():
+            return self.document_app_service.create_document_from_dict(
+                user=self.user_obj_01,
+                data=dict(
+                    title="Doc Title",
+                    priority="High",
+                    status="Shared",
+                    link="www.google.com",
+                ),
+            )
+
+        def update_document(document, **data):
+            return lambda: self.document_app_service.update_document_from_dict(
+                user=self.user_obj_01, data=data, document_id=document.id
+            )
+
+        document, bumped_instance_ids = self.get_bumped_permission_versions(
+            create_document
+        )
+        self.assertIn(str(document.id), bumped_instance_ids)
+        other_document, _ = self.get_bumped_permission_versions(create_document)
+
+        document.refresh_from_db()
+        writes = [
+            # the queued propagation
+            lambda: self.document_app_service.run_document_permission_propagation(
+                document_id=str(document.id),
+                propagation_id=str(document.permission_propagation_id),
+            ),
+            update_document(document, status="Private"),
+            update_document(document, status="Shared"),
+            lambda: self.document_app_service.delete_document_by_id(
+                user=self.user_obj_01, document_id=document.id
+            ),
+        ]
+        for write in writes:
+            _, bumped_instance_ids = self.get_bumped_permission_versions(write)
+            self.assertIn(str(document.id), bumped_instance_ids)
+
+        _, bumped_instance_ids = self.get_bumped_permission_versions(
+            update_document(other_document, owner=str(self.user_obj_02.id))
+        )
+        self.assertIn(str(other_document.id), bumped_instance_ids)
+
     def test_update_document_from_dict(self):
         existing_document = self.document_app_service.create_document_from_dict(
             user=self.user_obj_01,
@@ -233,3 +484,171 @@ class DocumentAppServicesTests(TestCase):
                 user=self.user_obj_01,
                 document_id="ba3cb337-5780-4488-b271-3d5d21b7549d",
             )
+
+    def test_stored_write_permission_does_not_bypass_the_access_check(self):
+        existing_document = self.document_app_service.create_document_from_dict(
+            user=self.user_obj_01,
+            data=dict(
+                title="Doc Title",
+                priority="High",
+                status="Shared",
+                link="www.google.com",
+            ),
+        )
+
+        # the store still holds the write permission of a user who lost the access, e.g. a former senior
+        with mock.patch.object(
+            InstanceAccessPermission, "has_write_access", return_value=False
+        ):
+            with self.assertRaises(DoNotHavePermissionException):
+                self.document_app_service.delete_document_by_id(
+                    user=self.user_obj_01, document_id=existing_document.id
+                )
+            (result,) = self.document_app_service.bulk_delete_documents_by_ids(
+                user=self.user_obj_01, document_ids=[existing_document.id]
+            )
+        self.assertIsInstance(result, DoNotHavePermissionException)
+        self.assertTrue(Document.objects.filter(id=existing_document.id).exists())
+
+    def test_bulk_create_documents_from_list(self):
+        results = self.document_app_service.bulk_create_documents_from_list(
+            user=self.user_obj_01,
+            items=[
+                dict(title="Doc 1", priority="High", status="Shared", link="www.a.com"),
+                # without link
+                dict(title="Doc 2", priority="High", status="Shared"),
+                # private document for another user
+                dict(
+                    title="Doc 3",
+                    priority="Low",
+                    status="Private",
+                    link="www.c.com",
+                    owner=str(self.user_obj_02.id),
+                ),
+                dict(
+                    title="Doc 4",
+                    priority="Low",
+                    status="Shared",
+                    link="www.d.com",
+                    owner=str(self.user_obj_02.id),
+                ),
+            ],
+        )
+
+        self.assertIsInstance(results[0], Document)
+        self.assertIsInstance(results[1], DocumentException)
+        self.assertIsInstance(results[2], DocumentException)
+        self.assertIsInstance(results[3], Document)
+        created_document = Document.objects.get(id=results[3].id)
+        self.assertEqual(str(created_document.owner), str(self.user_obj_02.id))
+        self.assertEqual(created_document.company_id, self.company.id)
+        self.assertEqual(
+            created_document.priority_rank, Document.PRIORITY_RANKS[Document.LOW]
+        )
+        # each owner holds the permission of their own documents
+        for document, owner in (
+            (results[0], self.user_obj_01),
+            (results[3], self.user_obj_02),
+        ):
+            self.assertTrue(
+                InstancePermission.objects.filter(
+                    user_id=owner.id, instance_id=document.id
+                ).exists()
+            )
+
+    def test_bulk_update_documents_from_list(self):
+        updated_document, rejected_document = [
+            self.document_app_service.create_document_from_dict(
+                user=self.user_obj_01,
+                data=dict(
+                    title=title, priority="High", status="Shared", link="www.google.com"
+                ),
+            )
+            for title in ("Doc 1", "Doc 2")
+        ]
+
+        results = self.document_app_service.bulk_update_documents_from_list(
+            user=self.user_obj_01,
+            items=[
+                dict(id=updated_document.id, title="New Title", priority="Low"),
+                dict(id="ba3cb337-5780-4488-b271-3d5d21b7549d", title="New Title"),
+                # the owner and the status together
+                dict(
+                    id=rejected_document.id,
+                    title="New Title",
+                    status="Private",
+                    owner=str(self.user_obj_02.id),
+                ),
+            ],
+        )
+
+        self.assertIsInstance(results[0], Document)
+        self.assertIsInstance(results[1], DoNotHavePermissionException)
+        self.assertIsInstance(results[2], DoNotHavePermissionException)
+        updated_document.refresh_from_db()
+        self.assertEqual(updated_document.title, "New Title")
+        self.assertEqual(
+            updated_document.priority_rank, Document.PRIORITY_RANKS[Document.LOW]
+        )
+        # a failed item is rolled back on its own
+        rejected_document.refresh_from_db()
+        self.assertEqual(rejected_document.title, "Doc 2")
+
+    def test_bulk_delete_documents_by_ids(self):
+        existing_document = self.document_app_service.create_document_from_dict(
+            user=self.user_obj_01,
+            data=dict(
+                title="Doc Title",
+                priority="High",
+                status="Shared",
+                link="www.google.com",
+            ),
+        )
+        missing_document_id = "ba3cb337-5780-4488-b271-3d5d21b7549d"
+
+        results = self.document_app_service.bulk_delete_documents_by_ids(
+            user=self.user_obj_01,
+            document_ids=[existing_document.id, missing_document_id],
+        )
+
+        self.assertIs(results[0], True)
+        self.assertIsInstance(results[1], DocumentNotExistsException)
+        self.assertFalse(Document.objects.filter(id=existing_document.id).exists())
+        self.assertFalse(
+            InstancePermission.objects.filter(instance_id=existing_document.id).exists()
+        )
+        self.direct_report_01.refresh_from_db()
+        self.assertNotIn(
+            str(existing_document.id),
+            [entry["id"] for entry in self.direct_report_01.documents],
+        )
+
+    @override_settings(ENABLE_AWS_S3_BUCKET=True, AWS_LOCATION="media")
+    def test_documents_sharing_an_object_release_a_reference_each(self):
+        document_app_service = DocumentAppServices(log=log)
+        document_app_service.file_app_services = mock.Mock()
+        document_app_service.file_app_services.create_or_update_file_from_file_obj.side_effect = lambda file_obj, **kwargs: mock.Mock(
+            id=uuid.uuid4(),
+            url=f"https://bucket.s3.amazonaws.com/media/{file_obj.content_address}",
+        )
+        documents = [
+            document_app_service.create_document_from_dict(
+                user=self.user_obj_01,
+                data=dict(title="Doc Title", priority="High", status="Private"),
+                file_obj=SimpleUploadedFile(name, b"%PDF-1.7 content"),
+            )
+            for name in ("report.pdf", "copy.pdf")
+        ]
+        self.assertEqual(documents[0].link, documents[1].link)
+        self.assertNotEqual(documents[0].file_id, documents[1].file_id)
+        self.assertEqual(StoredObject.objects.get().reference_count, 2)
+
+        document_app_service.delete_document_by_id(
+            user=self.user_obj_01, document_id=documents[0].id
+        )
+        self.assertEqual(StoredObject.objects.get().reference_count, 1)
+
+        document_app_service.bulk_delete_documents_by_ids(
+            user=self.user_obj_01, document_ids=[documents[1].id]
+        )
+        self.assertEqual(StoredObject.objects.get().reference_count, 0)
@@ -0,0 +1,287 @@
+from functools import reduce
+from itertools import islice
+from operator import or_
+from typing import Dict, Any, Iterable, List, Union
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.query import QuerySet
+
+from domain_driven_api.domain.direct_report.services import DirectReportServices
+from domain_driven_api.domain.instance_permission.models import InstancePermission
+from domain_driven_api.domain.instance_permission.services import (
+    InstancePermissionServices,
+)
+from domain_driven_api.infrastructure.permission_cache.services import (
+    PermissionDecisionCache,
+)
+from utils.django.json_expressions import JSONBArrayRemove, JSONBArrayUpsert
+from utils.global_methods.global_value_objects import UserID
+from utils.global_methods.instance_permissions_generator import (
+    generate_instance_permissions,
+)
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+
+
+class InstancePermissionAppServices:
+    """
+    Application services for the normalized per-user instance permission store.
+
+    The store mirrors the permission entries kept on the direct reports, one row per
+    (user, module type, instance), so listings can join against it. Every write updates both,
+    the direct report entries being appended or removed inside the database, and bumps the
+    version of the instance in the permission decision cache once committed.
+
+    Methods:
+        list_instance_permissions(user_id, module_type): Lists the permissions a user holds for a module type.
+        grant_instance_permission(user_id, module_type, instance): Writes a permission entry for one user, on their direct report and in the store.
+        grant_instance_permissions(user_id, module_type, instances): Writes many permission entries for one user, with a single UPDATE of their direct report.
+        revoke_instance_permissions(module_type, instance_id): Removes the permissions of every user on an instance, from the direct reports and the store.
+        revoke_many_instance_permissions(module_type, instance_ids): Removes the permissions of every user on many instances at once.
+        propagate_instance_permissions(user_ids, module_type, instance_ids, read_permission, write_permission): Grants the same permission on many instances to many users, on their direct reports and in the store, with set-based statements.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, log: AttributeLogger) -> None:
+        self.log = log
+        self.instance_permission_services = InstancePermissionServices()
+        self.direct_report_services = DirectReportServices()
+        self.permission_decision_cache = PermissionDecisionCache()
+
+    def _invalidate_permission_decisions(
+        self, module_type: str, instance_ids: List[str]
+    ) -> None:
+        instance_ids = [str(instance_id) for instance_id in instance_ids]
+        # bumped after the commit, a decision made before it is stored under the old version
+        transaction.on_commit(
+            lambda: self.permission_decision_cache.bump_version(
+                module_type=module_type, instance_ids=instance_ids
+            )
+        )
+
+    def _upsert_instance_permissions(
+        self, instance_permissions: List[InstancePermission]
+    ) -> None:
+        self.instance_permission_services.get_instance_permission_repo().bulk_create(
+            instance_permissions,
+            batch_size=self.BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["user_id", "module_type", "instance_id"],
+            update_fields=["permissions", "modified_at", "is_active"],
+        )
+
+    def _write_direct_report_entries(
+        self,
+        user_ids: Union[QuerySet, List[str]],
+        module_type: str,
+        entries: List[Dict[str, Any]],
+    ) -> None:
+        # direct reports already holding all the same entries are left untouched
+        self.direct_report_services.get_direct_report_repo().filter(
+            user_id__in=user_ids
+        ).exclude(**{f"{module_type}__contains": entries}).update(
+            **{module_type: JSONBArrayUpsert(module_type, entries)}
+        )
+
+    def list_instance_permissions(
+        self, user_id: str, module_type: str
+    ) -> QuerySet[InstancePermission]:
+        """
+        Returns a QuerySet of the permissions a user holds for the given module type.
+
+        Parameters:
+            user_id (str): The ID of the user.
+            module_type (str): The module type, e.g. "documents".
+
+        Returns:
+            QuerySet[InstancePermission]: A QuerySet of instance permissions.
+        """
+        return self.instance_permission_services.get_instance_permission_repo().filter(
+            user_id=user_id, module_type=module_type, is_active=True
+        )
+
+    def grant_instance_permission(
+        self, user_id: str, module_type: str, instance: Dict[str, Any]
+    ) -> None:
+        """
+        Writes a permission entry for a single user, on their direct report and in the store.
+
+        Parameters:
+            user_id (str): The ID of the user receiving the permission.
+            module_type (str): The module type, e.g. "documents".
+            instance (Dict[str, Any]): The entry as stored on the direct report, with "id" and "permissions" keys.
+
+        Returns:
+            None
+        """
+        self.grant_instance_permissions(
+            user_id=user_id, module_type=module_type, instances=[instance]
+        )
+
+    def grant_instance_permissions(
+        self, user_id: str, module_type: str, instances: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Writes many permission entries for a single user, with one UPDATE of their direct report and
+        one upsert per BATCH_SIZE entries in the store.
+
+        Parameters:
+            user_id (str): The ID of the user receiving the permissions.
+            module_type (str): The module type, e.g. "documents".
+            instances (List[Dict[str, Any]]): The entries as stored on the direct report, with "id" and "permissions" keys.
+
+        Returns:
+            None
+        """
+        if not instances:
+            return
+        self._write_direct_report_entries(
+            user_ids=[str(user_id)],
+            module_type=module_type,
+            entries=[dict(instance, id=str(instance["id"])) for instance in instances],
+        )
+        factory = self.instance_permission_services.get_instance_permission_factory()
+        self._upsert_instance_permissions(
+            [
+                factory.build_entity_with_id(
+                    user_id=UserID(value=user_id),
+                    module_type=module_type,
+                    instance_id=instance["id"],
+                    permissions=instance["permissions"],
+                )
+                for instance in instances
+            ]
+        )
+        self._invalidate_permission_decisions(
+            module_type=module_type,
+            instance_ids=[instance["id"] for instance in instances],
+        )
+
+    def revoke_instance_permissions(self, module_type: str, instance_id: str) -> None:
+        """
+        Removes the permissions of every user on an instance, from the direct reports and the store.
+
+        Only the direct reports holding an entry of the instance are rewritten.
+
+        Parameters:
+            module_type (str): The module type, e.g. "documents".
+            instance_id (str): The ID of the instance.
+
+        Returns:
+            None
+        """
+        self.revoke_many_instance_permissions(
+            module_type=module_type, instance_ids=[instance_id]
+        )
+
+    def revoke_many_instance_permissions(
+        self, module_type: str, instance_ids: List[str]
+    ) -> None:
+        """
+        Removes the permissions of every user on many instances, with one UPDATE of the direct reports
+        holding an entry of any of them and one DELETE in the store.
+
+        Parameters:
+            module_type (str): The module type, e.g. "documents".
+            instance_ids (List[str]): The IDs of the instances.
+
+        Returns:
+            None
+        """
+        instance_ids = [str(instance_id) for instance_id in instance_ids]
+        if not instance_ids:
+            return
+        holds_an_entry = reduce(
+            or_,
+            (
+                Q(**{f"{module_type}__contains": [dict(id=instance_id)]})
+                for instance_id in instance_ids
+            ),
+        )
+        self.direct_report_services.get_direct_report_repo().filter(
+            holds_an_entry
+        ).update(**{module_type: JSONBArrayRemove(module_type, instance_ids)})
+        self.instance_permission_services.get_instance_permission_repo().filter(
+            module_type=module_type, instance_id__in=instance_ids
+        ).delete()
+        self._invalidate_permission_decisions(
+            module_type=module_type, instance_ids=instance_ids
+        )
+
+    def propagate_instance_permissions(
+        self,
+        user_ids: Union[QuerySet, Iterable[str]],
+        module_type: str,
+        instance_ids: List[str],
+        read_permission: bool,
+        write_permission: bool,
+    ) -> None:
+        """
+        Grants the same permission on many instances to many users, on their direct reports and in the store.
+
+        The permission entries are written into the direct reports of all the users with a single UPDATE, and into
+        the store with one upsert per BATCH_SIZE rows. When `user_ids` is a queryset (e.g. a `values_list` of
+        reportee ids) the direct reports are filtered with a subquery and the ids are streamed in batches, so the
+        recipients are never materialized as a whole; a user appearing twice in it is written once.
+
+        Parameters:
+            user_ids (Union[QuerySet, Iterable[str]]): The IDs of the users receiving the permission.
+            module_type (str): The module type, e.g. "documents".
+            instance_ids (List[str]): The IDs of the instances.
+            read_permission (bool): Whether the users can read the instances.
+            write_permission (bool): Whether the users can write the instances.
+
+        Returns:
+            None
+        """
+        instance_ids = [str(instance_id) for instance_id in instance_ids]
+        if not instance_ids:
+            return
+        # a recipient listed twice would hit its own row twice in one upsert
+        if isinstance(user_ids, QuerySet):
+            user_ids = user_ids.order_by().distinct()
+        else:
+            user_ids = list(set(map(str, user_ids)))
+        # the entries of the owners are built by the same helper, the clients read a single format
+        entries = [
+            dict(
+                generate_instance_permissions(
+                    instance_id=instance_id,
+                    read_permission=read_permission,
+                    write_permission=write_permission,
+                ),
+                id=instance_id,
+            )
+            for instance_id in instance_ids
+        ]
+        self._write_direct_report_entries(
+            user_ids=user_ids, module_type=module_type, entries=entries
+        )
+
+        factory = self.instance_permission_services.get_instance_permission_factory()
+        recipients = (
+            user_ids.iterator(chunk_size=self.BATCH_SIZE)
+            if isinstance(user_ids, QuerySet)
+            else iter(user_ids)
+        )
+        # each batch of recipients gets a row per instance, so a batch holds about BATCH_SIZE rows
+        recipients_per_batch = max(1, self.BATCH_SIZE // len(instance_ids))
+        while True:
+            batch = list(islice(recipients, recipients_per_batch))
+            if not batch:
+                break
+            self._upsert_instance_permissions(
+                [
+                    factory.build_entity_with_id(
+                        user_id=UserID(value=user_id),
+                        module_type=module_type,
+                        instance_id=entry["id"],
+                        permissions=entry["permissions"],
+                    )
+                    for user_id in batch
+                    for entry in entries
+                ]
+            )
+        self._invalidate_permission_decisions(
+            module_type=module_type, instance_ids=instance_ids
+        )
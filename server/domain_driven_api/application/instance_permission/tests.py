@@ -0,0 +1,174 @@
+import logging
+import uuid
+from django.test import TestCase
+from domain_driven_api.domain.instance_permission.models import InstancePermission
+from domain_driven_api.domain.direct_report.services import DirectReportServices
+from domain_driven_api.domain.user.models import UserBasePermissions, UserPersonalData
+from domain_driven_api.domain.user.services import UserServices
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from utils.global_methods.global_value_objects import UserID
+from utils.global_methods.instance_permissions_generator import (
+    generate_instance_permissions,
+)
+from .services import InstancePermissionAppServices
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+
+class InstancePermissionAppServicesTests(TestCase):
+    """
+    Test case class for testing the functionality of the InstancePermissionAppServices class.
+
+    Methods:
+    - test_propagate_instance_permissions: Tests that a propagation repeated with another permission updates the entries in place.
+    - test_propagated_entry_matches_the_owner_entry: Tests that a propagated entry has the format of an owner entry.
+    - test_propagate_instance_permissions_to_a_queryset_with_duplicates: Tests that a recipient listed twice is written once.
+    - test_revoke_instance_permissions_removes_a_single_entry: Tests that a revocation keeps the other entries of the direct reports.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = []
+        cls.direct_reports = []
+        for index in range(2):
+            user = (
+                UserServices()
+                .get_user_factory()
+                .build_entity_with_id(
+                    password="Test@1234",
+                    personal_data=UserPersonalData(
+                        username=f"test_user0{index}@ymail.com",
+                        first_name=f"TestUser0{index}",
+                        last_name=f"Tester0{index}",
+                        email=f"test_user0{index}@ymail.com",
+                    ),
+                    base_permissions=UserBasePermissions(
+                        is_staff=False, is_active=False
+                    ),
+                )
+            )
+            user.save()
+            direct_report = (
+                DirectReportServices()
+                .get_direct_report_factory()
+                .build_entity_with_id(user_id=UserID(value=user.id))
+            )
+            direct_report.save()
+            cls.users.append(user)
+            cls.direct_reports.append(direct_report)
+
+    def setUp(self):
+        self.instance_permission_app_services = InstancePermissionAppServices(log=log)
+        self.instance_permission_repo = (
+            self.instance_permission_app_services.instance_permission_services.get_instance_permission_repo()
+        )
+        self.user_ids = [str(user.id) for user in self.users]
+
+    def get_direct_report_entries(self, direct_report, instance_id):
+        direct_report.refresh_from_db()
+        return [entry for entry in direct_report.documents if entry["id"] == instance_id]
+
+    def test_propagate_instance_permissions(self):
+        document_id = str(uuid.uuid4())
+
+        for write_permission in (False, True, True):
+            self.instance_permission_app_services.propagate_instance_permissions(
+                user_ids=self.user_ids,
+                module_type="documents",
+                instance_ids=[document_id],
+                read_permission=True,
+                write_permission=write_permission,
+            )
+
+        for direct_report in self.direct_reports:
+            entries = self.get_direct_report_entries(direct_report, document_id)
+            self.assertEqual(len(entries), 1)
+            self.assertTrue(entries[0]["permissions"][InstancePermission.WRITE])
+        self.assertEqual(
+            self.instance_permission_repo.filter(
+                instance_id=document_id, permissions__write=True
+            ).count(),
+            2,
+        )
+
+    def test_propagated_entry_matches_the_owner_entry(self):
+        document_id = str(uuid.uuid4())
+        owner_direct_report, senior_direct_report = self.direct_reports
+        self.instance_permission_app_services.grant_instance_permission(
+            user_id=self.user_ids[0],
+            module_type="documents",
+            instance=generate_instance_permissions(instance_id=document_id),
+        )
+        self.instance_permission_app_services.propagate_instance_permissions(
+            user_ids=[self.user_ids[1]],
+            module_type="documents",
+            instance_ids=[document_id],
+            read_permission=True,
+            write_permission=True,
+        )
+
+        (owner_entry,) = self.get_direct_report_entries(owner_direct_report, document_id)
+        (senior_entry,) = self.get_direct_report_entries(senior_direct_report, document_id)
+        self.assertEqual(senior_entry, owner_entry)
+        self.assertListEqual(
+            [
+                instance_permission.permissions
+                for instance_permission in self.instance_permission_repo.filter(
+                    instance_id=document_id
+                )
+            ],
+            [owner_entry["permissions"]] * 2,
+        )
+
+    def test_propagate_instance_permissions_to_a_queryset_with_duplicates(self):
+        shared_document_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        self.instance_permission_app_services.propagate_instance_permissions(
+            user_ids=self.user_ids,
+            module_type="documents",
+            instance_ids=shared_document_ids,
+            read_permission=True,
+            write_permission=False,
+        )
+        document_id = str(uuid.uuid4())
+
+        # every user holds a row per shared document, so each id is listed twice
+        self.instance_permission_app_services.propagate_instance_permissions(
+            user_ids=self.instance_permission_repo.filter(
+                instance_id__in=shared_document_ids
+            ).values_list("user_id", flat=True),
+            module_type="documents",
+            instance_ids=[document_id],
+            read_permission=True,
+            write_permission=False,
+        )
+
+        self.assertEqual(
+            self.instance_permission_repo.filter(instance_id=document_id).count(), 2
+        )
+        for direct_report in self.direct_reports:
+            self.assertEqual(
+                len(self.get_direct_report_entries(direct_report, document_id)), 1
+            )
+
+    def test_revoke_instance_permissions_removes_a_single_entry(self):
+        kept_document_id, revoked_document_id = str(uuid.uuid4()), str(uuid.uuid4())
+        for document_id in (kept_document_id, revoked_document_id):
+            self.instance_permission_app_services.grant_instance_permission(
+                user_id=self.user_ids[0],
+                module_type="documents",
+                instance=dict(
+                    id=document_id,
+                    permissions=InstancePermission.build_permissions(
+                        read_permission=True, write_permission=True
+                    ),
+                ),
+            )
+
+        self.instance_permission_app_services.revoke_instance_permissions(
+            module_type="documents", instance_id=revoked_document_id
+        )
+
+        self.direct_reports[0].refresh_from_db()
+        document_ids = [entry["id"] for entry in self.direct_reports[0].documents]
+        self.assertIn(kept_document_id, document_ids)
+        self.assertNotIn(revoked_document_id, document_ids)
@@ -0,0 +1,259 @@
+from collections import Counter
+from typing import Iterable, List, Optional
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.db.models.query import QuerySet
+
+from domain_driven_api.domain.stored_object.models import (
+    StoredObject,
+    StoredObjectDeletion,
+)
+from domain_driven_api.domain.stored_object.services import StoredObjectServices
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from domain_driven_api.infrastructure.storages.services import (
+    delete_storage_objects,
+    get_content_address,
+    get_content_hash,
+    get_storage_name_from_url,
+)
+from domain_driven_api.infrastructure.storages.upload_handlers import (
+    delete_expired_uploads,
+)
+from .tasks import delete_pending_stored_objects
+
+
+class StoredObjectAppServices:
+    """
+    Application services for the objects of the media storage.
+
+    The objects are never deleted from the storage during a request: the deletions are recorded in the
+    transaction removing the files (an outbox), and the `delete_pending_stored_objects` task deletes them in
+    batches once the transaction is committed.
+
+    The uploaded files are stored once per content: `reference_content` gives a file the content address of a
+    stored object and takes a reference on it, the object is deleted when its last reference is released.
+
+    Methods:
+        reference_content(file_obj): Takes a reference on the stored object of an uploaded file's content.
+        release_references(storage_names): Releases a reference on a content addressed object per occurrence of its name.
+        schedule_deletion(storage_names): Records objects to delete once the current transaction is committed.
+        schedule_file_deletion(file_queryset, urls): Deletes file rows and releases or records the deletion of their objects.
+        delete_pending_objects(): Deletes the recorded and the unreferenced objects from the storage, in batches.
+        delete_expired_uploads(): Deletes the uploads never moved to their final name.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, log: AttributeLogger) -> None:
+        self.log = log
+        self.stored_object_services = StoredObjectServices()
+
+    def reference_content(self, file_obj) -> Optional[StoredObject]:
+        """
+        Takes a reference on the stored object holding the content of an uploaded file, in the current transaction.
+
+        The file is given the `content_address` it has to be saved under, and `is_stored` when the object is
+        already in the storage so it is not uploaded again. The reference is taken before the file is saved:
+        the row is locked until the commit, so an unreferenced object cannot be collected in between.
+
+        Parameters:
+            file_obj (UploadedFile): The uploaded file.
+
+        Returns:
+            Optional[StoredObject]: The stored object, or None for a file saved under its own name: without a
+            bucket, or uploaded straight to it so its content hash is not known.
+        """
+        if not settings.ENABLE_AWS_S3_BUCKET:
+            return None
+        content_hash = get_content_hash(file_obj)
+        if content_hash is None:
+            return None
+        stored_object_repo = self.stored_object_services.get_stored_object_repo()
+        stored_object = (
+            stored_object_repo.select_for_update()
+            .filter(content_hash=content_hash)
+            .first()
+        )
+        is_stored = stored_object is not None
+        if not is_stored:
+            stored_object = (
+                self.stored_object_services.get_stored_object_factory().build_entity_with_id(
+                    content_hash=content_hash,
+                    storage_name=get_content_address(content_hash, file_obj.name),
+                    size=file_obj.size,
+                )
+            )
+            try:
+                with transaction.atomic():
+                    stored_object.save()
+            except IntegrityError:
+                # the same content is uploaded concurrently, wait for it and reuse it
+                stored_object = stored_object_repo.select_for_update().get(
+                    content_hash=content_hash
+                )
+                is_stored = True
+        stored_object_repo.filter(id=stored_object.id).update(
+            reference_count=F("reference_count") + 1
+        )
+        file_obj.content_address = stored_object.storage_name
+        file_obj.is_stored = is_stored
+        return stored_object
+
+    def release_references(self, storage_names: Iterable[str]) -> List[str]:
+        """
+        Releases references on content addressed objects, they are collected once unreferenced.
+
+        A name is given once per reference released, e.g. twice for two documents deleted with the same content.
+
+        Parameters:
+            storage_names (Iterable[str]): The names of the objects in the media storage.
+
+        Returns:
+            List[str]: The names that are not content addressed objects, to delete directly.
+        """
+        storage_names = [name for name in storage_names if name]
+        stored_object_repo = self.stored_object_services.get_stored_object_repo()
+        referenced_names = set(
+            stored_object_repo.filter(storage_name__in=storage_names).values_list(
+                "storage_name", flat=True
+            )
+        )
+        released_counts = Counter(
+            name for name in storage_names if name in referenced_names
+        )
+        for name, released_count in released_counts.items():
+            stored_object_repo.filter(storage_name=name).update(
+                reference_count=Greatest(
+                    F("reference_count") - released_count, Value(0)
+                )
+            )
+        if referenced_names:
+            # robust: the committed request does not fail on a broker outage, the beat schedule runs the collection
+            transaction.on_commit(delete_pending_stored_objects.delay, robust=True)
+        return [name for name in storage_names if name not in referenced_names]
+
+    def schedule_deletion(self, storage_names: Iterable[str]) -> None:
+        """
+        Records objects of the media storage to delete once the current transaction is committed.
+
+        Parameters:
+            storage_names (Iterable[str]): The names of the objects in the media storage.
+        """
+        stored_object_deletion_factory = (
+            self.stored_object_services.get_stored_object_deletion_factory()
+        )
+        stored_object_deletions = [
+            stored_object_deletion_factory.build_entity_with_id(storage_name=name)
+            for name in set(storage_names)
+            if name
+        ]
+        if not stored_object_deletions:
+            return
+        self.stored_object_services.get_stored_object_deletion_repo().bulk_create(
+            stored_object_deletions, batch_size=self.BATCH_SIZE
+        )
+        transaction.on_commit(delete_pending_stored_objects.delay, robust=True)
+
+    def schedule_file_deletion(
+        self, file_queryset: QuerySet, urls: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Deletes file rows, releasing their content addressed objects and recording the deletion of the others.
+
+        Parameters:
+            file_queryset (QuerySet): The files to delete.
+            urls (Iterable[str], optional): The urls whose references are released, one per reference, e.g.
+                the links of the deleted documents. Defaults to the urls of the file rows.
+        """
+        if urls is None:
+            urls = file_queryset.values_list("url", flat=True)
+        storage_names = [get_storage_name_from_url(url) for url in urls]
+        file_queryset.delete()
+        self.schedule_deletion(self.release_references(storage_names))
+
+    def delete_pending_objects(self) -> int:
+        """
+        Deletes the recorded and the unreferenced objects from the media storage, one batch per storage call.
+
+        Returns:
+            int: The number of objects deleted.
+        """
+        return (
+            self._delete_recorded_objects() + self._delete_unreferenced_objects()
+        )
+
+    def delete_expired_uploads(self) -> int:
+        """
+        Deletes the uploaded objects never moved to their final name, after `settings.DOCUMENT_UPLOAD_MAX_AGE`.
+
+        Returns:
+            int: The number of objects deleted.
+        """
+        if not settings.ENABLE_AWS_S3_BUCKET:
+            return 0
+        return delete_expired_uploads(max_age=settings.DOCUMENT_UPLOAD_MAX_AGE)
+
+    def _delete_unreferenced_objects(self) -> int:
+        # the rows stay locked while the storage is called, so a new upload of the same content waits for the
+        # collection and stores the object again instead of reusing one that is being deleted
+        stored_object_repo = self.stored_object_services.get_stored_object_repo()
+        deleted_count = 0
+        while True:
+            with transaction.atomic():
+                unreferenced = dict(
+                    stored_object_repo.select_for_update(skip_locked=True)
+                    .filter(reference_count=0)
+                    .order_by("modified_at")
+                    .values_list("id", "storage_name")[: self.BATCH_SIZE]
+                )
+                if not unreferenced:
+                    return deleted_count
+                failed_names = set(delete_storage_objects(list(unreferenced.values())))
+                stored_object_repo.filter(id__in=unreferenced.keys()).exclude(
+                    storage_name__in=failed_names
+                ).delete()
+            deleted_count += len(unreferenced) - len(failed_names)
+            if failed_names:
+                self.log.error(
+                    f"could not delete {len(failed_names)} objects from the storage"
+                )
+                return deleted_count
+
+    def _delete_recorded_objects(self) -> int:
+        # no row is locked while the storage is called: a batch is read, deleted from the storage, then its rows
+        # are removed, or their attempts counted for the objects the storage could not delete
+        stored_object_deletion_repo = (
+            self.stored_object_services.get_stored_object_deletion_repo()
+        )
+        deleted_count = 0
+        while True:
+            pending = dict(
+                stored_object_deletion_repo.filter(
+                    attempts__lt=StoredObjectDeletion.MAX_ATTEMPTS
+                )
+                .order_by("attempts", "created_at")
+                .values_list("id", "storage_name")[: self.BATCH_SIZE]
+            )
+            if not pending:
+                return deleted_count
+            failed_names = set(delete_storage_objects(list(set(pending.values()))))
+            failed_ids = [
+                deletion_id
+                for deletion_id, name in pending.items()
+                if name in failed_names
+            ]
+            stored_object_deletion_repo.filter(id__in=pending.keys()).exclude(
+                id__in=failed_ids
+            ).delete()
+            if failed_ids:
+                stored_object_deletion_repo.filter(id__in=failed_ids).update(
+                    attempts=F("attempts") + 1
+                )
+                self.log.error(
+                    f"could not delete {len(failed_ids)} objects from the storage"
+                )
+            deleted_count += len(pending) - len(failed_ids)
+            if len(pending) < self.BATCH_SIZE:
+                return deleted_count
@@ -0,0 +1,46 @@
+import logging
+from celery import shared_task
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+MAX_RETRIES = 5
+
+
+@shared_task(bind=True, max_retries=MAX_RETRIES, acks_late=True)
+def delete_pending_stored_objects(self):
+    """
+    Deletes the objects of the media storage recorded for deletion, in batches.
+
+    Queued after the commit of every transaction recording deletions, and run periodically to pick up the
+    deletions whose task was lost. A storage outage is retried with a backoff, the recorded deletions stay
+    until a later run succeeds.
+
+    Returns:
+        int: The number of objects deleted.
+    """
+    # imported here, the app services queue this task
+    from .services import StoredObjectAppServices
+
+    try:
+        return StoredObjectAppServices(log=log).delete_pending_objects()
+    except Exception as e:
+        if self.request.retries >= MAX_RETRIES:
+            raise e
+        raise self.retry(exc=e, countdown=2**self.request.retries)
+
+
+@shared_task(acks_late=True)
+def delete_expired_uploads():
+    """
+    Deletes the uploaded objects abandoned by failed requests and the presigned uploads never finalized.
+
+    Run periodically; a run failing on a storage outage is picked up by the next one.
+
+    Returns:
+        int: The number of objects deleted.
+    """
+    # imported here, the app services queue the tasks of this module
+    from .services import StoredObjectAppServices
+
+    return StoredObjectAppServices(log=log).delete_expired_uploads()
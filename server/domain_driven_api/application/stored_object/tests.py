@@ -0,0 +1,108 @@
+import logging
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from domain_driven_api.domain.stored_object.models import (
+    StoredObject,
+    StoredObjectDeletion,
+)
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from .services import StoredObjectAppServices
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+
+class StoredObjectAppServicesTests(TestCase):
+    def setUp(self):
+        self.stored_object_app_services = StoredObjectAppServices(log=log)
+
+    @mock.patch(
+        "domain_driven_api.application.stored_object.services.delete_pending_stored_objects"
+    )
+    def test_schedule_deletion_queues_the_task_after_the_commit(self, task):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.stored_object_app_services.schedule_deletion(
+                ["documents/a.pdf", "documents/a.pdf", None, "documents/b.pdf"]
+            )
+            task.delay.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+        task.delay.assert_called_once()
+        self.assertEqual(
+            set(StoredObjectDeletion.objects.values_list("storage_name", flat=True)),
+            {"documents/a.pdf", "documents/b.pdf"},
+        )
+
+    @mock.patch(
+        "domain_driven_api.application.stored_object.services.delete_storage_objects"
+    )
+    def test_delete_pending_objects_keeps_the_failed_deletions(
+        self, delete_storage_objects
+    ):
+        delete_storage_objects.return_value = ["documents/b.pdf"]
+        with self.captureOnCommitCallbacks():
+            self.stored_object_app_services.schedule_deletion(
+                ["documents/a.pdf", "documents/b.pdf"]
+            )
+
+        deleted_count = self.stored_object_app_services.delete_pending_objects()
+
+        self.assertEqual(deleted_count, 1)
+        delete_storage_objects.assert_called_once()
+        stored_object_deletion = StoredObjectDeletion.objects.get()
+        self.assertEqual(stored_object_deletion.storage_name, "documents/b.pdf")
+        self.assertEqual(stored_object_deletion.attempts, 1)
+
+    @override_settings(ENABLE_AWS_S3_BUCKET=True)
+    def test_identical_uploads_reference_the_same_object(self):
+        first_file = SimpleUploadedFile("report.pdf", b"%PDF-1.7 content")
+        second_file = SimpleUploadedFile("copy.PDF", b"%PDF-1.7 content")
+
+        first_object = self.stored_object_app_services.reference_content(first_file)
+        second_object = self.stored_object_app_services.reference_content(second_file)
+
+        self.assertEqual(first_object.id, second_object.id)
+        self.assertFalse(first_file.is_stored)
+        self.assertTrue(second_file.is_stored)
+        self.assertEqual(first_file.content_address, second_file.content_address)
+        self.assertTrue(first_file.content_address.endswith(".pdf"))
+        self.assertEqual(StoredObject.objects.get().reference_count, 2)
+
+    @override_settings(ENABLE_AWS_S3_BUCKET=True)
+    @mock.patch(
+        "domain_driven_api.application.stored_object.services.delete_storage_objects"
+    )
+    def test_object_is_deleted_with_its_last_reference(self, delete_storage_objects):
+        delete_storage_objects.return_value = []
+        for name in ("report.pdf", "copy.pdf"):
+            stored_object = self.stored_object_app_services.reference_content(
+                SimpleUploadedFile(name, b"%PDF-1.7 content")
+            )
+
+        with self.captureOnCommitCallbacks():
+            external_names = self.stored_object_app_services.release_references(
+                [stored_object.storage_name, "documents/legacy.pdf"]
+            )
+        self.assertEqual(external_names, ["documents/legacy.pdf"])
+        self.assertEqual(self.stored_object_app_services.delete_pending_objects(), 0)
+        delete_storage_objects.assert_not_called()
+
+        with self.captureOnCommitCallbacks():
+            self.stored_object_app_services.release_references(
+                [stored_object.storage_name]
+            )
+        self.assertEqual(self.stored_object_app_services.delete_pending_objects(), 1)
+        delete_storage_objects.assert_called_once_with([stored_object.storage_name])
+        self.assertFalse(StoredObject.objects.exists())
+
+    @override_settings(ENABLE_AWS_S3_BUCKET=True)
+    def test_a_reference_is_released_per_occurrence_of_a_name(self):
+        for name in ("report.pdf", "copy.pdf", "other.pdf"):
+            stored_object = self.stored_object_app_services.reference_content(
+                SimpleUploadedFile(name, b"%PDF-1.7 content")
+            )
+
+        with self.captureOnCommitCallbacks():
+            self.stored_object_app_services.release_references(
+                [stored_object.storage_name, stored_object.storage_name]
+            )
+        self.assertEqual(StoredObject.objects.get().reference_count, 1)
@@ -18,6 +18,8 @@ app = Celery(
     backend="redis://",
     include=[
         "domain_driven_api.application.recurring_activities.tasks",
+        "domain_driven_api.application.document.tasks",
+        "domain_driven_api.application.stored_object.tasks",
     ],
     task_acks_late=True,
     task_acks_on_failure_or_timeout=False,
@@ -35,7 +37,19 @@ app.conf.beat_schedule = {
             hour="*",
             day_of_week="*",
         ),
-    }
+    },
+    "requeue-stale-document-permission-propagations": {
+        "task": "domain_driven_api.application.document.tasks.requeue_stale_document_permission_propagations",
+        "schedule": crontab(minute="*/15"),
+    },
+    "delete-pending-stored-objects": {
+        "task": "domain_driven_api.application.stored_object.tasks.delete_pending_stored_objects",
+        "schedule": crontab(minute="*/15"),
+    },
+    "delete-expired-uploads": {
+        "task": "domain_driven_api.application.stored_object.tasks.delete_expired_uploads",
+        "schedule": crontab(minute=30),
+    },
 }
 
 if __name__ == "__main__":
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class DocumentConfig(AppConfig):
+    name = "domain_driven_api.domain.document"
+    label = "document"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,35 @@
+import logging
+from django.core.management.base import BaseCommand
+from domain_driven_api.application.document.services import DocumentAppServices
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+
+class Command(BaseCommand):
+    """
+    Fills the company of the documents created before it was stored on them, from the role of their owner.
+
+    The documents are updated in batches of `--batch-size`, each batch in its own short statement, so the
+    command can run on a live table and be stopped and resumed at any time.
+
+    Usage:
+        python manage.py backfill_document_company_ids --batch-size 1000
+    """
+
+    help = "Fills Document.company_id from the role of the document owner, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        document_app_services = DocumentAppServices(log=log)
+        total_count = 0
+        for updated_count in document_app_services.backfill_document_company_ids(
+            batch_size=options["batch_size"]
+        ):
+            total_count += updated_count
+            self.stdout.write(f"{total_count} documents updated")
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled the company of {total_count} documents.")
+        )
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.7 on 2026-10-18 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_sort_keys(apps, schema_editor):
+    Document = apps.get_model("document", "Document")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    Document.objects.update(
+        priority_rank=models.Case(
+            models.When(priority="Low", then=models.Value(0)),
+            models.When(priority="Medium", then=models.Value(1)),
+            models.When(priority="High", then=models.Value(2)),
+            default=models.Value(3),
+        ),
+        status_rank=models.Case(
+            models.When(status="Private", then=models.Value(0)),
+            models.When(status="Shared", then=models.Value(1)),
+            default=models.Value(2),
+        ),
+        owner_name=models.Subquery(
+            User.objects.filter(id=models.OuterRef("owner")).values("first_name")[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('document', '0003_document_file_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='owner_name',
+            field=models.CharField(blank=True, max_length=150, null=True),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='priority_rank',
+            field=models.PositiveSmallIntegerField(default=3, editable=False),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='status_rank',
+            field=models.PositiveSmallIntegerField(default=2, editable=False),
+        ),
+        migrations.RunPython(populate_sort_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['priority_rank', 'created_at', 'id'], name='document_priority_rank_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['status_rank', 'created_at', 'id'], name='document_status_rank_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['owner_name', 'created_at', 'id'], name='document_owner_name_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-18 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document', '0004_document_sort_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['owner', 'status'], name='document_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', '-id'], name='document_active_created_idx'),
+        ),
+    ]
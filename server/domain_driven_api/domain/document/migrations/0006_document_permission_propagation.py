@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document', '0005_document_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='permission_propagation_id',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='permission_propagation_status',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Completed', 'Completed'), ('Failed', 'Failed')], default='Completed', max_length=9),
+        ),
+    ]
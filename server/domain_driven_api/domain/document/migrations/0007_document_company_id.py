@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document', '0006_document_permission_propagation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='company_id',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['company_id', '-created_at', '-id'], name='document_company_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document', '0007_document_company_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='file_id',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document', '0008_document_file_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(condition=models.Q(('permission_propagation_status', 'Pending')), fields=['modified_at'], name='document_propagation_idx'),
+        ),
+    ]
@@ -4,6 +4,7 @@ import uuid
 from typing import Dict, Any
 from dataclasses import dataclass
 from django.db import models
+from domain_driven_api.domain.company.company_division.models import CompanyID
 from domain_driven_api.domain.file.models import File
 from utils.django.custom_models import (
     ActivityTracking,
@@ -48,10 +49,18 @@ class Document(ActivityTracking, DirectReportPermissionAnnotateMixin):
         link (CharField): Field for the document link.
         is_file_uploaded (BooleanField): Field indicating if a file is uploaded for the document.
         file_name (CharField): Field for the file name associated with the document.
+        file_id (UUIDField): The file row of the uploaded file, several documents may share its url.
+        priority_rank (PositiveSmallIntegerField): Stored sort key of the priority (Low < Medium < High), maintained on save.
+        status_rank (PositiveSmallIntegerField): Stored sort key of the status (Private < Shared), maintained on save.
+        owner_name (CharField): The owner's first name, denormalized to sort the documents by owner.
+        company_id (UUIDField): The owner's company, denormalized to scope the documents to a company.
+        permission_propagation_id (UUIDField): The id of the latest permission propagation, a queued propagation with another id is stale.
+        permission_propagation_status (CharField): Whether the permissions of the latest change reached every user.
 
     Methods:
-        get_file(): Retrieves the file associated with the document.
+        get_file(): Retrieves the file row of the document.
         update_entity(data: Dict[str, Any]): Updates the document entity with the provided data.
+        refresh_sort_keys(): Recomputes the priority and status ranks from the priority and status.
     """
 
     # Document priority
@@ -67,6 +76,23 @@ class Document(ActivityTracking, DirectReportPermissionAnnotateMixin):
 
     DOCUMENT_STATUS = [(PRIVATE, "Private"), (SHARED, "Shared")]
 
+    # Permission propagation status
+    PROPAGATION_PENDING = "Pending"
+    PROPAGATION_COMPLETED = "Completed"
+    PROPAGATION_FAILED = "Failed"
+
+    PERMISSION_PROPAGATION_STATUS = [
+        (PROPAGATION_PENDING, "Pending"),
+        (PROPAGATION_COMPLETED, "Completed"),
+        (PROPAGATION_FAILED, "Failed"),
+    ]
+
+    # Sort keys, the unknown values are ordered last
+    PRIORITY_RANKS = {LOW: 0, MEDIUM: 1, HIGH: 2}
+    STATUS_RANKS = {PRIVATE: 0, SHARED: 1}
+    UNKNOWN_PRIORITY_RANK = 3
+    UNKNOWN_STATUS_RANK = 2
+
     id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
     title = models.CharField(max_length=250, blank=False, null=False)
     priority = models.CharField(max_length=6, choices=DOCUMENT_PRIORITY, default=None)
@@ -75,9 +101,30 @@ class Document(ActivityTracking, DirectReportPermissionAnnotateMixin):
     link = models.CharField(null=False, blank=False)
     is_file_uploaded = models.BooleanField(null=False, blank=False)
     file_name = models.CharField(null=True, blank=True)
+    file_id = models.UUIDField(null=True, blank=True)
+    priority_rank = models.PositiveSmallIntegerField(
+        default=UNKNOWN_PRIORITY_RANK, editable=False
+    )
+    status_rank = models.PositiveSmallIntegerField(
+        default=UNKNOWN_STATUS_RANK, editable=False
+    )
+    owner_name = models.CharField(max_length=150, null=True, blank=True)
+    company_id = models.UUIDField(null=True, blank=True)
+    permission_propagation_id = models.UUIDField(null=True, blank=True)
+    permission_propagation_status = models.CharField(
+        max_length=9,
+        choices=PERMISSION_PROPAGATION_STATUS,
+        default=PROPAGATION_COMPLETED,
+    )
 
     def get_file(self):
-        return File.objects.filter(url=self.link, is_active=True)
+        # uploads of the same content share the url, each document deletes its own row only
+        if self.file_id:
+            return File.objects.filter(id=self.file_id, is_active=True)
+        if self.is_file_uploaded:
+            # uploaded before the file id was stored, when every upload had its own url
+            return File.objects.filter(url=self.link, is_active=True)
+        return File.objects.none()
 
     def update_entity(self, data: Dict[str, Any]):
         if data.get("title", None):
@@ -89,10 +136,60 @@ class Document(ActivityTracking, DirectReportPermissionAnnotateMixin):
         if data.get("link", None):
             self.link = data.get("link")
 
+    def refresh_sort_keys(self):
+        self.priority_rank = self.PRIORITY_RANKS.get(
+            self.priority, self.UNKNOWN_PRIORITY_RANK
+        )
+        self.status_rank = self.STATUS_RANKS.get(self.status, self.UNKNOWN_STATUS_RANK)
+
+    def save(self, *args, **kwargs):
+        self.refresh_sort_keys()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = set(update_fields) | {
+                "priority_rank",
+                "status_rank",
+            }
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = "Document"
         verbose_name_plural = "Documents"
         db_table = "document"
+        indexes = [
+            # list_all_documents, in the default list order
+            models.Index(
+                fields=["company_id", "-created_at", "-id"],
+                name="document_company_created_idx",
+            ),
+            # the responsible person filter and the private documents of an owner
+            models.Index(fields=["owner", "status"], name="document_owner_status_idx"),
+            # the default list order, over the active documents only
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="document_active_created_idx",
+            ),
+            # the sort orders of DocumentFilters.sort_by_filter, scanned forward or backward
+            models.Index(
+                fields=["priority_rank", "created_at", "id"],
+                name="document_priority_rank_idx",
+            ),
+            models.Index(
+                fields=["status_rank", "created_at", "id"],
+                name="document_status_rank_idx",
+            ),
+            models.Index(
+                fields=["owner_name", "created_at", "id"],
+                name="document_owner_name_idx",
+            ),
+            # the sweep of the lost permission propagations, over the few pending documents only
+            models.Index(
+                fields=["modified_at"],
+                condition=models.Q(permission_propagation_status="Pending"),
+                name="document_propagation_idx",
+            ),
+        ]
 
 
 class DocumentFactory:
@@ -100,10 +197,10 @@ class DocumentFactory:
     A factory class for creating instances of the Document class.
 
     Methods:
-        build_entity(id: DocumentID, title: str, priority: str, status: str, owner: UserID, link: str, is_file_uploaded: bool, file_name: str = None) -> Document:
+        build_entity(id: DocumentID, title: str, priority: str, status: str, owner: UserID, link: str, is_file_uploaded: bool, file_name: str = None, owner_name: str = None, company_id: CompanyID = None, file_id: uuid.UUID = None) -> Document:
             Creates and returns an instance of the Document class with the provided parameters.
 
-        build_entity_with_id(title: str, priority: str, status: str, owner: UserID, link: str, is_file_uploaded: bool, file_name: str = None) -> Document:
+        build_entity_with_id(title: str, priority: str, status: str, owner: UserID, link: str, is_file_uploaded: bool, file_name: str = None, owner_name: str = None, company_id: CompanyID = None, file_id: uuid.UUID = None) -> Document:
             Creates and returns an instance of the Document class with a generated DocumentID and the provided parameters.
     """
 
@@ -117,6 +214,9 @@ class DocumentFactory:
         link: str,
         is_file_uploaded: bool,
         file_name: str = None,
+        owner_name: str = None,
+        company_id: CompanyID = None,
+        file_id: uuid.UUID = None,
     ) -> Document:
         """
         Creates and returns an instance of the Document class with the provided parameters.
@@ -130,6 +230,9 @@ class DocumentFactory:
             link (str): The link of the document.
             is_file_uploaded (bool): Indicates if a file is uploaded for the document.
             file_name (str, optional): The name of the file associated with the document.
+            owner_name (str, optional): The first name of the owner, used to sort the documents by owner.
+            company_id (CompanyID, optional): The company of the owner, used to scope the documents to a company.
+            file_id (uuid.UUID, optional): The file row of the uploaded file.
 
         Returns:
             Document: An instance of the Document class.
@@ -144,6 +247,9 @@ class DocumentFactory:
             link=link,
             is_file_uploaded=is_file_uploaded,
             file_name=file_name,
+            owner_name=owner_name,
+            company_id=company_id.value if company_id else None,
+            file_id=file_id,
         )
 
     @classmethod
@@ -156,6 +262,9 @@ class DocumentFactory:
         link: str,
         is_file_uploaded: bool,
         file_name: str = None,
+        owner_name: str = None,
+        company_id: CompanyID = None,
+        file_id: uuid.UUID = None,
     ) -> Document:
         """
         This is a factory method used to build an instance of the Document class.
@@ -168,6 +277,9 @@ class DocumentFactory:
             link (str): The link of the document.
             is_file_uploaded (bool): Indicates if a file is uploaded for the document.
             file_name (str, optional): The name of the file associated with the document.
+            owner_name (str, optional): The first name of the owner, used to sort the documents by owner.
+            company_id (CompanyID, optional): The company of the owner, used to scope the documents to a company.
+            file_id (uuid.UUID, optional): The file row of the uploaded file.
 
         Returns:
             Document: An instance of the Document class.
@@ -183,4 +295,7 @@ class DocumentFactory:
             link=link,
             is_file_uploaded=is_file_uploaded,
             file_name=file_name,
+            owner_name=owner_name,
+            company_id=company_id,
+            file_id=file_id,
         )
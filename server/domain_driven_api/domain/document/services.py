@@ -1,7 +1,9 @@
+from django.db.models import Q
 from django.db.models.manager import BaseManager
+from django.db.models.query import QuerySet
 from utils.django.custom_models import DirectReportPermissionAnnotateMixin
 from .models import Document, DocumentFactory
-from typing import Type
+from typing import List, Optional, Type
 
 
 class DocumentServices:
@@ -18,6 +20,15 @@ class DocumentServices:
         get_document_by_id(id: str) -> Document:
             Retrieves a document by its ID.
 
+        get_company_documents(company_id: str, company_user_ids: Optional[QuerySet]) -> QuerySet[Document]:
+            Returns the documents of a company, including the ones created before the company was stored.
+
+        get_document_for_mutation(id: str, company_id: str, company_user_ids: Optional[QuerySet]) -> Optional[Document]:
+            Retrieves and locks a document of a company.
+
+        get_documents_for_mutation(ids: List[str], company_id: str, company_user_ids: Optional[QuerySet]) -> QuerySet[Document]:
+            Retrieves and locks many documents of a company at once, see get_document_for_mutation.
+
     """
 
     @staticmethod
@@ -47,3 +58,74 @@ class DocumentServices:
 
     def get_document_by_id(self, id: str) -> Document:
         return Document.objects.get(id=id)
+
+    def get_company_documents(
+        self, company_id: str, company_user_ids: Optional[QuerySet] = None
+    ) -> QuerySet[Document]:
+        """
+        Returns the documents of a company.
+
+        The documents created before their company was stored have none until the
+        `backfill_document_company_ids` command has run; they belong to the company when their owner does.
+
+        Parameters:
+            company_id (str): The ID of the company.
+            company_user_ids (Optional[QuerySet]): The IDs of the users of the company, for the documents without
+                a company. Defaults to None, where these documents are left out.
+
+        Returns:
+            QuerySet[Document]: The documents of the company.
+        """
+        company_scope = Q(company_id=company_id)
+        if company_user_ids is not None:
+            # served by the company index as well, the IS NULL branch is empty once the backfill is done
+            company_scope |= Q(company_id__isnull=True, owner__in=company_user_ids)
+        return Document.objects.filter(company_scope)
+
+    def get_document_for_mutation(
+        self, id: str, company_id: str, company_user_ids: Optional[QuerySet] = None
+    ) -> Optional[Document]:
+        """
+        Retrieves a document about to be updated or deleted, in a single query.
+
+        The document is looked up among the documents of the company and locked with SELECT ... FOR UPDATE until
+        the end of the transaction. The write access of the user is not checked here. Must be called inside a
+        transaction.
+
+        Parameters:
+            id (str): The ID of the document.
+            company_id (str): The ID of the company the document has to belong to.
+            company_user_ids (Optional[QuerySet]): The IDs of the users of the company, see `get_company_documents`.
+
+        Returns:
+            Optional[Document]: The locked document, or None if it does not exist or belongs to another company.
+        """
+        return self.get_documents_for_mutation(
+            ids=[id], company_id=company_id, company_user_ids=company_user_ids
+        ).first()
+
+    def get_documents_for_mutation(
+        self, ids: List[str], company_id: str, company_user_ids: Optional[QuerySet] = None
+    ) -> QuerySet[Document]:
+        """
+        Retrieves many documents about to be updated or deleted, in a single query.
+
+        Same as `get_document_for_mutation`; the rows are locked in primary key order, so concurrent
+        batches over overlapping documents wait for each other instead of deadlocking.
+
+        Parameters:
+            ids (List[str]): The IDs of the documents.
+            company_id (str): The ID of the company the documents have to belong to.
+            company_user_ids (Optional[QuerySet]): The IDs of the users of the company, see `get_company_documents`.
+
+        Returns:
+            QuerySet[Document]: The documents of the company among the given IDs, locked once evaluated.
+        """
+        return (
+            self.get_company_documents(
+                company_id=company_id, company_user_ids=company_user_ids
+            )
+            .select_for_update(of=("self",))
+            .filter(id__in=ids)
+            .order_by("id")
+        )
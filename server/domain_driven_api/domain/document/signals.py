@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from .models import Document
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_document_owner_name(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keeps the owner name stored on the documents in line with the first name of their owner.
+
+    Parameters:
+        sender: The user model.
+        instance: The saved user.
+        created (bool): Whether the user was just created, in which case they own no document yet.
+        update_fields (frozenset, optional): The fields passed to save(), the name is untouched when it is not in them.
+    """
+    if created or (update_fields is not None and "first_name" not in update_fields):
+        return
+    # update() skips auto_now, modified_at is set for the list validators like any change of a listed value
+    Document.objects.filter(owner=instance.id).exclude(
+        owner_name=instance.first_name
+    ).update(owner_name=instance.first_name, modified_at=timezone.now())
@@ -1,6 +1,8 @@
 import logging
+import unittest
 import uuid
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, tag
 from django.db.models.manager import Manager
 from .models import Document, DocumentFactory, DocumentID
 from .services import DocumentServices
@@ -22,7 +24,11 @@ from domain_driven_api.domain.user.models import UserBasePermissions, UserPerson
 from domain_driven_api.application.user.services import UserAppServices
 from domain_driven_api.domain.user.services import UserServices
 from domain_driven_api.application.roles.services import RolesAppServices
+from domain_driven_api.application.document.services import DocumentAppServices
+from domain_driven_api.domain.direct_report.services import DirectReportServices
+from domain_driven_api.domain.instance_permission.models import InstancePermission
 from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from utils.django.queryset_helpers import find_sequential_scans
 
 
 log = AttributeLogger(logging.getLogger(__name__))
@@ -103,6 +109,43 @@ class DocumentTests(TestCase):
     def test_document_instance(self):
         self.assertIsInstance(self.document, Document)
 
+    def test_sort_keys_are_maintained_on_save(self):
+        self.assertEqual(self.document.priority_rank, 2)
+        self.assertEqual(self.document.status_rank, 0)
+
+        self.document.update_entity(data=dict(priority="Low", status="Shared"))
+        self.document.save(update_fields=["priority", "status"])
+        self.document.refresh_from_db()
+        self.assertEqual(self.document.priority_rank, 0)
+        self.assertEqual(self.document.status_rank, 1)
+
+    def test_owner_name_follows_owner_rename(self):
+        modified_at = self.document.modified_at
+        self.user_obj_01.first_name = "Renamed"
+        self.user_obj_01.save()
+        self.document.refresh_from_db()
+        self.assertEqual(self.document.owner_name, "Renamed")
+        self.assertGreater(self.document.modified_at, modified_at)
+
+
+    def test_get_document_for_mutation(self):
+        document_services = DocumentServices()
+        self.document.company_id = self.company.id
+        self.document.save()
+
+        with self.assertNumQueries(1):
+            document = document_services.get_document_for_mutation(
+                id=self.document.id, company_id=self.company.id
+            )
+        self.assertEqual(document, self.document)
+
+        # a document of another company
+        self.assertIsNone(
+            document_services.get_document_for_mutation(
+                id=self.document.id, company_id=uuid.uuid4()
+            )
+        )
+
 
 class DocumentServicesTests(TestCase):
     def test_get_document_repo(self):
@@ -115,3 +158,146 @@ class DocumentServicesTests(TestCase):
     def test_get_document_factory(self):
         factory = DocumentServices().get_document_factory()
         self.assertEqual(DocumentFactory, factory)
+
+
+@tag("query_plan")
+@unittest.skipUnless(
+    connection.vendor == "postgresql", "query plans are checked on Postgres only"
+)
+class DocumentQueryPlanTests(TestCase):
+    """
+    Runs EXPLAIN on the querysets built by the document services over a seeded table and fails on sequential
+    scans of the large tables. Sequential scans are disabled for the session, so the planner only picks one
+    when no index can serve the query.
+    """
+
+    LARGE_TABLES = ["document", "instance_permission"]
+
+    @classmethod
+    def setUpTestData(cls):
+        # the report whose documents are listed, and a senior listing them
+        cls.user_obj, cls.viewer_obj = [
+            UserServices()
+            .get_user_factory()
+            .build_entity_with_id(
+                password="Test@1234",
+                personal_data=UserPersonalData(
+                    username=f"{name}@ymail.com",
+                    first_name=name,
+                    last_name="Tester",
+                    email=f"{name}@ymail.com",
+                ),
+                base_permissions=UserBasePermissions(is_staff=False, is_active=False),
+            )
+            for name in ("plan_user", "plan_viewer")
+        ]
+        for user_obj in (cls.user_obj, cls.viewer_obj):
+            user_obj.save()
+        cls.direct_report = (
+            DirectReportServices()
+            .get_direct_report_factory()
+            .build_entity_with_id(user_id=UserID(value=cls.user_obj.id))
+        )
+        cls.direct_report.save()
+        cls.company = CompanyFactory().build_entity_with_id(name="Company One Pvt. Ltd.")
+        cls.company.save()
+        role = (
+            RolesAppServices(log=log)
+            .role_services.get_role_factory()
+            .build_entity_with_id(name="CEO")
+        )
+        role.save()
+        UserRoleFactory().build_entity_with_id(
+            role_id=RoleID(value=role.id),
+            company_id=CompanyID(value=cls.company.id),
+            user_id=UserID(value=cls.user_obj.id),
+        ).save()
+
+        cls.user_id = cls.user_obj.id
+        cls.owner_ids = [cls.user_id] + [uuid.uuid4() for _ in range(49)]
+        cls.company_ids = [cls.company.id] + [uuid.uuid4() for _ in range(9)]
+        documents = [
+            DocumentFactory.build_entity_with_id(
+                title=f"Document {index}",
+                priority=[Document.LOW, Document.MEDIUM, Document.HIGH][index % 3],
+                status=[Document.PRIVATE, Document.SHARED][index % 2],
+                owner=UserID(value=cls.owner_ids[index % len(cls.owner_ids)]),
+                link="www.google.com",
+                is_file_uploaded=False,
+                company_id=CompanyID(value=cls.company_ids[index % len(cls.company_ids)]),
+            )
+            for index in range(5000)
+        ]
+        for document in documents:
+            document.refresh_sort_keys()
+        Document.objects.bulk_create(documents)
+        InstancePermission.objects.bulk_create(
+            [
+                InstancePermission(
+                    user_id=cls.user_id,
+                    module_type="documents",
+                    instance_id=document.id,
+                    permissions=InstancePermission.build_permissions(
+                        read_permission=True, write_permission=False
+                    ),
+                )
+                for document in documents[:500]
+            ]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE document")
+            cursor.execute("ANALYZE instance_permission")
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertNoSequentialScan(self, queryset):
+        self.assertListEqual(
+            find_sequential_scans(queryset, relations=self.LARGE_TABLES), []
+        )
+
+    def test_list_documents_query(self):
+        document_app_services = DocumentAppServices(log=log)
+        # listed to the report themself, and to a senior without the private documents of the report
+        for user_obj in (self.user_obj, self.viewer_obj):
+            self.assertNoSequentialScan(
+                document_app_services.list_documents(
+                    user=user_obj, direct_report_id=self.direct_report.id
+                )[:6]
+            )
+
+    def test_list_all_documents_query(self):
+        self.assertNoSequentialScan(
+            DocumentAppServices(log=log)
+            .list_all_documents(user=self.user_obj)
+            .order_by("-created_at", "-id")[:6]
+        )
+
+    def test_documents_for_mutation_query(self):
+        document_ids = list(
+            Document.objects.filter(company_id=self.company.id).values_list(
+                "id", flat=True
+            )[:20]
+        )
+        self.assertNoSequentialScan(
+            DocumentServices().get_documents_for_mutation(
+                ids=document_ids, company_id=self.company.id
+            )
+        )
+
+    def test_responsible_person_query(self):
+        self.assertNoSequentialScan(
+            Document.objects.filter(owner__in=self.owner_ids[:5])
+        )
+
+    def test_sorted_list_queries(self):
+        for ordering in (
+            ("-created_at", "-id"),
+            ("priority_rank", "created_at", "id"),
+            ("-status_rank", "-created_at", "-id"),
+            ("owner_name", "created_at", "id"),
+        ):
+            self.assertNoSequentialScan(
+                Document.objects.filter(is_active=True).order_by(*ordering)[:6]
+            )
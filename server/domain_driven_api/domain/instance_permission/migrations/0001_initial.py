@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-18 09:12
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstancePermission',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('user_id', models.UUIDField()),
+                ('module_type', models.CharField(max_length=50)),
+                ('instance_id', models.UUIDField()),
+                ('permissions', models.JSONField(default=dict)),
+            ],
+            options={
+                'verbose_name': 'Instance Permission',
+                'verbose_name_plural': 'Instance Permissions',
+                'db_table': 'instance_permission',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='instancepermission',
+            constraint=models.UniqueConstraint(fields=('user_id', 'module_type', 'instance_id'), name='instance_permission_user_instance_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='instancepermission',
+            index=models.Index(fields=['module_type', 'instance_id'], name='instance_permission_inst_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:40
+
+from django.db import migrations
+
+MODULE_TYPES = ["documents"]
+BATCH_SIZE = 1000
+
+
+def backfill_instance_permissions(apps, schema_editor):
+    # the direct reports belong to an app without migrations in this project, their current model is read
+    from domain_driven_api.domain.direct_report.models import DirectReport
+
+    InstancePermission = apps.get_model("instance_permission", "InstancePermission")
+    instance_permissions = []
+    for direct_report in (
+        DirectReport.objects.only("user_id", *MODULE_TYPES).iterator(chunk_size=BATCH_SIZE)
+    ):
+        for module_type in MODULE_TYPES:
+            for item in getattr(direct_report, module_type) or []:
+                instance_permissions.append(
+                    InstancePermission(
+                        user_id=direct_report.user_id,
+                        module_type=module_type,
+                        instance_id=item["id"],
+                        permissions=item["permissions"],
+                    )
+                )
+        if len(instance_permissions) >= BATCH_SIZE:
+            InstancePermission.objects.bulk_create(
+                instance_permissions, batch_size=BATCH_SIZE, ignore_conflicts=True
+            )
+            instance_permissions = []
+    InstancePermission.objects.bulk_create(
+        instance_permissions, batch_size=BATCH_SIZE, ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('instance_permission', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_instance_permissions, migrations.RunPython.noop),
+    ]
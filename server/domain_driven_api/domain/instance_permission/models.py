@@ -0,0 +1,159 @@
+"""This is a model module to store per-user instance permissions in to the database"""
+
+import uuid
+from typing import Dict, Any
+from dataclasses import dataclass
+from django.db import models
+from utils.django.custom_models import ActivityTracking
+from utils.global_methods.global_value_objects import UserID
+from utils.global_methods.instance_permissions_generator import (
+    generate_instance_permissions,
+)
+
+# the permissions of a read only entry of the direct reports, the format the clients read, e.g. {"r": True, "w": False}
+READ_ONLY_PERMISSIONS = generate_instance_permissions(
+    instance_id=uuid.UUID(int=0), read_permission=True, write_permission=False
+)["permissions"]
+
+
+@dataclass(frozen=True)
+class InstancePermissionID:
+    """
+    This is a value object that should be used to generate and pass the InstancePermissionID to the InstancePermissionFactory
+    """
+
+    value: uuid.UUID
+
+
+# ----------------------------------------------------------------------
+# Instance Permission Model
+# ----------------------------------------------------------------------
+
+
+class InstancePermission(ActivityTracking):
+    """
+    A class representing the permissions a user holds on a single module instance.
+
+    Every row mirrors one entry of the JSON lists kept on the user's direct report
+    (e.g. `DirectReport.documents`), so listings can join against an indexed table
+    instead of inlining every permission into the SQL statement.
+
+    Inherits from ActivityTracking.
+
+    Attributes:
+        READ (str): Key of the read permission inside the permissions dictionary, as in the direct report entries.
+        WRITE (str): Key of the write permission inside the permissions dictionary, as in the direct report entries.
+        id (UUIDField): Primary key field for the instance permission.
+        user_id (UUIDField): Field for the user holding the permission.
+        module_type (CharField): Field for the module type of the instance, e.g. "documents".
+        instance_id (UUIDField): Field for the id of the instance.
+        permissions (JSONField): Field for the permissions the user holds on the instance.
+
+    Methods:
+        build_permissions(read_permission: bool, write_permission: bool): Builds the permissions dictionary.
+    """
+
+    READ = next(key for key, value in READ_ONLY_PERMISSIONS.items() if value)
+    WRITE = next(key for key, value in READ_ONLY_PERMISSIONS.items() if not value)
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
+    user_id = models.UUIDField(blank=False, null=False)
+    module_type = models.CharField(max_length=50, blank=False, null=False)
+    instance_id = models.UUIDField(blank=False, null=False)
+    permissions = models.JSONField(default=dict)
+
+    @classmethod
+    def build_permissions(
+        cls, read_permission: bool, write_permission: bool
+    ) -> Dict[str, Any]:
+        return {cls.READ: read_permission, cls.WRITE: write_permission}
+
+    class Meta:
+        verbose_name = "Instance Permission"
+        verbose_name_plural = "Instance Permissions"
+        db_table = "instance_permission"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user_id", "module_type", "instance_id"],
+                name="instance_permission_user_instance_unique",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["module_type", "instance_id"],
+                name="instance_permission_inst_idx",
+            )
+        ]
+
+
+class InstancePermissionFactory:
+    """
+    A factory class for creating instances of the InstancePermission class.
+
+    Methods:
+        build_entity(id: InstancePermissionID, user_id: UserID, module_type: str, instance_id: uuid.UUID, permissions: Dict[str, Any]) -> InstancePermission:
+            Creates and returns an instance of the InstancePermission class with the provided parameters.
+
+        build_entity_with_id(user_id: UserID, module_type: str, instance_id: uuid.UUID, permissions: Dict[str, Any]) -> InstancePermission:
+            Creates and returns an instance of the InstancePermission class with a generated InstancePermissionID and the provided parameters.
+    """
+
+    @staticmethod
+    def build_entity(
+        id: InstancePermissionID,
+        user_id: UserID,
+        module_type: str,
+        instance_id: uuid.UUID,
+        permissions: Dict[str, Any],
+    ) -> InstancePermission:
+        """
+        Creates and returns an instance of the InstancePermission class with the provided parameters.
+
+        Parameters:
+            id (InstancePermissionID): The ID of the instance permission.
+            user_id (UserID): The user holding the permission.
+            module_type (str): The module type of the instance.
+            instance_id (uuid.UUID): The ID of the instance.
+            permissions (Dict[str, Any]): The permissions the user holds on the instance.
+
+        Returns:
+            InstancePermission: An instance of the InstancePermission class.
+
+        """
+        return InstancePermission(
+            id=id.value,
+            user_id=user_id.value,
+            module_type=module_type,
+            instance_id=instance_id,
+            permissions=permissions,
+        )
+
+    @classmethod
+    def build_entity_with_id(
+        cls,
+        user_id: UserID,
+        module_type: str,
+        instance_id: uuid.UUID,
+        permissions: Dict[str, Any],
+    ) -> InstancePermission:
+        """
+        This is a factory method used to build an instance of the InstancePermission class.
+
+        Parameters:
+            user_id (UserID): The user holding the permission.
+            module_type (str): The module type of the instance.
+            instance_id (uuid.UUID): The ID of the instance.
+            permissions (Dict[str, Any]): The permissions the user holds on the instance.
+
+        Returns:
+            InstancePermission: An instance of the InstancePermission class.
+
+        """
+        entity_id = InstancePermissionID(uuid.uuid4())
+        return cls.build_entity(
+            id=entity_id,
+            user_id=user_id,
+            module_type=module_type,
+            instance_id=instance_id,
+            permissions=permissions,
+        )
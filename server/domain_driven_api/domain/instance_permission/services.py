@@ -0,0 +1,38 @@
+from django.db.models.manager import BaseManager
+from .models import InstancePermission, InstancePermissionFactory
+from typing import Type
+
+
+class InstancePermissionServices:
+    """
+    A class that provides services related to instance permissions.
+
+    Methods:
+        get_instance_permission_factory() -> Type[InstancePermissionFactory]:
+            Returns the InstancePermissionFactory class.
+
+        get_instance_permission_repo() -> BaseManager[InstancePermission]:
+            Returns the manager for the InstancePermission model.
+
+    """
+
+    @staticmethod
+    def get_instance_permission_factory() -> Type[InstancePermissionFactory]:
+        """
+        Returns the InstancePermissionFactory class.
+
+        Returns:
+            Type[InstancePermissionFactory]: The InstancePermissionFactory class.
+
+        """
+        return InstancePermissionFactory
+
+    @staticmethod
+    def get_instance_permission_repo() -> BaseManager[InstancePermission]:
+        """
+        Returns the manager for the InstancePermission model.
+
+        Returns:
+            BaseManager[InstancePermission]: The manager for the InstancePermission model.
+        """
+        return InstancePermission.objects
@@ -0,0 +1,40 @@
+import uuid
+from django.test import TestCase
+from django.db.models.manager import Manager
+from .models import InstancePermission, InstancePermissionFactory, InstancePermissionID
+from .services import InstancePermissionServices
+from utils.global_methods.global_value_objects import UserID
+
+
+class InstancePermissionTests(TestCase):
+    def setUp(self):
+        self.instance_permission = InstancePermissionFactory().build_entity_with_id(
+            user_id=UserID(value=uuid.uuid4()),
+            module_type="documents",
+            instance_id=uuid.uuid4(),
+            permissions=InstancePermission.build_permissions(
+                read_permission=True, write_permission=False
+            ),
+        )
+        self.instance_permission.save()
+
+    def test_build_instance_permission_id(self):
+        instance_permission_id = InstancePermissionID(value=uuid.uuid4())
+        self.assertEqual(type(instance_permission_id), InstancePermissionID)
+
+    def test_instance_permission_instance(self):
+        self.assertIsInstance(self.instance_permission, InstancePermission)
+        self.assertEqual(
+            self.instance_permission.permissions,
+            {InstancePermission.READ: True, InstancePermission.WRITE: False},
+        )
+
+
+class InstancePermissionServicesTests(TestCase):
+    def test_get_instance_permission_repo(self):
+        repo = InstancePermissionServices().get_instance_permission_repo()
+        self.assertEqual(Manager, type(repo))
+
+    def test_get_instance_permission_factory(self):
+        factory = InstancePermissionServices().get_instance_permission_factory()
+        self.assertEqual(InstancePermissionFactory, factory)
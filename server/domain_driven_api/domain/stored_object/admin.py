@@ -0,0 +1,5 @@
+from django.contrib import admin
+from .models import StoredObject, StoredObjectDeletion
+
+admin.site.register(StoredObject)
+admin.site.register(StoredObjectDeletion)
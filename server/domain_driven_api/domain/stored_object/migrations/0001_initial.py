@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:05
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredObjectDeletion',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('storage_name', models.CharField(max_length=1024)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Stored Object Deletion',
+                'verbose_name_plural': 'Stored Object Deletions',
+                'db_table': 'stored_object_deletion',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='storedobjectdeletion',
+            index=models.Index(fields=['attempts', 'created_at'], name='stored_object_deletion_idx'),
+        ),
+    ]
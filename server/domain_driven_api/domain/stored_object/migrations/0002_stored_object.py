@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:20
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stored_object', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredObject',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('storage_name', models.CharField(max_length=1024, unique=True)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('reference_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Stored Object',
+                'verbose_name_plural': 'Stored Objects',
+                'db_table': 'stored_object',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='storedobject',
+            index=models.Index(condition=models.Q(('reference_count', 0)), fields=['modified_at'], name='stored_object_unreferenced_idx'),
+        ),
+    ]
@@ -0,0 +1,206 @@
+"""This is a model module to store the objects of the media storage in to the database"""
+
+import uuid
+from dataclasses import dataclass
+from django.db import models
+from utils.django.custom_models import ActivityTracking
+
+
+@dataclass(frozen=True)
+class StoredObjectID:
+    """
+    This is a value object that should be used to generate and pass the StoredObjectID to the StoredObjectFactory
+    """
+
+    value: uuid.UUID
+
+
+@dataclass(frozen=True)
+class StoredObjectDeletionID:
+    """
+    This is a value object that should be used to generate and pass the StoredObjectDeletionID to the StoredObjectDeletionFactory
+    """
+
+    value: uuid.UUID
+
+
+# ----------------------------------------------------------------------
+# Stored Object Model
+# ----------------------------------------------------------------------
+
+
+class StoredObject(ActivityTracking):
+    """
+    A class representing a content addressed object of the media storage, shared by the files with the same content.
+
+    The object is stored under a name derived from the sha256 of its content, so an identical upload reuses it
+    instead of storing a copy. Every file referencing it holds a reference, the object is deleted from the storage
+    by the `delete_pending_stored_objects` celery task once no file references it anymore.
+
+    Inherits from ActivityTracking.
+
+    Attributes:
+        id (UUIDField): Primary key field for the stored object.
+        content_hash (CharField): The hex sha256 of the content.
+        storage_name (CharField): The name of the object in the media storage.
+        size (PositiveBigIntegerField): The size of the content in bytes.
+        reference_count (PositiveIntegerField): The number of files referencing the object.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
+    content_hash = models.CharField(max_length=64, unique=True)
+    storage_name = models.CharField(max_length=1024, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    reference_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Stored Object"
+        verbose_name_plural = "Stored Objects"
+        db_table = "stored_object"
+        indexes = [
+            models.Index(
+                fields=["modified_at"],
+                condition=models.Q(reference_count=0),
+                name="stored_object_unreferenced_idx",
+            )
+        ]
+
+
+class StoredObjectFactory:
+    """
+    A factory class for creating instances of the StoredObject class.
+
+    Methods:
+        build_entity(id: StoredObjectID, content_hash: str, storage_name: str, size: int) -> StoredObject:
+            Creates and returns an instance of the StoredObject class with the provided parameters.
+
+        build_entity_with_id(content_hash: str, storage_name: str, size: int) -> StoredObject:
+            Creates and returns an instance of the StoredObject class with a generated StoredObjectID.
+    """
+
+    @staticmethod
+    def build_entity(
+        id: StoredObjectID, content_hash: str, storage_name: str, size: int
+    ) -> StoredObject:
+        """
+        Creates and returns an instance of the StoredObject class with the provided parameters.
+
+        Parameters:
+            id (StoredObjectID): The ID of the stored object.
+            content_hash (str): The hex sha256 of the content.
+            storage_name (str): The name of the object in the media storage.
+            size (int): The size of the content in bytes.
+
+        Returns:
+            StoredObject: An instance of the StoredObject class.
+
+        """
+        return StoredObject(
+            id=id.value, content_hash=content_hash, storage_name=storage_name, size=size
+        )
+
+    @classmethod
+    def build_entity_with_id(
+        cls, content_hash: str, storage_name: str, size: int
+    ) -> StoredObject:
+        """
+        This is a factory method used to build an instance of the StoredObject class.
+
+        Parameters:
+            content_hash (str): The hex sha256 of the content.
+            storage_name (str): The name of the object in the media storage.
+            size (int): The size of the content in bytes.
+
+        Returns:
+            StoredObject: An instance of the StoredObject class.
+
+        """
+        entity_id = StoredObjectID(uuid.uuid4())
+        return cls.build_entity(
+            id=entity_id, content_hash=content_hash, storage_name=storage_name, size=size
+        )
+
+
+# ----------------------------------------------------------------------
+# Stored Object Deletion Model
+# ----------------------------------------------------------------------
+
+
+class StoredObjectDeletion(ActivityTracking):
+    """
+    A class representing an object of the media storage waiting to be deleted.
+
+    The rows are written in the transaction removing the file that references the object, and deleted by the
+    `delete_pending_stored_objects` celery task once the object is gone from the storage, so the requests never
+    wait for the storage and a rolled back transaction leaves the object in place.
+
+    Inherits from ActivityTracking.
+
+    Attributes:
+        MAX_ATTEMPTS (int): The number of failed deletions after which the object is left to be looked at.
+        id (UUIDField): Primary key field for the deletion.
+        storage_name (CharField): The name of the object in the media storage.
+        attempts (PositiveSmallIntegerField): The number of failed deletions of the object.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
+    storage_name = models.CharField(max_length=1024, blank=False, null=False)
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Stored Object Deletion"
+        verbose_name_plural = "Stored Object Deletions"
+        db_table = "stored_object_deletion"
+        indexes = [
+            models.Index(
+                fields=["attempts", "created_at"],
+                name="stored_object_deletion_idx",
+            )
+        ]
+
+
+class StoredObjectDeletionFactory:
+    """
+    A factory class for creating instances of the StoredObjectDeletion class.
+
+    Methods:
+        build_entity(id: StoredObjectDeletionID, storage_name: str) -> StoredObjectDeletion:
+            Creates and returns an instance of the StoredObjectDeletion class with the provided parameters.
+
+        build_entity_with_id(storage_name: str) -> StoredObjectDeletion:
+            Creates and returns an instance of the StoredObjectDeletion class with a generated StoredObjectDeletionID.
+    """
+
+    @staticmethod
+    def build_entity(
+        id: StoredObjectDeletionID, storage_name: str
+    ) -> StoredObjectDeletion:
+        """
+        Creates and returns an instance of the StoredObjectDeletion class with the provided parameters.
+
+        Parameters:
+            id (StoredObjectDeletionID): The ID of the deletion.
+            storage_name (str): The name of the object in the media storage.
+
+        Returns:
+            StoredObjectDeletion: An instance of the StoredObjectDeletion class.
+
+        """
+        return StoredObjectDeletion(id=id.value, storage_name=storage_name)
+
+    @classmethod
+    def build_entity_with_id(cls, storage_name: str) -> StoredObjectDeletion:
+        """
+        This is a factory method used to build an instance of the StoredObjectDeletion class.
+
+        Parameters:
+            storage_name (str): The name of the object in the media storage.
+
+        Returns:
+            StoredObjectDeletion: An instance of the StoredObjectDeletion class.
+
+        """
+        entity_id = StoredObjectDeletionID(uuid.uuid4())
+        return cls.build_entity(id=entity_id, storage_name=storage_name)
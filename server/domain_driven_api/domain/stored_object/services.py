@@ -0,0 +1,70 @@
+from django.db.models.manager import BaseManager
+from .models import (
+    StoredObject,
+    StoredObjectDeletion,
+    StoredObjectDeletionFactory,
+    StoredObjectFactory,
+)
+from typing import Type
+
+
+class StoredObjectServices:
+    """
+    A class that provides services related to the objects of the media storage.
+
+    Methods:
+        get_stored_object_factory() -> Type[StoredObjectFactory]:
+            Returns the StoredObjectFactory class.
+
+        get_stored_object_repo() -> BaseManager[StoredObject]:
+            Returns the manager for the StoredObject model.
+
+        get_stored_object_deletion_factory() -> Type[StoredObjectDeletionFactory]:
+            Returns the StoredObjectDeletionFactory class.
+
+        get_stored_object_deletion_repo() -> BaseManager[StoredObjectDeletion]:
+            Returns the manager for the StoredObjectDeletion model.
+
+    """
+
+    @staticmethod
+    def get_stored_object_factory() -> Type[StoredObjectFactory]:
+        """
+        Returns the StoredObjectFactory class.
+
+        Returns:
+            Type[StoredObjectFactory]: The StoredObjectFactory class.
+
+        """
+        return StoredObjectFactory
+
+    @staticmethod
+    def get_stored_object_repo() -> BaseManager[StoredObject]:
+        """
+        Returns the manager for the StoredObject model.
+
+        Returns:
+            BaseManager[StoredObject]: The manager for the StoredObject model.
+        """
+        return StoredObject.objects
+
+    @staticmethod
+    def get_stored_object_deletion_factory() -> Type[StoredObjectDeletionFactory]:
+        """
+        Returns the StoredObjectDeletionFactory class.
+
+        Returns:
+            Type[StoredObjectDeletionFactory]: The StoredObjectDeletionFactory class.
+
+        """
+        return StoredObjectDeletionFactory
+
+    @staticmethod
+    def get_stored_object_deletion_repo() -> BaseManager[StoredObjectDeletion]:
+        """
+        Returns the manager for the StoredObjectDeletion model.
+
+        Returns:
+            BaseManager[StoredObjectDeletion]: The manager for the StoredObjectDeletion model.
+        """
+        return StoredObjectDeletion.objects
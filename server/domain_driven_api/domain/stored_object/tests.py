@@ -0,0 +1,57 @@
+import uuid
+from django.test import TestCase
+from django.db.models.manager import Manager
+from .models import (
+    StoredObject,
+    StoredObjectFactory,
+    StoredObjectDeletion,
+    StoredObjectDeletionFactory,
+    StoredObjectDeletionID,
+)
+from .services import StoredObjectServices
+
+
+class StoredObjectTests(TestCase):
+    def test_stored_object_instance(self):
+        stored_object = StoredObjectFactory().build_entity_with_id(
+            content_hash="a" * 64, storage_name=f"objects/aa/{'a' * 64}.pdf", size=10
+        )
+        stored_object.save()
+        self.assertIsInstance(stored_object, StoredObject)
+        self.assertEqual(stored_object.reference_count, 0)
+
+
+class StoredObjectDeletionTests(TestCase):
+    def setUp(self):
+        self.stored_object_deletion = (
+            StoredObjectDeletionFactory().build_entity_with_id(
+                storage_name="documents/report.pdf"
+            )
+        )
+        self.stored_object_deletion.save()
+
+    def test_build_stored_object_deletion_id(self):
+        stored_object_deletion_id = StoredObjectDeletionID(value=uuid.uuid4())
+        self.assertEqual(type(stored_object_deletion_id), StoredObjectDeletionID)
+
+    def test_stored_object_deletion_instance(self):
+        self.assertIsInstance(self.stored_object_deletion, StoredObjectDeletion)
+        self.assertEqual(self.stored_object_deletion.attempts, 0)
+
+
+class StoredObjectServicesTests(TestCase):
+    def test_get_stored_object_deletion_repo(self):
+        repo = StoredObjectServices().get_stored_object_deletion_repo()
+        self.assertEqual(Manager, type(repo))
+
+    def test_get_stored_object_repo(self):
+        repo = StoredObjectServices().get_stored_object_repo()
+        self.assertEqual(Manager, type(repo))
+
+    def test_get_stored_object_factory(self):
+        factory = StoredObjectServices().get_stored_object_factory()
+        self.assertEqual(StoredObjectFactory, factory)
+
+    def test_get_stored_object_deletion_factory(self):
+        factory = StoredObjectServices().get_stored_object_deletion_factory()
+        self.assertEqual(StoredObjectDeletionFactory, factory)
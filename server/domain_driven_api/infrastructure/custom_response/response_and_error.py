@@ -1,4 +1,4 @@
-import inspect
+import sys
 from typing import List, Any, Dict
 from typing import Union, Dict
 from rest_framework import status
@@ -17,6 +17,7 @@ class APIResponse:
         for_error: bool = False,
         general_error: bool = False,
         is_partially_processed: bool = False,
+        caller_function: str = None,
         **kwargs,
     ) -> "APIResponse":
         """
@@ -30,6 +31,7 @@ class APIResponse:
             for_error (bool): Indicates if the response is for an error event.
             general_error (bool): Indicates if the response is a general error.
             is_partially_processed (bool): Indicates if the response is partially processed.
+            caller_function (str): The view action name used to build the default success message. When omitted and no message is given, it is read from the calling frame.
             kwargs: Additional keyword arguments.
 
         Methods:
@@ -44,8 +46,12 @@ class APIResponse:
         Note:
             This class is designed to be used as a response builder for API endpoints. It provides methods to create custom responses for success and failure events, with the ability to include data, errors, and custom status codes.
         """
-        cls.__init__(
-            cls,
+        # Only a success response without a message needs the caller name; reading
+        # it from the calling frame is O(1), unlike walking the whole stack.
+        if not (message or for_error or caller_function):
+            caller_function = sys._getframe(1).f_code.co_name
+        instance = super().__new__(cls)
+        instance.__init__(
             message=message,
             errors=errors,
             status_code=status_code,
@@ -53,16 +59,9 @@ class APIResponse:
             for_error=for_error,
             general_error=general_error,
             is_partially_processed=is_partially_processed,
+            caller_function=caller_function,
             **kwargs,
         )
-        instance = super().__new__(cls)
-        instance.message = message
-        instance.errors = errors
-        instance.status_code = status_code
-        instance.data = data
-        instance.for_error = for_error
-        instance.is_partially_processed = is_partially_processed
-        instance.caller_function = inspect.stack()[1].function
         if isinstance(errors, Exception):
             instance.errors = errors.args
             sentry_sdk.capture_exception(
@@ -79,6 +78,7 @@ class APIResponse:
         for_error: bool = False,
         general_error: bool = False,
         is_partially_processed: bool = False,
+        caller_function: str = None,
         **kwargs,
     ) -> None:
         """
@@ -92,6 +92,7 @@ class APIResponse:
             for_error (bool, optional): Indicates if the response is for an error event. Defaults to False.
             general_error (bool, optional): Indicates if the response is a general error. Defaults to False.
             is_partially_processed (bool, optional): Indicates if the response is partially processed. Defaults to False.
+            caller_function (str, optional): The view action name used to build the default success message. Defaults to None.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -119,7 +120,7 @@ class APIResponse:
         self.status_code = status_code
         self.data = data
         self.for_error = for_error
-        self.caller_function = inspect.stack()[1].function
+        self.caller_function = caller_function
         self.general_error = general_error
         self.is_partially_processed = is_partially_processed
         self.kwargs = kwargs
@@ -183,7 +184,8 @@ class APIResponse:
         return response
 
     def success_message(self):
-        return f'{self.caller_function.replace("_", "-").title()} Successful.'
+        caller_function = self.caller_function or "request"
+        return f'{caller_function.replace("_", "-").title()} Successful.'
 
     def success(self) -> Response:
         """
@@ -0,0 +1,86 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# entity types shared by the access control stack and the app services
+DIRECT_REPORT = "DirectReport"
+USER = "User"
+USER_ROLE = "UserRole"
+
+
+class IdentityMap:
+    """
+    A request scoped map of the entities already loaded, keyed by entity type and key.
+
+    An entity is loaded once per scope; later lookups with the same key return the same instance.
+    Entities reflect the state at their first load, so a scope must not outlive the request it serves.
+
+    Methods:
+        get_or_load(entity_type: str, key: Any, loader: Callable[[], Any]): Returns the mapped entity, loading it on the first lookup.
+        put(entity_type: str, key: Any, entity: Any): Maps an entity loaded elsewhere.
+        invalidate(entity_type: str, key: Any): Forgets an entity, so the next lookup loads it again.
+    """
+
+    def __init__(self) -> None:
+        self.entities: Dict[Tuple[str, str], Any] = {}
+
+    def get_or_load(self, entity_type: str, key: Any, loader: Callable[[], Any]) -> Any:
+        map_key = (entity_type, str(key))
+        if map_key not in self.entities:
+            self.entities[map_key] = loader()
+        return self.entities[map_key]
+
+    def put(self, entity_type: str, key: Any, entity: Any) -> None:
+        self.entities[(entity_type, str(key))] = entity
+
+    def invalidate(self, entity_type: str, key: Any) -> None:
+        self.entities.pop((entity_type, str(key)), None)
+
+
+_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar(
+    "identity_map", default=None
+)
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """
+    Returns the identity map of the current request, or None outside of a request scope (e.g. in celery tasks).
+    """
+    return _identity_map.get()
+
+
+@contextmanager
+def identity_map_scope():
+    """
+    Opens an identity map for the duration of the block, e.g. the handling of a request.
+
+    Example:
+        with identity_map_scope():
+            response = get_response(request)
+    """
+    token = _identity_map.set(IdentityMap())
+    try:
+        yield _identity_map.get()
+    finally:
+        _identity_map.reset(token)
+
+
+def load_once(entity_type: str, key: Any, loader: Callable[[], Any]) -> Any:
+    """
+    Loads an entity through the identity map of the current request, or directly outside of a request scope.
+
+    Parameters:
+        entity_type (str): The type of the entity, e.g. DIRECT_REPORT.
+        key (Any): The key the entity is looked up by, e.g. its id.
+        loader (Callable[[], Any]): The function loading the entity from the database.
+
+    Returns:
+        Any: The entity.
+
+    Example:
+        load_once(DIRECT_REPORT, direct_report_id, lambda: direct_report_app_services.get_direct_report_by_id(direct_report_id=direct_report_id))
+    """
+    identity_map = _identity_map.get()
+    if identity_map is None:
+        return loader()
+    return identity_map.get_or_load(entity_type=entity_type, key=key, loader=loader)
@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase
+from .services import DIRECT_REPORT, get_identity_map, identity_map_scope, load_once
+
+
+class IdentityMapTests(SimpleTestCase):
+    def setUp(self):
+        self.loads = 0
+
+    def loader(self):
+        self.loads += 1
+        return object()
+
+    def test_entity_is_loaded_once_per_scope(self):
+        with identity_map_scope():
+            first = load_once(DIRECT_REPORT, "id", self.loader)
+            second = load_once(DIRECT_REPORT, "id", self.loader)
+            load_once(DIRECT_REPORT, "other-id", self.loader)
+        self.assertIs(first, second)
+        self.assertEqual(self.loads, 2)
+
+        with identity_map_scope():
+            load_once(DIRECT_REPORT, "id", self.loader)
+        self.assertEqual(self.loads, 3)
+
+    def test_entity_is_loaded_every_time_outside_of_a_scope(self):
+        load_once(DIRECT_REPORT, "id", self.loader)
+        load_once(DIRECT_REPORT, "id", self.loader)
+        self.assertEqual(self.loads, 2)
+        self.assertIsNone(get_identity_map())
+
+    def test_invalidated_entity_is_loaded_again(self):
+        with identity_map_scope() as identity_map:
+            load_once(DIRECT_REPORT, "id", self.loader)
+            identity_map.invalidate(DIRECT_REPORT, "id")
+            load_once(DIRECT_REPORT, "id", self.loader)
+        self.assertEqual(self.loads, 2)
@@ -0,0 +1,219 @@
+import copy
+import logging
+import os
+import queue
+import threading
+from datetime import date
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
+
+
+class DailyFileHandler(logging.FileHandler):
+    """
+    A file handler writing to a file named after the current date.
+
+    The file name is built from a pattern containing a `{date}` placeholder, e.g.
+    `logs/info/{date}_info.log`, and the handler switches to a new file when the date changes.
+
+    Methods:
+        emit_batch(records: List[logging.LogRecord]): Formats a batch of records and writes them with a single write and flush.
+    """
+
+    def __init__(self, filename_pattern: str, mode="a", encoding=None):
+        self.filename_pattern = filename_pattern
+        self.current_date = date.today()
+        super().__init__(
+            self.__build_filename(self.current_date), mode, encoding, delay=True
+        )
+
+    def __build_filename(self, day: date) -> str:
+        return self.filename_pattern.format(date=day.isoformat())
+
+    def __roll_over_if_needed(self) -> None:
+        today = date.today()
+        if today == self.current_date:
+            return
+        self.current_date = today
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.baseFilename = os.path.abspath(self.__build_filename(today))
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.__roll_over_if_needed()
+        super().emit(record)
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+        self.acquire()
+        try:
+            self.__roll_over_if_needed()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write("".join(lines))
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    A queue listener writing the queued records in batches from its own thread.
+
+    After the first record is taken from the queue, every record already waiting behind it (up to
+    `batch_size`) is written with it, so the file is written and flushed once per batch.
+    """
+
+    def __init__(
+        self,
+        queue,
+        handler: DailyFileHandler,
+        batch_size: int,
+        front_handler: "AsyncDailyFileHandler",
+    ):
+        super().__init__(queue, handler)
+        self.batch_size = batch_size
+        self.front_handler = front_handler
+        self.reported_dropped_records = 0
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def __report_dropped_records(self, batch: List[logging.LogRecord]) -> None:
+        dropped_records = self.front_handler.dropped_records
+        if dropped_records == self.reported_dropped_records:
+            return
+        batch.append(
+            logging.makeLogRecord(
+                dict(
+                    name=__name__,
+                    levelno=logging.WARNING,
+                    levelname="WARNING",
+                    msg=f"{dropped_records - self.reported_dropped_records} log records dropped, the log queue was full",
+                    funcName="enqueue",
+                )
+            )
+        )
+        self.reported_dropped_records = dropped_records
+
+    def _monitor(self):
+        while True:
+            record = self.queue.get()
+            stop = record is self._sentinel
+            batch = [] if stop else [record]
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    batch.append(record)
+            self.__report_dropped_records(batch=batch)
+            if batch:
+                self.handlers[0].emit_batch(batch)
+            if stop:
+                return
+
+
+class AsyncDailyFileHandler(QueueHandler):
+    """
+    A non-blocking handler writing to a date named file from a background thread.
+
+    The calling thread only copies the record into a bounded queue; formatting and disk I/O happen in
+    a BatchingQueueListener. When the queue is full the overflow policy decides what happens:
+    "drop_newest" discards the incoming record, "drop_oldest" discards the oldest queued record and
+    "block" waits for room. Dropped records are counted and reported in the log file.
+
+    Attributes:
+        overflow_policy (str): The overflow policy of the queue.
+        dropped_records (int): The number of records dropped so far.
+        file_handler (DailyFileHandler): The handler writing the records, in the listener thread.
+    """
+
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+    def __init__(
+        self,
+        filename_pattern: str,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        overflow_policy: str = DROP_NEWEST,
+        encoding=None,
+    ):
+        super().__init__(queue.Queue(maxsize=max_queue_size))
+        self.overflow_policy = overflow_policy
+        self.batch_size = batch_size
+        self.dropped_records = 0
+        self.file_handler = DailyFileHandler(filename_pattern, encoding=encoding)
+        self.listener = None
+        self.listener_pid = None
+        self.listener_lock = threading.Lock()
+
+    def __start_listener(self) -> None:
+        # started lazily, and again in forked workers where the thread does not survive
+        with self.listener_lock:
+            if self.listener_pid == os.getpid():
+                return
+            self.listener = BatchingQueueListener(
+                self.queue, self.file_handler, self.batch_size, front_handler=self
+            )
+            self.listener.start()
+            self.listener_pid = os.getpid()
+
+    def setFormatter(self, fmt):
+        # records are formatted by the file handler, in the listener thread
+        self.file_handler.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow_policy == self.BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow_policy == self.DROP_OLDEST:
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped_records += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.listener_pid != os.getpid():
+            self.__start_listener()
+        super().emit(record)
+
+    def close(self) -> None:
+        if self.listener and self.listener_pid == os.getpid():
+            self.listener.stop()
+            self.listener = None
+            self.listener_pid = None
+        self.file_handler.close()
+        super().close()
@@ -0,0 +1,57 @@
+import logging
+import os
+import queue
+import tempfile
+from datetime import date, timedelta
+from unittest import mock
+from django.test import SimpleTestCase
+from .handlers import AsyncDailyFileHandler, DailyFileHandler
+
+
+class DailyFileHandlerTests(SimpleTestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.handler = DailyFileHandler(
+            os.path.join(self.log_dir, "info", "{date}_info.log")
+        )
+
+    def tearDown(self):
+        self.handler.close()
+
+    def test_emit_batch_rolls_over_to_a_new_file_when_the_date_changes(self):
+        record = logging.makeLogRecord(dict(msg="message"))
+        self.handler.emit_batch([record])
+        tomorrow = date.today() + timedelta(days=1)
+        with mock.patch(
+            "domain_driven_api.infrastructure.logger.handlers.date"
+        ) as mocked_date:
+            mocked_date.today.return_value = tomorrow
+            self.handler.emit_batch([record, record])
+
+        with open(os.path.join(self.log_dir, "info", f"{date.today()}_info.log")) as file:
+            self.assertEqual(len(file.readlines()), 1)
+        with open(os.path.join(self.log_dir, "info", f"{tomorrow}_info.log")) as file:
+            self.assertEqual(len(file.readlines()), 2)
+
+
+class AsyncDailyFileHandlerTests(SimpleTestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.filename_pattern = os.path.join(self.log_dir, "{date}_info.log")
+
+    def test_records_are_written_by_the_listener(self):
+        handler = AsyncDailyFileHandler(self.filename_pattern)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.handle(logging.makeLogRecord(dict(msg="hello %s", args=("world",))))
+        handler.close()
+
+        with open(self.filename_pattern.format(date=date.today())) as file:
+            self.assertEqual(file.read(), "hello world\n")
+
+    def test_full_queue_drops_records_instead_of_blocking(self):
+        handler = AsyncDailyFileHandler(self.filename_pattern, max_queue_size=1)
+        handler.enqueue(logging.makeLogRecord(dict(msg="first")))
+        handler.enqueue(logging.makeLogRecord(dict(msg="second")))
+        self.assertEqual(handler.dropped_records, 1)
+        self.assertEqual(handler.queue.get_nowait().msg, "first")
+        self.assertRaises(queue.Empty, handler.queue.get_nowait)
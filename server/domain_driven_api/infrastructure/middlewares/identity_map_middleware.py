@@ -0,0 +1,25 @@
+from domain_driven_api.infrastructure.identity_map.services import identity_map_scope
+
+
+class IdentityMapMiddleware:
+    """
+    IdentityMapMiddleware class.
+
+    This class is a middleware that opens a request scoped identity map, so the DirectReport, User and UserRole
+    lookups of the access control stack and of every app service created during the request load each entity
+    at most once.
+
+    Attributes:
+        get_response (function): The function that gets the response from the view.
+
+    Methods:
+        __call__(self, request): Executes the middleware logic and returns the response.
+
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with identity_map_scope():
+            return self.get_response(request)
@@ -0,0 +1,68 @@
+import logging
+import random
+from contextlib import ExitStack
+from django.conf import settings
+from django.db import connections
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from domain_driven_api.infrastructure.query_instrumentation.services import (
+    QueryTimer,
+    query_statistics_registry,
+)
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+
+class QueryInstrumentationMiddleware:
+    """
+    QueryInstrumentationMiddleware class.
+
+    This class is a middleware that times the database queries of a sample of the requests. Queries above the
+    slow query threshold are logged, and the durations are aggregated per endpoint (count, total time, p95).
+    Requests that are not sampled run without any instrumentation.
+
+    Attributes:
+        get_response (function): The function that gets the response from the view.
+        sample_rate (float): The share of requests that are instrumented, between 0 and 1.
+        slow_query_threshold (float): The duration in milliseconds from which a query is logged.
+        report_interval (int): The number of sampled requests between two logs of the aggregated counters.
+
+    Methods:
+        __call__(self, request): Executes the middleware logic and returns the response.
+        get_endpoint(request): Returns the name under which the queries of a request are aggregated.
+
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.QUERY_INSTRUMENTATION_SAMPLE_RATE
+        self.slow_query_threshold = settings.QUERY_INSTRUMENTATION_SLOW_QUERY_MS
+        self.report_interval = settings.QUERY_INSTRUMENTATION_REPORT_INTERVAL
+        self.sampled_requests = 0
+
+    @staticmethod
+    def get_endpoint(request) -> str:
+        resolver_match = getattr(request, "resolver_match", None)
+        route = resolver_match.route if resolver_match else request.path
+        return f"{request.method} {route}"
+
+    def __call__(self, request):
+        if not settings.QUERY_INSTRUMENTATION_ENABLED or (
+            random.random() >= self.sample_rate
+        ):
+            return self.get_response(request)
+
+        query_timer = QueryTimer(
+            slow_query_threshold=self.slow_query_threshold, path=request.path
+        )
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(query_timer))
+            response = self.get_response(request)
+
+        query_statistics_registry.record(
+            endpoint=self.get_endpoint(request), durations=query_timer.durations
+        )
+        self.sampled_requests += 1
+        if self.sampled_requests % self.report_interval == 0:
+            log.info(f"query-statistics: {query_statistics_registry.snapshot()}")
+        return response
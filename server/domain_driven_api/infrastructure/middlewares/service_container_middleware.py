@@ -0,0 +1,26 @@
+from domain_driven_api.infrastructure.service_container.services import (
+    service_container_scope,
+)
+
+
+class ServiceContainerMiddleware:
+    """
+    ServiceContainerMiddleware class.
+
+    This class is a middleware that opens a request scoped service container, so the app services resolved with
+    `get_service` by the views, the serializers and the other app services are built once per request.
+
+    Attributes:
+        get_response (function): The function that gets the response from the view.
+
+    Methods:
+        __call__(self, request): Executes the middleware logic and returns the response.
+
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with service_container_scope():
+            return self.get_response(request)
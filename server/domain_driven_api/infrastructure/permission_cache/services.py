@@ -0,0 +1,118 @@
+import logging
+import time
+from typing import Any, Callable, Iterable, Optional
+from django.conf import settings
+from django.core.cache import caches
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+
+def get_module_type_key(module_type: Any) -> str:
+    # the module types are passed as plain strings and as ModuleInstanceType members
+    return str(getattr(module_type, "value", module_type))
+
+
+class PermissionDecisionCache:
+    """
+    PermissionDecisionCache class.
+
+    This class caches the access decisions of the users on module instances, keyed by (user, module type,
+    instance, company) in the shared Django cache (Redis), so repeated mutations of the same instances skip the
+    role and direct report lookups of the check.
+
+    Every instance has a version, part of the key of its decisions: the paths changing the permissions of an
+    instance bump it, which invalidates all its decisions at once. A missing version is initialized from the
+    clock, so an evicted version never brings back the decisions of an older one. Only granted decisions are
+    cached, a denied check is run again; the changes the versions do not see (e.g. roles) are bounded by the
+    timeout.
+
+    Attributes:
+        timeout (Optional[int]): The expiry in seconds of the cached decisions.
+        cache_alias (str): The alias of the Django cache holding the versions and the decisions.
+
+    Methods:
+        get_version(module_type: str, instance_id: str): Returns the current version of an instance.
+        bump_version(module_type: str, instance_ids: Iterable[str]): Invalidates the decisions of instances.
+        check(user_id: str, module_type: str, instance_id: str, company_id: Optional[str], check: Callable): Runs
+            the check unless a granted decision is cached, and caches it when it does not raise.
+
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[int] = settings.PERMISSION_DECISION_CACHE_TIMEOUT,
+        cache_alias: str = settings.PERMISSION_DECISION_CACHE_ALIAS,
+    ) -> None:
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+
+    @staticmethod
+    def __build_version_key(module_type: str, instance_id: str) -> str:
+        return f"permission-version:{get_module_type_key(module_type)}:{instance_id}"
+
+    @staticmethod
+    def __build_decision_key(
+        module_type: str,
+        instance_id: str,
+        version: int,
+        user_id: str,
+        company_id: Optional[str],
+    ) -> str:
+        return (
+            f"permission-decision:{get_module_type_key(module_type)}:{instance_id}:{version}:{user_id}"
+            f":{company_id or ''}"
+        )
+
+    def get_version(self, module_type: str, instance_id: str) -> int:
+        cache = caches[self.cache_alias]
+        key = self.__build_version_key(module_type=module_type, instance_id=instance_id)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        return version
+
+    def bump_version(self, module_type: str, instance_ids: Iterable[str]) -> None:
+        cache = caches[self.cache_alias]
+        for instance_id in instance_ids:
+            key = self.__build_version_key(
+                module_type=module_type, instance_id=instance_id
+            )
+            try:
+                try:
+                    cache.incr(key)
+                except ValueError:
+                    # no version yet, nothing cached under the one it will start with
+                    cache.add(key, time.time_ns(), timeout=None)
+            except Exception as e:
+                log.error(f"permission-decision-cache-unavailable: {str(e)}")
+
+    def check(
+        self,
+        user_id: str,
+        module_type: str,
+        instance_id: str,
+        company_id: Optional[str],
+        check: Callable[[], Any],
+    ) -> None:
+        try:
+            # the version is read before the check, a decision made during a change is stored under the old one
+            key = self.__build_decision_key(
+                module_type=module_type,
+                instance_id=instance_id,
+                version=self.get_version(module_type=module_type, instance_id=instance_id),
+                user_id=user_id,
+                company_id=company_id,
+            )
+            if caches[self.cache_alias].get(key):
+                return
+        except Exception as e:
+            log.error(f"permission-decision-cache-unavailable: {str(e)}")
+            check()
+            return
+        check()
+        try:
+            caches[self.cache_alias].set(key, True, timeout=self.timeout)
+        except Exception as e:
+            log.error(f"permission-decision-cache-unavailable: {str(e)}")
@@ -0,0 +1,44 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from .services import PermissionDecisionCache
+
+
+class PermissionDecisionCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.permission_decision_cache = PermissionDecisionCache(timeout=60)
+        self.check = mock.Mock()
+
+    def check_access(self, user_id="user-id"):
+        self.permission_decision_cache.check(
+            user_id=user_id,
+            module_type="documents",
+            instance_id="instance-id",
+            company_id=None,
+            check=self.check,
+        )
+
+    def test_granted_decision_is_cached_per_user(self):
+        self.check_access()
+        self.check_access()
+        self.check_access(user_id="other-user-id")
+        self.assertEqual(self.check.call_count, 2)
+
+    def test_bumped_version_invalidates_the_decisions(self):
+        self.check_access()
+        version = self.permission_decision_cache.get_version("documents", "instance-id")
+        self.permission_decision_cache.bump_version("documents", ["instance-id"])
+        self.assertGreater(
+            self.permission_decision_cache.get_version("documents", "instance-id"),
+            version,
+        )
+        self.check_access()
+        self.assertEqual(self.check.call_count, 2)
+
+    def test_denied_decision_is_not_cached(self):
+        self.check.side_effect = PermissionError
+        for _ in range(2):
+            with self.assertRaises(PermissionError):
+                self.check_access()
+        self.assertEqual(self.check.call_count, 2)
@@ -0,0 +1,126 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+
+class QueryStatistics:
+    """
+    Aggregated query counters of a single endpoint.
+
+    Attributes:
+        count (int): The number of queries recorded.
+        total_time (float): The total time spent in the queries, in milliseconds.
+        durations (deque): A bounded window of the latest query durations, used to compute the p95.
+
+    Methods:
+        record(duration: float): Adds a query duration to the counters.
+        p95(): Returns the 95th percentile of the recorded window.
+        as_dict(): Returns the counters as a dictionary.
+    """
+
+    def __init__(self, window_size: int) -> None:
+        self.count = 0
+        self.total_time = 0.0
+        self.durations = deque(maxlen=window_size)
+
+    def record(self, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.durations.append(duration)
+
+    def p95(self) -> float:
+        if not self.durations:
+            return 0.0
+        durations = sorted(self.durations)
+        return durations[max(math.ceil(len(durations) * 0.95) - 1, 0)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(
+            count=self.count,
+            total_time_ms=round(self.total_time, 3),
+            p95_ms=round(self.p95(), 3),
+        )
+
+
+class QueryStatisticsRegistry:
+    """
+    A thread safe registry of the query counters of every endpoint.
+
+    Attributes:
+        window_size (int): The number of latest durations kept per endpoint to compute the p95.
+
+    Methods:
+        record(endpoint: str, durations: List[float]): Adds the query durations of a request to the endpoint counters.
+        snapshot(): Returns the counters of every endpoint.
+        reset(): Removes every counter.
+    """
+
+    def __init__(self, window_size: int = 1000) -> None:
+        self.window_size = window_size
+        self.__statistics: Dict[str, QueryStatistics] = {}
+        self.__lock = threading.Lock()
+
+    def record(self, endpoint: str, durations: List[float]) -> None:
+        with self.__lock:
+            statistics = self.__statistics.get(endpoint)
+            if statistics is None:
+                statistics = self.__statistics[endpoint] = QueryStatistics(
+                    window_size=self.window_size
+                )
+            for duration in durations:
+                statistics.record(duration=duration)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self.__lock:
+            return {
+                endpoint: statistics.as_dict()
+                for endpoint, statistics in self.__statistics.items()
+            }
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__statistics = {}
+
+
+class QueryTimer:
+    """
+    A database execute wrapper that times the queries of a sampled request.
+
+    Queries slower than the threshold are logged with their SQL; the others are only timed.
+
+    Attributes:
+        slow_query_threshold (float): The duration in milliseconds from which a query is logged.
+        durations (List[float]): The durations in milliseconds of the queries executed so far.
+
+    Methods:
+        __call__(execute, sql, params, many, context): Executes and times a query.
+    """
+
+    MAX_LOGGED_SQL_LENGTH = 2000
+
+    def __init__(self, slow_query_threshold: float, path: str) -> None:
+        self.slow_query_threshold = slow_query_threshold
+        self.path = path
+        self.durations: List[float] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            self.durations.append(duration)
+            if duration >= self.slow_query_threshold:
+                log.warning(
+                    f"slow-query: {duration:.1f}ms on {self.path}: "
+                    f"{sql[:self.MAX_LOGGED_SQL_LENGTH]}"
+                )
+
+
+query_statistics_registry = QueryStatisticsRegistry()
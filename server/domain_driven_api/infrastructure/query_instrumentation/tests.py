@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase
+from .services import QueryStatisticsRegistry, QueryTimer
+
+
+class QueryStatisticsRegistryTests(SimpleTestCase):
+    def test_record_aggregates_counters_per_endpoint(self):
+        registry = QueryStatisticsRegistry(window_size=100)
+        registry.record(endpoint="GET document/", durations=[float(i) for i in range(1, 101)])
+        registry.record(endpoint="PUT document/<pk>/", durations=[2.0])
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["GET document/"]["count"], 100)
+        self.assertEqual(snapshot["GET document/"]["total_time_ms"], 5050.0)
+        self.assertEqual(snapshot["GET document/"]["p95_ms"], 95.0)
+        self.assertEqual(snapshot["PUT document/<pk>/"]["count"], 1)
+
+    def test_p95_is_computed_on_a_bounded_window(self):
+        registry = QueryStatisticsRegistry(window_size=10)
+        registry.record(endpoint="GET document/", durations=[100.0] * 10 + [1.0] * 10)
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["GET document/"]["count"], 20)
+        self.assertEqual(snapshot["GET document/"]["p95_ms"], 1.0)
+
+
+class QueryTimerTests(SimpleTestCase):
+    def test_queries_are_timed(self):
+        query_timer = QueryTimer(slow_query_threshold=1000, path="/api/v0/document/")
+        result = query_timer(
+            lambda sql, params, many, context: "result", "SELECT 1", None, False, {}
+        )
+        self.assertEqual(result, "result")
+        self.assertEqual(len(query_timer.durations), 1)
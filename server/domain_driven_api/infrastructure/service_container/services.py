@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+Service = TypeVar("Service")
+
+
+class ServiceContainer:
+    """
+    A request scoped container of the app services, created on first use and reused for the rest of the request.
+
+    Services are keyed by their class and the logger they are built with, so the view, its serializers and the
+    collaborators of other app services share one instance per request.
+
+    Methods:
+        get(service_class: Type[Service], log: Any): Returns the service of the class, building it on first use.
+    """
+
+    def __init__(self) -> None:
+        self.services: Dict[Tuple[type, int], Any] = {}
+
+    def get(self, service_class: Type[Service], log: Any) -> Service:
+        key = (service_class, id(log))
+        if key not in self.services:
+            self.services[key] = service_class(log=log)
+        return self.services[key]
+
+
+_service_container: ContextVar[Optional[ServiceContainer]] = ContextVar(
+    "service_container", default=None
+)
+
+
+@contextmanager
+def service_container_scope():
+    """
+    Opens a service container for the duration of the block, e.g. the handling of a request.
+
+    Example:
+        with service_container_scope():
+            response = get_response(request)
+    """
+    token = _service_container.set(ServiceContainer())
+    try:
+        yield _service_container.get()
+    finally:
+        _service_container.reset(token)
+
+
+def get_service(service_class: Type[Service], log: Any) -> Service:
+    """
+    Returns the app service of the current request, or a new one outside of a request scope (e.g. in celery tasks).
+
+    Parameters:
+        service_class (Type[Service]): The app service class, built with a single `log` argument.
+        log (AttributeLogger): The logger of the request.
+
+    Returns:
+        Service: The app service.
+
+    Example:
+        document_app_services = get_service(DocumentAppServices, log=self.log)
+    """
+    service_container = _service_container.get()
+    if service_container is None:
+        return service_class(log=log)
+    return service_container.get(service_class=service_class, log=log)
@@ -0,0 +1,31 @@
+from django.test import SimpleTestCase
+from .services import get_service, service_container_scope
+
+
+class CountedService:
+    instances = 0
+
+    def __init__(self, log):
+        self.log = log
+        CountedService.instances += 1
+
+
+class ServiceContainerTests(SimpleTestCase):
+    def setUp(self):
+        CountedService.instances = 0
+
+    def test_service_is_built_once_per_scope(self):
+        log = object()
+        with service_container_scope():
+            first = get_service(CountedService, log=log)
+            second = get_service(CountedService, log=log)
+        self.assertIs(first, second)
+        self.assertEqual(CountedService.instances, 1)
+
+        with service_container_scope():
+            self.assertIsNot(get_service(CountedService, log=log), first)
+
+    def test_service_is_built_every_time_outside_of_a_scope(self):
+        log = object()
+        self.assertIsNot(get_service(CountedService, log=log), get_service(CountedService, log=log))
+        self.assertEqual(CountedService.instances, 2)
@@ -1,4 +1,5 @@
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
 from django.conf import settings
 
 
@@ -13,7 +14,7 @@ class MediaStorage(S3Boto3Storage):
 
     Attributes:
         bucket_name (str): The name of the AWS S3 bucket where media files are stored.
-                        This value is obtained from the `AWS_STORAGE_BUCKET_NAME` setting.
+                        This value is obtained from the `AWS_STORAGE_BUCKET_NAME` setting, None without a bucket.
 
         location (str): The subdirectory within the S3 bucket where media files are stored.
                         By default, this is set to 'media'.
@@ -23,6 +24,14 @@ class MediaStorage(S3Boto3Storage):
                             overwritten. When set to False, a new unique filename will be
                             generated for each uploaded file to avoid overwrites.
 
+    `delete_many` removes objects with the multi-object delete API, up to
+    `DELETE_BATCH_SIZE` keys per call.
+
+    Files streamed to the bucket during the request (see `S3StreamingUploadHandler`) are
+    stored with a server side copy of the uploaded object instead of being uploaded again.
+    Files given a `content_address` (see `StoredObjectAppServices.reference_content`) are
+    saved under it, and skipped when `is_stored` tells the object is already there.
+
     Note:
         This class assumes that appropriate AWS credentials and settings are configured
         for the application to interact with the specified S3 bucket.
@@ -38,6 +47,48 @@ class MediaStorage(S3Boto3Storage):
         file_url = media_storage.url('path/to/my_image.jpg')
     """
 
-    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
+    # only defined with ENABLE_AWS_S3_BUCKET, the module is imported by the document views in every mode
+    bucket_name = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None)
     location = "media"
     file_overwrite = True
+
+    DELETE_BATCH_SIZE = 1000
+
+    def _save(self, name, content):
+        # a file with a content address is saved under it, and not at all when the object is already stored
+        name = getattr(content, "content_address", None) or name
+        storage_name = getattr(content, "storage_name", None)
+        if getattr(content, "is_stored", False):
+            if storage_name is not None:
+                self.delete(storage_name)
+                content.storage_name = name
+            return clean_name(name)
+        if storage_name is None:
+            return super()._save(name, content)
+        source_key = self._normalize_name(clean_name(storage_name))
+        target_key = self._normalize_name(clean_name(name))
+        if source_key != target_key:
+            client = self.connection.meta.client
+            client.copy(
+                CopySource=dict(Bucket=self.bucket_name, Key=source_key),
+                Bucket=self.bucket_name,
+                Key=target_key,
+            )
+            client.delete_object(Bucket=self.bucket_name, Key=source_key)
+            content.storage_name = name
+        return clean_name(name)
+
+    def delete_many(self, names):
+        failed_names = []
+        client = self.connection.meta.client
+        for start in range(0, len(names), self.DELETE_BATCH_SIZE):
+            keys = {
+                self._normalize_name(clean_name(name)): name
+                for name in names[start : start + self.DELETE_BATCH_SIZE]
+            }
+            response = client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete=dict(Objects=[dict(Key=key) for key in keys], Quiet=True),
+            )
+            failed_names.extend(keys[error["Key"]] for error in response.get("Errors", []))
+        return failed_names
@@ -0,0 +1,138 @@
+import logging
+import os
+from typing import Any, Dict, Optional
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core import signing
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from domain_driven_api.infrastructure.storages.custom_storage import MediaStorage
+from domain_driven_api.infrastructure.storages.upload_handlers import (
+    SIGNATURE_LENGTH,
+    StreamedUploadedFile,
+    get_upload_storage_name,
+    validate_file_extension,
+    validate_file_signature,
+    validate_file_size,
+)
+from utils.django.exceptions import DirectUploadException
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+UPLOAD_TOKEN_SALT = "domain_driven_api.storages.direct_upload"
+
+
+def create_direct_upload(
+    user_id: str, file_name: str, content_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Issues a presigned POST letting a client upload a file straight to the media storage bucket.
+
+    The bucket enforces the size limit (`settings.DOCUMENT_MAX_UPLOAD_SIZE`) and the content type through the
+    policy of the POST, and the returned upload token ties the uploaded object to the user and the file name
+    for `get_direct_upload`. An upload never finalized is deleted by `delete_expired_uploads`.
+
+    Parameters:
+        user_id (str): The ID of the user uploading the file.
+        file_name (str): The name of the file, its extension is validated.
+        content_type (str, optional): The content type the file has to be uploaded with.
+
+    Returns:
+        Dict[str, Any]: The `upload_url` and the form `fields` of the POST, the `upload_token` and `expires_in`.
+
+    Raises:
+        FileExtensionNotAllowedException: If the file extension is not allowed.
+    """
+    validate_file_extension(file_name)
+    storage = MediaStorage()
+    storage_name = get_upload_storage_name(file_name)
+    fields = {}
+    conditions = [["content-length-range", 1, settings.DOCUMENT_MAX_UPLOAD_SIZE]]
+    if content_type:
+        fields["Content-Type"] = content_type
+        conditions.append({"Content-Type": content_type})
+    presigned_post = storage.connection.meta.client.generate_presigned_post(
+        Bucket=storage.bucket_name,
+        Key=storage._normalize_name(storage_name),
+        Fields=fields,
+        Conditions=conditions,
+        ExpiresIn=settings.DOCUMENT_DIRECT_UPLOAD_EXPIRY,
+    )
+    upload_token = signing.dumps(
+        dict(
+            user_id=str(user_id),
+            storage_name=storage_name,
+            file_name=os.path.basename(file_name),
+        ),
+        salt=UPLOAD_TOKEN_SALT,
+    )
+    return dict(
+        upload_url=presigned_post["url"],
+        fields=presigned_post["fields"],
+        upload_token=upload_token,
+        expires_in=settings.DOCUMENT_DIRECT_UPLOAD_EXPIRY,
+    )
+
+
+def get_direct_upload(user_id: str, upload_token: str) -> StreamedUploadedFile:
+    """
+    Returns the file a client uploaded with `create_direct_upload`, after checking it in the bucket.
+
+    Only the object metadata and its first bytes are read, the returned file is saved with a server side copy by
+    `MediaStorage`. An object failing the checks is deleted.
+
+    Parameters:
+        user_id (str): The ID of the user finalizing the upload, it has to be the one who requested it.
+        upload_token (str): The upload token returned by `create_direct_upload`.
+
+    Returns:
+        StreamedUploadedFile: The uploaded file.
+
+    Raises:
+        DirectUploadException: If the token is invalid, expired or of another user, or the file was not uploaded.
+        FileExtensionNotAllowedException: If the content of the file does not match its extension.
+        FileSizeNotAllowedException: If the file is too large.
+    """
+    try:
+        upload = signing.loads(
+            upload_token,
+            salt=UPLOAD_TOKEN_SALT,
+            # the client may start the upload right before the url expires
+            max_age=settings.DOCUMENT_DIRECT_UPLOAD_EXPIRY * 2,
+        )
+    except signing.BadSignature:
+        raise DirectUploadException(
+            "direct-upload-exception", "The upload token is invalid or expired.", log
+        )
+    if upload["user_id"] != str(user_id):
+        raise DirectUploadException(
+            "direct-upload-exception", "The upload token is invalid or expired.", log
+        )
+
+    storage = MediaStorage()
+    client = storage.connection.meta.client
+    key = storage._normalize_name(upload["storage_name"])
+    try:
+        head = client.head_object(Bucket=storage.bucket_name, Key=key)
+    except ClientError:
+        raise DirectUploadException(
+            "direct-upload-exception", "The file has not been uploaded.", log
+        )
+    try:
+        validate_file_size(head["ContentLength"])
+        first_bytes = client.get_object(
+            Bucket=storage.bucket_name,
+            Key=key,
+            Range=f"bytes=0-{SIGNATURE_LENGTH - 1}",
+        )["Body"].read()
+        validate_file_signature(
+            validate_file_extension(upload["file_name"]), first_bytes
+        )
+    except Exception:
+        client.delete_object(Bucket=storage.bucket_name, Key=key)
+        raise
+    return StreamedUploadedFile(
+        storage_name=upload["storage_name"],
+        name=upload["file_name"],
+        content_type=head.get("ContentType"),
+        size=head["ContentLength"],
+    )
@@ -0,0 +1,71 @@
+import hashlib
+import logging
+import os
+from typing import List, Optional
+from urllib.parse import unquote, urlparse
+from django.conf import settings
+from django.core.files.storage import default_storage
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+# the content addressed objects, shared by the files with the same content
+CONTENT_ADDRESS_PREFIX = "objects"
+
+
+def get_storage_name_from_url(url: Optional[str]) -> Optional[str]:
+    """
+    Returns the name in the media storage of the object served at a url, or None for an external link.
+
+    The name is what follows the storage location (`AWS_LOCATION`, or `MEDIA_URL` without a bucket) in the path,
+    so it works with virtual-hosted and path-style bucket urls (MinIO) alike.
+    """
+    if not url:
+        return None
+    path = unquote(urlparse(url).path)
+    if settings.ENABLE_AWS_S3_BUCKET:
+        prefix = f"/{settings.AWS_LOCATION.strip('/')}/"
+    else:
+        prefix = settings.MEDIA_URL
+    _, found, name = path.partition(prefix)
+    return name if found and name else None
+
+
+def delete_storage_objects(names: List[str]) -> List[str]:
+    """
+    Deletes objects from the media storage and returns the names that could not be deleted.
+
+    The bucket storage deletes them in batches with the multi-object delete API, the other storages one by one.
+    """
+    if hasattr(default_storage, "delete_many"):
+        return default_storage.delete_many(names)
+    failed_names = []
+    for name in names:
+        try:
+            default_storage.delete(name)
+        except OSError as e:
+            log.error(f"could not delete {name} from the storage: {e}")
+            failed_names.append(name)
+    return failed_names
+
+
+def get_content_hash(content) -> Optional[str]:
+    """
+    Returns the hex sha256 of an uploaded file, or None when it is only known to the storage.
+
+    The hash computed while the file was streamed is reused, otherwise the local file is read once and rewound.
+    """
+    content_hash = getattr(content, "content_hash", None)
+    if content_hash or getattr(content, "storage_name", None):
+        return content_hash
+    sha256 = hashlib.sha256()
+    for chunk in content.chunks():
+        sha256.update(chunk)
+    content.seek(0)
+    return sha256.hexdigest()
+
+
+def get_content_address(content_hash: str, file_name: str) -> str:
+    # the extension is kept so the storage serves the object with its content type
+    extension = os.path.splitext(file_name)[1].lower()
+    return f"{CONTENT_ADDRESS_PREFIX}/{content_hash[:2]}/{content_hash}{extension}"
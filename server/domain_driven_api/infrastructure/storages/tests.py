@@ -0,0 +1,226 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+from django.core import signing
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from utils.django.exceptions import (
+    DirectUploadException,
+    FileExtensionNotAllowedException,
+    FileSizeNotAllowedException,
+)
+from .direct_uploads import UPLOAD_TOKEN_SALT, get_direct_upload
+from .services import get_content_address, get_content_hash, get_storage_name_from_url
+from .upload_handlers import (
+    S3StreamingUploadHandler,
+    delete_expired_uploads,
+    validate_file_extension,
+    validate_file_signature,
+    validate_file_size,
+)
+
+
+@override_settings(ALLOWED_FILE_EXTENSIONS=["pdf", "txt"], DOCUMENT_MAX_UPLOAD_SIZE=10)
+class UploadValidationTests(SimpleTestCase):
+    def test_file_extension_is_validated_from_the_name(self):
+        self.assertEqual(validate_file_extension("report.pdf"), "pdf")
+        with self.assertRaises(FileExtensionNotAllowedException):
+            validate_file_extension("script.exe")
+
+    def test_file_signature_is_validated_for_the_known_types(self):
+        validate_file_signature("pdf", b"%PDF-1.7")
+        # the types without a signature are not sniffed
+        validate_file_signature("txt", b"anything")
+        with self.assertRaises(FileExtensionNotAllowedException):
+            validate_file_signature("pdf", b"MZ\x90\x00")
+
+    def test_file_size_is_validated(self):
+        validate_file_size(10)
+        with self.assertRaises(FileSizeNotAllowedException):
+            validate_file_size(11)
+
+
+def get_stubbed_storage():
+    storage = Mock(bucket_name="bucket")
+    storage._normalize_name.side_effect = lambda name: f"media/{name}"
+    client = storage.connection.meta.client
+    client.create_multipart_upload.return_value = dict(UploadId="upload-id")
+    client.upload_part.side_effect = lambda **kwargs: dict(
+        ETag=f"etag-{kwargs['PartNumber']}"
+    )
+    return storage
+
+
+@override_settings(
+    ALLOWED_FILE_EXTENSIONS=["pdf"],
+    DOCUMENT_MAX_UPLOAD_SIZE=20,
+    DOCUMENT_UPLOAD_PART_SIZE=8,
+)
+class S3StreamingUploadHandlerTests(SimpleTestCase):
+    def setUp(self):
+        self.storage = get_stubbed_storage()
+        self.client = self.storage.connection.meta.client
+        patcher = patch(
+            "domain_driven_api.infrastructure.storages.upload_handlers.MediaStorage",
+            return_value=self.storage,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.handler = S3StreamingUploadHandler()
+        self.handler.new_file("document_file", "report.pdf", "application/pdf", None)
+
+    def test_file_is_uploaded_in_parts(self):
+        self.handler.receive_data_chunk(b"%PDF-1.7", 0)
+        self.handler.receive_data_chunk(b" content!", 8)
+        uploaded_file = self.handler.file_complete(17)
+
+        self.assertEqual(self.client.upload_part.call_count, 2)
+        self.client.complete_multipart_upload.assert_called_once()
+        self.assertEqual(
+            self.client.complete_multipart_upload.call_args.kwargs["MultipartUpload"],
+            dict(
+                Parts=[
+                    dict(ETag="etag-1", PartNumber=1),
+                    dict(ETag="etag-2", PartNumber=2),
+                ]
+            ),
+        )
+        self.client.abort_multipart_upload.assert_not_called()
+        self.assertEqual(uploaded_file.size, 17)
+        self.assertEqual(
+            uploaded_file.content_hash,
+            hashlib.sha256(b"%PDF-1.7 content!").hexdigest(),
+        )
+        self.assertTrue(uploaded_file.storage_name.startswith("uploads/"))
+
+    def test_small_file_is_uploaded_at_once(self):
+        self.handler.receive_data_chunk(b"%PDF-1", 0)
+        self.handler.file_complete(6)
+
+        self.client.put_object.assert_called_once()
+        self.client.create_multipart_upload.assert_not_called()
+
+    def test_upload_is_aborted_when_the_file_is_rejected(self):
+        self.handler.receive_data_chunk(b"%PDF-1.7", 0)
+        with self.assertRaises(FileSizeNotAllowedException):
+            self.handler.receive_data_chunk(b"x" * 13, 8)
+
+        self.client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key=self.handler.key, UploadId="upload-id"
+        )
+        self.client.complete_multipart_upload.assert_not_called()
+
+    def test_file_with_a_wrong_signature_is_not_uploaded(self):
+        with self.assertRaises(FileExtensionNotAllowedException):
+            self.handler.receive_data_chunk(b"MZ\x90\x00\x00\x00\x00\x00", 0)
+
+        self.client.upload_part.assert_not_called()
+        self.client.put_object.assert_not_called()
+
+
+class ExpiredUploadTests(SimpleTestCase):
+    def test_only_the_expired_uploads_are_deleted(self):
+        storage = get_stubbed_storage()
+        storage.delete_many.return_value = []
+        client = storage.connection.meta.client
+        now = datetime.now(timezone.utc)
+        pages = dict(
+            list_multipart_uploads=[
+                dict(
+                    Uploads=[
+                        dict(
+                            Key="media/uploads/a/old.pdf",
+                            UploadId="old",
+                            Initiated=now - timedelta(days=2),
+                        ),
+                        dict(
+                            Key="media/uploads/b/new.pdf", UploadId="new", Initiated=now
+                        ),
+                    ]
+                )
+            ],
+            list_objects_v2=[
+                dict(
+                    Contents=[
+                        dict(
+                            Key="media/uploads/c/old.pdf",
+                            LastModified=now - timedelta(days=2),
+                        ),
+                        dict(Key="media/uploads/d/new.pdf", LastModified=now),
+                    ]
+                ),
+                dict(),
+            ],
+        )
+        client.get_paginator.side_effect = lambda operation: Mock(
+            paginate=Mock(return_value=pages[operation])
+        )
+
+        with patch(
+            "domain_driven_api.infrastructure.storages.upload_handlers.MediaStorage",
+            return_value=storage,
+        ):
+            deleted_count = delete_expired_uploads(max_age=24 * 60 * 60)
+
+        self.assertEqual(deleted_count, 1)
+        client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="media/uploads/a/old.pdf", UploadId="old"
+        )
+        storage.delete_many.assert_called_once_with(["uploads/c/old.pdf"])
+
+
+@override_settings(DOCUMENT_DIRECT_UPLOAD_EXPIRY=60)
+class DirectUploadTests(SimpleTestCase):
+    def setUp(self):
+        self.upload_token = signing.dumps(
+            dict(
+                user_id="user-id",
+                storage_name="uploads/id/report.pdf",
+                file_name="report.pdf",
+            ),
+            salt=UPLOAD_TOKEN_SALT,
+        )
+
+    def test_upload_token_of_another_user_is_rejected(self):
+        with self.assertRaises(DirectUploadException):
+            get_direct_upload(user_id="other-user-id", upload_token=self.upload_token)
+
+    def test_tampered_upload_token_is_rejected(self):
+        with self.assertRaises(DirectUploadException):
+            get_direct_upload(user_id="user-id", upload_token=self.upload_token + "x")
+
+
+@override_settings(ENABLE_AWS_S3_BUCKET=True, AWS_LOCATION="media")
+class StorageNameTests(SimpleTestCase):
+    def test_storage_name_is_read_from_the_bucket_url(self):
+        self.assertEqual(
+            get_storage_name_from_url(
+                "https://bucket.s3.amazonaws.com/media/documents/my%20report.pdf"
+            ),
+            "documents/my report.pdf",
+        )
+        # path-style url of MinIO
+        self.assertEqual(
+            get_storage_name_from_url("http://minio:9000/bucket/media/documents/a.pdf"),
+            "documents/a.pdf",
+        )
+
+    def test_external_link_has_no_storage_name(self):
+        self.assertIsNone(get_storage_name_from_url("https://www.google.com"))
+        self.assertIsNone(get_storage_name_from_url(None))
+
+
+class ContentAddressTests(SimpleTestCase):
+    def test_content_hash_is_computed_and_the_file_rewound(self):
+        file_obj = SimpleUploadedFile("report.pdf", b"%PDF-1.7 content")
+        self.assertEqual(
+            get_content_hash(file_obj), hashlib.sha256(b"%PDF-1.7 content").hexdigest()
+        )
+        self.assertEqual(file_obj.read(), b"%PDF-1.7 content")
+
+    def test_content_address_is_derived_from_the_hash(self):
+        content_hash = hashlib.sha256(b"content").hexdigest()
+        self.assertEqual(
+            get_content_address(content_hash, "Report.PDF"),
+            f"objects/{content_hash[:2]}/{content_hash}.pdf",
+        )
@@ -0,0 +1,316 @@
+import hashlib
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from domain_driven_api.infrastructure.storages.custom_storage import MediaStorage
+from utils.django.exceptions import (
+    FileExtensionNotAllowedException,
+    FileSizeNotAllowedException,
+)
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+# the first bytes of the file types with a signature, the other allowed types are not sniffed
+FILE_SIGNATURES = {
+    "pdf": [b"%PDF"],
+    "png": [b"\x89PNG\r\n\x1a\n"],
+    "jpg": [b"\xff\xd8\xff"],
+    "jpeg": [b"\xff\xd8\xff"],
+    "gif": [b"GIF87a", b"GIF89a"],
+    "docx": [b"PK\x03\x04"],
+    "xlsx": [b"PK\x03\x04"],
+    "pptx": [b"PK\x03\x04"],
+    "zip": [b"PK\x03\x04"],
+    "doc": [b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"],
+    "xls": [b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"],
+    "ppt": [b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"],
+}
+SIGNATURE_LENGTH = max(
+    len(signature) for signatures in FILE_SIGNATURES.values() for signature in signatures
+)
+# the uploaded objects wait under this prefix until the file is saved to its final name, the ones left behind
+# by a failed request or a presigned upload never finalized are deleted by `delete_expired_uploads`
+UPLOAD_PREFIX = "uploads"
+
+
+def get_upload_storage_name(file_name: str) -> str:
+    return f"{UPLOAD_PREFIX}/{uuid.uuid4()}/{os.path.basename(file_name)}"
+
+
+def delete_expired_uploads(max_age: int) -> int:
+    """
+    Deletes the uploaded objects left under UPLOAD_PREFIX for longer than `max_age` seconds, and aborts the
+    multipart uploads started before then.
+
+    A request moves the object it uploaded to its final name, so an object still under the prefix belongs to a
+    request that failed after the upload (invalid data, a permission denial, a missing document) or to a
+    presigned upload that was never finalized.
+
+    Parameters:
+        max_age (int): The age in seconds after which an upload is abandoned.
+
+    Returns:
+        int: The number of objects deleted.
+    """
+    storage = MediaStorage()
+    client = storage.connection.meta.client
+    prefix = storage._normalize_name(f"{UPLOAD_PREFIX}/")
+    expired_before = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+
+    for page in client.get_paginator("list_multipart_uploads").paginate(
+        Bucket=storage.bucket_name, Prefix=prefix
+    ):
+        for upload in page.get("Uploads", []):
+            if upload["Initiated"] < expired_before:
+                client.abort_multipart_upload(
+                    Bucket=storage.bucket_name,
+                    Key=upload["Key"],
+                    UploadId=upload["UploadId"],
+                )
+
+    names = [
+        f"{UPLOAD_PREFIX}/{uploaded_object['Key'][len(prefix):]}"
+        for page in client.get_paginator("list_objects_v2").paginate(
+            Bucket=storage.bucket_name, Prefix=prefix
+        )
+        for uploaded_object in page.get("Contents", [])
+        if uploaded_object["LastModified"] < expired_before
+    ]
+    if not names:
+        return 0
+    failed_names = storage.delete_many(names)
+    if failed_names:
+        log.error(f"could not delete {len(failed_names)} expired uploads")
+    return len(names) - len(failed_names)
+
+
+def get_file_extension(file_name: str) -> str:
+    return file_name.split(".")[-1]
+
+
+def validate_file_extension(file_name: str) -> str:
+    """
+    Validates the extension of a file name against `settings.ALLOWED_FILE_EXTENSIONS` and returns it.
+
+    Raises:
+        FileExtensionNotAllowedException: If the file extension is not allowed.
+    """
+    file_extension = get_file_extension(file_name)
+    if file_extension not in settings.ALLOWED_FILE_EXTENSIONS:
+        raise FileExtensionNotAllowedException(
+            "file-extension-not-allowed-exception",
+            f"{file_extension} type file is not allowed. Please try to upload a different type of file.",
+            log,
+        )
+    return file_extension
+
+
+def validate_file_signature(file_extension: str, first_bytes: bytes) -> None:
+    """
+    Validates that the first bytes of a file match its extension, for the file types with a signature.
+
+    Raises:
+        FileExtensionNotAllowedException: If the content does not match the extension.
+    """
+    signatures = FILE_SIGNATURES.get(file_extension.lower())
+    if signatures and not any(
+        first_bytes.startswith(signature) for signature in signatures
+    ):
+        raise FileExtensionNotAllowedException(
+            "file-extension-not-allowed-exception",
+            f"The content of the file is not a valid {file_extension} file.",
+            log,
+        )
+
+
+def validate_file_size(file_size: int) -> None:
+    """
+    Validates a file size against `settings.DOCUMENT_MAX_UPLOAD_SIZE`.
+
+    Raises:
+        FileSizeNotAllowedException: If the file is too large.
+    """
+    if file_size > settings.DOCUMENT_MAX_UPLOAD_SIZE:
+        raise FileSizeNotAllowedException(
+            "file-size-not-allowed-exception",
+            f"The file is larger than the allowed {settings.DOCUMENT_MAX_UPLOAD_SIZE // (1024 * 1024)} MB.",
+            log,
+        )
+
+
+class StreamedUploadedFile(UploadedFile):
+    """
+    An uploaded file whose content was streamed to the media storage while the request was read.
+
+    The content is not held by the worker; `MediaStorage` stores it with a server side copy of the object,
+    and reading it downloads it from the storage.
+
+    Attributes:
+        storage_name (str): The name of the uploaded object in the media storage.
+        content_hash (str): The hex sha256 of the content, computed while it was streamed, if known.
+    """
+
+    def __init__(
+        self, storage_name, name, content_type, size, charset=None, content_hash=None
+    ):
+        super().__init__(
+            file=None, name=name, content_type=content_type, size=size, charset=charset
+        )
+        self.storage_name = storage_name
+        self.content_hash = content_hash
+
+    def open(self, mode="rb"):
+        self.file = MediaStorage().open(self.storage_name, mode)
+        return self
+
+    def chunks(self, chunk_size=None):
+        if self.file is None:
+            self.open()
+        return super().chunks(chunk_size)
+
+    def read(self, *args, **kwargs):
+        if self.file is None:
+            self.open()
+        return self.file.read(*args, **kwargs)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+
+class S3StreamingUploadHandler(FileUploadHandler):
+    """
+    An upload handler piping the document file of a multipart request into a multipart upload of the media storage.
+
+    The extension is checked from the file name and the request size from its Content-Length before any byte is
+    read, then the content type from the first bytes. The sha256 of the content is computed on the way, for the
+    content addressed storage of the file. Only one part (`settings.DOCUMENT_UPLOAD_PART_SIZE`) is held
+    in memory at a time, whatever the file size. Works with S3 and with MinIO (`ENABLE_MINIO`).
+
+    Attributes:
+        field_names (tuple): The multipart fields streamed to the storage, the other files go to the next handlers.
+    """
+
+    field_names = ("document_file",)
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.storage = MediaStorage()
+        self.part_size = settings.DOCUMENT_UPLOAD_PART_SIZE
+        self.activated = False
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        # rejects the request before reading it, the multipart overhead is negligible
+        if content_length:
+            validate_file_size(int(content_length))
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        self.activated = field_name in self.field_names
+        if not self.activated:
+            return
+        self.file_extension = validate_file_extension(file_name)
+        self.storage_name = get_upload_storage_name(file_name)
+        self.key = self.storage._normalize_name(self.storage_name)
+        self.client = self.storage.connection.meta.client
+        self.upload_id = None
+        self.parts = []
+        self.buffer = bytearray()
+        self.file_size = 0
+        self.signature_checked = False
+        self.content_hash = hashlib.sha256()
+
+    def __start_upload(self):
+        self.upload_id = self.client.create_multipart_upload(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            ContentType=self.content_type or "application/octet-stream",
+        )["UploadId"]
+
+    def __upload_part(self):
+        if self.upload_id is None:
+            self.__start_upload()
+        part_number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=bytes(self.buffer),
+        )
+        self.parts.append(dict(ETag=response["ETag"], PartNumber=part_number))
+        self.buffer.clear()
+
+    def __abort_upload(self):
+        if self.upload_id is not None:
+            self.client.abort_multipart_upload(
+                Bucket=self.storage.bucket_name, Key=self.key, UploadId=self.upload_id
+            )
+            self.upload_id = None
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.activated:
+            return raw_data
+        try:
+            self.file_size += len(raw_data)
+            validate_file_size(self.file_size)
+            self.buffer.extend(raw_data)
+            self.content_hash.update(raw_data)
+            if not self.signature_checked and (
+                len(self.buffer) >= SIGNATURE_LENGTH
+            ):
+                validate_file_signature(self.file_extension, bytes(self.buffer))
+                self.signature_checked = True
+            if len(self.buffer) >= self.part_size:
+                self.__upload_part()
+        except Exception:
+            self.__abort_upload()
+            raise
+        return None
+
+    def file_complete(self, file_size):
+        if not self.activated:
+            return None
+        try:
+            if not self.signature_checked:
+                validate_file_signature(self.file_extension, bytes(self.buffer))
+            if self.upload_id is None:
+                # a single part file, stored with a plain upload
+                self.client.put_object(
+                    Bucket=self.storage.bucket_name,
+                    Key=self.key,
+                    Body=bytes(self.buffer),
+                    ContentType=self.content_type or "application/octet-stream",
+                )
+            else:
+                if self.buffer:
+                    self.__upload_part()
+                self.client.complete_multipart_upload(
+                    Bucket=self.storage.bucket_name,
+                    Key=self.key,
+                    UploadId=self.upload_id,
+                    MultipartUpload=dict(Parts=self.parts),
+                )
+        except Exception:
+            self.__abort_upload()
+            raise
+        self.buffer = bytearray()
+        return StreamedUploadedFile(
+            storage_name=self.storage_name,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_hash=self.content_hash.hexdigest(),
+        )
+
+    def upload_interrupted(self):
+        if self.activated:
+            self.__abort_upload()
@@ -1,34 +1,181 @@
-from typing import List, Any, Dict
+import hashlib
+import json
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Any, Dict, Optional
+from django.conf import settings
+from django.core.cache import caches
 from googletrans import Translator
 from googletrans.constants import LANGUAGES
 from domain_driven_api.infrastructure.logger.models import AttributeLogger
 
 log = AttributeLogger(logging.getLogger(__name__))
 
+TRANSLATION_CATALOG_PATH = Path(__file__).resolve().parent / "catalog.json"
+
+
+class TranslationCache:
+    """
+    TranslationCache class.
+
+    This class caches translations keyed by (message, target_language) on two tiers: an in-process LRU
+    dictionary and a shared Django cache (Redis), so every worker benefits from a translation made once.
+
+    Attributes:
+        max_size (int): The maximum number of translations kept in the in-process tier.
+        timeout (Optional[int]): The expiry in seconds of the translations stored in the shared tier.
+        cache_alias (str): The alias of the Django cache used as the shared tier.
+
+    Methods:
+        get(message: str, target_language: str): Returns the cached translation or None.
+        set(message: str, target_language: str, translation: str): Stores a translation on both tiers.
+        warm_up(catalog: Dict[str, Dict[str, str]]): Loads a catalog of translations into the in-process tier.
+
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.TRANSLATION_CACHE_MAX_SIZE,
+        timeout: Optional[int] = settings.TRANSLATION_CACHE_TIMEOUT,
+        cache_alias: str = settings.TRANSLATION_CACHE_ALIAS,
+    ) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.__local_cache = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __build_key(message: str, target_language: str) -> str:
+        message_hash = hashlib.sha1(message.encode("utf-8")).hexdigest()
+        return f"translation:{target_language}:{message_hash}"
+
+    def __set_local(self, key: str, translation: str) -> None:
+        with self.__lock:
+            self.__local_cache[key] = translation
+            self.__local_cache.move_to_end(key)
+            if len(self.__local_cache) > self.max_size:
+                self.__local_cache.popitem(last=False)
+
+    def get(self, message: str, target_language: str) -> Optional[str]:
+        key = self.__build_key(message=message, target_language=target_language)
+        with self.__lock:
+            if key in self.__local_cache:
+                self.__local_cache.move_to_end(key)
+                return self.__local_cache[key]
+        try:
+            translation = caches[self.cache_alias].get(key)
+        except Exception as e:
+            log.error(f"translation-cache-unavailable: {str(e)}")
+            return None
+        if translation is not None:
+            self.__set_local(key=key, translation=translation)
+        return translation
+
+    def set(self, message: str, target_language: str, translation: str) -> None:
+        key = self.__build_key(message=message, target_language=target_language)
+        self.__set_local(key=key, translation=translation)
+        try:
+            caches[self.cache_alias].set(key, translation, timeout=self.timeout)
+        except Exception as e:
+            log.error(f"translation-cache-unavailable: {str(e)}")
+
+    def warm_up(self, catalog: Dict[str, Dict[str, str]]) -> None:
+        for target_language, translations in catalog.items():
+            for message, translation in translations.items():
+                self.__set_local(
+                    key=self.__build_key(
+                        message=message, target_language=target_language
+                    ),
+                    translation=translation,
+                )
+
+
+def load_translation_catalog() -> Dict[str, Dict[str, str]]:
+    """
+    Load the local catalog of translations of the fixed messages returned by the views.
+
+    :return: A dictionary in the format {'language_code': {'message': 'translated_message'}}.
+    """
+    try:
+        with open(TRANSLATION_CATALOG_PATH, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        log.error(f"translation-catalog-not-loaded: {str(e)}")
+        return {}
+
 
 class CustomTranslator:
     """
     CustomTranslator class.
 
     This class provides methods for translating text into multiple target languages using Google Translate.
+    Translations are served from a TranslationCache warmed up with the local catalog; messages missing from
+    the cache are returned untranslated and translated remotely in the background for the next responses.
 
     Attributes:
         __language_dict (Dict[str, str]): A dictionary containing language codes and their corresponding names.
+        translation_cache (TranslationCache): The cache shared by every CustomTranslator of the process.
 
     Methods:
         __init__(): Initializes the CustomTranslator object.
         __check_language_availability(language: str): Checks if a given language is available for translation.
+        translate_text(text: str, target_language: str): Translates a text with Google Translate and caches it.
         translate_response(translating_data: Dict[str, Any], target_language: str, translation_keys: List[Any]): Translates a text into multiple target languages.
 
     """
 
+    SOURCE_LANGUAGE = "en"
+
+    translation_cache = TranslationCache()
+    translation_cache.warm_up(catalog=load_translation_catalog())
+
+    __executor = ThreadPoolExecutor(
+        max_workers=settings.TRANSLATION_REMOTE_WORKERS,
+        thread_name_prefix="translator",
+    )
+    __pending_translations = set()
+    __pending_lock = threading.Lock()
+
     def __init__(self) -> None:
         self.__language_dict = LANGUAGES
 
     def __check_language_availability(self, language: str):
         return language in self.__language_dict.keys()
 
+    def translate_text(self, text: str, target_language: str) -> str:
+        """
+        Translate a text with Google Translate, blocking on the remote call, and store it in the cache.
+
+        :param text: The text to be translated.
+        :param target_language: The language code of the target language.
+        :return: The translated text.
+        """
+        translation = Translator().translate(text, dest=target_language).text
+        self.translation_cache.set(
+            message=text, target_language=target_language, translation=translation
+        )
+        return translation
+
+    def __translate_in_background(self, text: str, target_language: str) -> None:
+        try:
+            self.translate_text(text=text, target_language=target_language)
+        except Exception as e:
+            log.error(f"remote-translation-failed: {str(e)}")
+        finally:
+            with self.__pending_lock:
+                self.__pending_translations.discard((text, target_language))
+
+    def __schedule_translation(self, text: str, target_language: str) -> None:
+        with self.__pending_lock:
+            if (text, target_language) in self.__pending_translations:
+                return
+            self.__pending_translations.add((text, target_language))
+        self.__executor.submit(self.__translate_in_background, text, target_language)
+
     def translate_response(
         self,
         translating_data: Dict[str, Any],
@@ -43,13 +190,24 @@ class CustomTranslator:
                                 For example: ['fr', 'es', 'ja'] for French, Spanish, and Japanese.
         :return: A dictionary containing the translations in the format {'language_code': 'translated_text'}.
         """
-        translator = Translator()
+        if not isinstance(translating_data, dict):
+            return translating_data
         if not self.__check_language_availability(language=target_language):
-            target_language = "en"
+            target_language = self.SOURCE_LANGUAGE
+        if target_language == self.SOURCE_LANGUAGE:
+            return translating_data
         for data in translating_data:
             if data in translation_keys:
-                translation = translator.translate(
-                    translating_data[data], dest=target_language
+                text = translating_data[data]
+                if not isinstance(text, str) or not text:
+                    continue
+                translation = self.translation_cache.get(
+                    message=text, target_language=target_language
                 )
-                translating_data[data] = translation.text
+                if translation is None:
+                    self.__schedule_translation(
+                        text=text, target_language=target_language
+                    )
+                    continue
+                translating_data[data] = translation
         return translating_data
@@ -0,0 +1,56 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from .services import CustomTranslator, TranslationCache
+
+
+class TranslationCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.translation_cache = TranslationCache(max_size=2)
+
+    def test_get_returns_stored_translation(self):
+        self.translation_cache.set(
+            message="Invalid data", target_language="de", translation="Ungültige Daten"
+        )
+        self.assertEqual(
+            self.translation_cache.get(message="Invalid data", target_language="de"),
+            "Ungültige Daten",
+        )
+        self.assertIsNone(
+            self.translation_cache.get(message="Invalid data", target_language="fr")
+        )
+
+    def test_shared_tier_serves_translations_evicted_from_local_tier(self):
+        for index in range(3):
+            self.translation_cache.set(
+                message=f"message {index}",
+                target_language="de",
+                translation=f"Nachricht {index}",
+            )
+        self.assertEqual(
+            TranslationCache(max_size=2).get(message="message 0", target_language="de"),
+            "Nachricht 0",
+        )
+
+
+class CustomTranslatorTests(SimpleTestCase):
+    def test_known_message_is_translated_without_remote_call(self):
+        with mock.patch(
+            "domain_driven_api.infrastructure.translator.services.Translator"
+        ) as translator_class:
+            data = CustomTranslator().translate_response(
+                translating_data={"message": "Successfully listed all documents."},
+                target_language="de",
+                translation_keys=["message"],
+            )
+        translator_class.assert_not_called()
+        self.assertEqual(data["message"], "Alle Dokumente erfolgreich aufgelistet.")
+
+    def test_english_response_is_left_untouched(self):
+        data = CustomTranslator().translate_response(
+            translating_data={"message": "Document not found"},
+            target_language="en",
+            translation_keys=["message"],
+        )
+        self.assertEqual(data["message"], "Document not found")
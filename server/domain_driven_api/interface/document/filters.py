@@ -1,8 +1,6 @@
-import re
 import django_filters
-from django.db.models import Q, Case, Value, When, IntegerField, Subquery, OuterRef
+from django.db.models import Q
 from domain_driven_api.domain.document.models import Document
-from domain_driven_api.domain.user.models import User
 
 
 class DocumentFilters(django_filters.FilterSet):
@@ -55,7 +53,7 @@ class DocumentFilters(django_filters.FilterSet):
         :return: The filtered queryset.
         """
         priority = value.strip().split(",")
-        return queryset.filter(Q(priority__in=priority)).distinct()
+        return queryset.filter(Q(priority__in=priority))
 
     def status_filter(self, queryset, name, value):
         """
@@ -67,70 +65,49 @@ class DocumentFilters(django_filters.FilterSet):
         :return: The filtered queryset.
         """
         status = value.strip().split(",")
-        return queryset.filter(Q(status__in=status)).distinct()
+        return queryset.filter(Q(status__in=status))
+
+    # sort_by values ordered by a stored sort key instead of the raw column
+    SORT_KEYS = {"priority": "priority_rank", "status": "status_rank"}
 
     def sort_by_filter(self, queryset, name, value):
         """
         Filter the queryset based on the sort_by field.
 
+        Priority, status and owner name are ordered by the indexed sort keys stored on the document.
+
         :param queryset: The queryset to be filtered.
         :param name: The name of the filter field.
         :param value: The value of the filter field.
         :return: The filtered queryset.
         """
-        if re.search(r"(?:-)?status", value):
-            status_case = Case(
-                When(priority="Private", then=Value(0)),
-                When(priority="Shared", then=Value(1)),
-                default=Value(2),
-                output_field=IntegerField(),
-            )
-            if value == "status":
-                sortable = status_case
-                return queryset.order_by(
-                    sortable,
-                    "status",
-                )
-            elif value == "-status":
-                sortable = -status_case
-                return queryset.order_by(
-                    sortable,
-                    "-status",
-                )
-            else:
-                return queryset.order_by(value)
-
-        if re.search(r"(?:-)?owner", value):
-            return queryset.annotate(
-                owner_name=Subquery(
-                    User.objects.filter(id=OuterRef("owner")).values(
-                        "first_name", isForSubQuery=True
-                    )
-                )
-            ).order_by(value)
-
-        priority_case = Case(
-            When(priority="Low", then=Value(0)),
-            When(priority="Medium", then=Value(1)),
-            When(priority="High", then=Value(2)),
-            default=Value(3),
-            output_field=IntegerField(),
+        field = value.strip()
+        descending = field.startswith("-")
+        field = field.lstrip("-")
+        field = self.SORT_KEYS.get(field, field)
+        return self.order_with_tiebreaker(
+            queryset, f"-{field}" if descending else field
         )
 
-        if value == "priority":
-            sortable = priority_case
-            return queryset.order_by(
-                sortable,
-                "priority",
-            )
-        elif value == "-priority":
-            sortable = -priority_case
-            return queryset.order_by(
-                sortable,
-                "-priority",
-            )
-        else:
-            return queryset.order_by(value)
+    @staticmethod
+    def order_with_tiebreaker(queryset, value):
+        """
+        Order the queryset by a named field, then by created_at and id in the same direction.
+
+        The tiebreaker makes the ordering total, which the cursor pagination needs to continue a page
+        from the sort key of its last row, and keeps a single direction so that one index serves both
+        the ascending and the descending sort.
+
+        :param queryset: The queryset to be ordered.
+        :param value: The field name, prefixed by "-" for a descending order.
+        :return: The ordered queryset.
+        """
+        prefix = "-" if value.startswith("-") else ""
+        ordering = [value]
+        for tiebreaker in ("created_at", "id"):
+            if value.lstrip("-") != tiebreaker:
+                ordering.append(f"{prefix}{tiebreaker}")
+        return queryset.order_by(*ordering)
 
     def responsible_person_filter(self, queryset, name, value):
         """
@@ -143,4 +120,4 @@ class DocumentFilters(django_filters.FilterSet):
         """
         responsible_person_ids = value.strip().split(",")
         responsible_person_ids = [ids.strip() for ids in responsible_person_ids]
-        return queryset.filter(Q(owner__in=responsible_person_ids)).distinct()
+        return queryset.filter(Q(owner__in=responsible_person_ids))
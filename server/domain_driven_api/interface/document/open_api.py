@@ -64,6 +64,33 @@ direct_report_param = OpenApiParameter(
     examples=None,
 )
 
+pagination_param = OpenApiParameter(
+    name="pagination",
+    type=str,
+    location=OpenApiParameter.QUERY,
+    description="pagination mode, `cursor` pages with the `next` and `previous` links instead of page numbers",
+    examples=[OpenApiExample("cursor", value="cursor")],
+)
+
+cursor_param = OpenApiParameter(
+    name="cursor",
+    type=str,
+    location=OpenApiParameter.QUERY,
+    description="opaque cursor taken from the `next` or `previous` link, with `pagination=cursor`",
+)
+
+count_param = OpenApiParameter(
+    name="count",
+    type=str,
+    location=OpenApiParameter.QUERY,
+    description="how the total is computed with `pagination=cursor`: `none` (default), `approximate` or `exact`",
+    examples=[
+        OpenApiExample("none", value="none"),
+        OpenApiExample("approximate", value="approximate"),
+        OpenApiExample("exact", value="exact"),
+    ],
+)
+
 document_create_extension = custom_extend_schema(
     tags=document_tags,
     request={
@@ -93,10 +120,19 @@ document_list_extension = custom_extend_schema(
         direct_report_param,
         responsible_person_param,
         company_id,
+        pagination_param,
+        cursor_param,
+        count_param,
     ],
     paginator=True,
 )
 
+document_retrieve_extension = custom_extend_schema(
+    tags=document_tags,
+    parameters=[direct_report_param, company_id],
+    responses={200: DocumentRetrieveSerializer, 304: None},
+)
+
 document_update_extension = custom_extend_schema(
     tags=document_tags,
     request={
@@ -119,3 +155,160 @@ document_update_extension = custom_extend_schema(
 delete_document_extension = custom_extend_schema(
     tags=document_tags, parameters=[company_id], responses={200: {}}
 )
+
+document_permission_status_extension = custom_extend_schema(
+    tags=document_tags,
+    parameters=[company_id],
+    responses={
+        200: {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "permission_propagation_status": {
+                    "type": "string",
+                    "enum": ["Pending", "Completed", "Failed"],
+                },
+            },
+        }
+    },
+)
+
+document_upload_url_extension = custom_extend_schema(
+    tags=document_tags,
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "file_name": {"type": "string"},
+                "content_type": {"type": "string"},
+            },
+            "required": ["file_name"],
+        }
+    },
+    responses={
+        200: {
+            "type": "object",
+            "properties": {
+                "upload_url": {"type": "string"},
+                "fields": {"type": "object"},
+                "upload_token": {"type": "string"},
+                "expires_in": {"type": "integer"},
+            },
+        }
+    },
+)
+
+document_finalize_upload_extension = custom_extend_schema(
+    tags=document_tags,
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "priority": {"type": "string", "enum": ["High", "Medium", "Low"]},
+                "status": {"type": "string", "enum": ["Private", "Shared"]},
+                "owner": {"type": "string"},
+                "upload_token": {"type": "string"},
+            },
+            "required": ["title", "priority", "status", "upload_token"],
+        }
+    },
+    parameters=[company_id],
+    responses={200: DocumentRetrieveSerializer},
+)
+
+document_bulk_results = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "success": {"type": "boolean"},
+                    "id": {"type": "string"},
+                    "status_code": {"type": "integer"},
+                    "message": {"type": "string"},
+                    "errors": {"type": "object"},
+                },
+            },
+        }
+    },
+}
+
+document_bulk_create_extension = custom_extend_schema(
+    tags=document_tags,
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "documents": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string"},
+                            "priority": {
+                                "type": "string",
+                                "enum": ["High", "Medium", "Low"],
+                            },
+                            "status": {"type": "string", "enum": ["Private", "Shared"]},
+                            "link": {"type": "string"},
+                            "owner": {"type": "string"},
+                        },
+                        "required": ["title", "priority", "status", "link"],
+                    },
+                }
+            },
+            "required": ["documents"],
+        }
+    },
+    parameters=[company_id],
+    responses={200: document_bulk_results},
+)
+
+document_bulk_update_extension = custom_extend_schema(
+    tags=document_tags,
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "documents": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "title": {"type": "string"},
+                            "priority": {
+                                "type": "string",
+                                "enum": ["High", "Medium", "Low"],
+                            },
+                            "status": {"type": "string", "enum": ["Private", "Shared"]},
+                            "link": {"type": "string"},
+                            "owner": {"type": "string"},
+                        },
+                        "required": ["id"],
+                    },
+                }
+            },
+            "required": ["documents"],
+        }
+    },
+    parameters=[company_id],
+    responses={200: document_bulk_results},
+)
+
+document_bulk_delete_extension = custom_extend_schema(
+    tags=document_tags,
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {"ids": {"type": "array", "items": {"type": "string"}}},
+            "required": ["ids"],
+        }
+    },
+    parameters=[company_id],
+    responses={200: document_bulk_results},
+)
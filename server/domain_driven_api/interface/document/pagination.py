@@ -1,4 +1,17 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from utils.django.queryset_helpers import estimate_queryset_count
 
 
 class DocumentPagination(PageNumberPagination):
@@ -17,3 +30,184 @@ class DocumentPagination(PageNumberPagination):
     page_size = 5
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class DocumentCursorPagination(BasePagination):
+    """
+    A keyset (cursor) pagination class for paginating documents.
+
+    Instead of counting the queryset and skipping rows with OFFSET, every page continues from the sort key
+    of the last row of the previous page, so deep pages cost the same as the first one. The sort key is the
+    ordering of the queryset, e.g. ("-created_at", "-id") by default, or the sort key selected by
+    `DocumentFilters.sort_by_filter`; it must end with a unique field.
+
+    Attributes:
+        page_size (int): The number of documents to include on each page. Default is 5.
+        page_size_query_param (str): The query parameter to specify the page size. Default is "page_size".
+        max_page_size (int): The maximum number of documents allowed on a single page. Default is 100.
+        cursor_query_param (str): The query parameter holding the cursor. Default is "cursor".
+        count_query_param (str): The query parameter selecting how the total is computed: "none" (default) skips it, "approximate" estimates it from the query planner and "exact" counts it.
+
+    Methods:
+        paginate_queryset(queryset, request, view): Returns the documents of the requested page.
+        get_paginated_response(data): Returns the response with the count, the next and previous links and the results.
+    """
+
+    page_size = 5
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+
+    COUNT_NONE = "none"
+    COUNT_APPROXIMATE = "approximate"
+    COUNT_EXACT = "exact"
+
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request) -> int:
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    @staticmethod
+    def get_ordering(queryset) -> List[Tuple[str, bool]]:
+        """
+        Returns the ordering of the queryset as a list of (field name, descending) tuples.
+        """
+        ordering = []
+        for field in queryset.query.order_by:
+            if not isinstance(field, str):
+                raise ValueError(
+                    "Cursor pagination needs an ordering made of field or annotation names."
+                )
+            ordering.append((field.lstrip("-"), field.startswith("-")))
+        if not any(name in ("id", "pk") for name, _ in ordering):
+            ordering.append(("id", True))
+        return ordering
+
+    def encode_cursor(self, position: List[Any], reverse: bool) -> str:
+        payload = json.dumps(dict(p=position, r=reverse), default=str)
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request) -> Optional[Tuple[List[Any], bool]]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position, reverse = payload["p"], bool(payload["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    @staticmethod
+    def _equal(name: str, value: Any) -> Q:
+        return Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+
+    @staticmethod
+    def _after(name: str, value: Any, descending: bool) -> Q:
+        # Postgres sorts NULLs last in ascending and first in descending order
+        if descending:
+            if value is None:
+                return Q(**{f"{name}__isnull": False})
+            return Q(**{f"{name}__lt": value})
+        if value is None:
+            return Q(pk__in=[])
+        return Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
+
+    def build_keyset_filter(self, position: List[Any], reverse: bool) -> Q:
+        """
+        Builds the filter selecting the rows placed after the position, in the scan direction.
+        """
+        keyset_filter = Q(pk__in=[])
+        preceding_fields_equal = Q()
+        for (name, descending), value in zip(self.ordering, position):
+            keyset_filter |= preceding_fields_equal & self._after(
+                name=name, value=value, descending=descending != reverse
+            )
+            preceding_fields_equal &= self._equal(name=name, value=value)
+        return keyset_filter
+
+    def get_count(self, queryset, request) -> Optional[int]:
+        count = request.query_params.get(self.count_query_param, self.COUNT_NONE)
+        if count == self.COUNT_EXACT:
+            return queryset.count()
+        if count == self.COUNT_APPROXIMATE:
+            return estimate_queryset_count(queryset)
+        return None
+
+    def get_position(self, document) -> List[Any]:
+        return [getattr(document, name) for name, _ in self.ordering]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        self.count = self.get_count(queryset, request)
+
+        reverse = False
+        if cursor:
+            position, reverse = cursor
+            queryset = queryset.filter(
+                self.build_keyset_filter(position=position, reverse=reverse)
+            )
+        if reverse:
+            queryset = queryset.order_by(
+                *[
+                    name if descending else f"-{name}"
+                    for name, descending in self.ordering
+                ]
+            )
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = cursor is not None if not reverse else has_more
+        self.next_position = self.get_position(results[-1]) if results else None
+        self.previous_position = self.get_position(results[0]) if results else None
+        return results
+
+    def get_link(self, position: Optional[List[Any]], reverse: bool) -> Optional[str]:
+        if position is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), "page")
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.encode_cursor(position=position, reverse=reverse),
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        return self.get_link(position=self.next_position, reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        return self.get_link(position=self.previous_position, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
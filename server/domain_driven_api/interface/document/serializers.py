@@ -1,7 +1,9 @@
 # django imports
+from django.conf import settings
 from rest_framework import serializers
 from domain_driven_api.domain.document.models import Document
 from domain_driven_api.application.user.services import UserAppServices
+from domain_driven_api.infrastructure.service_container.services import get_service
 from domain_driven_api.interface.initiative.serializers import (
     ResponsiblePersonSerializer,
 )
@@ -37,11 +39,50 @@ class DocumentCreateSerializer(serializers.ModelSerializer):
         extra_kwargs = {"link": {"required": False}, "owner": {"required": False}}
 
 
+class DocumentUploadUrlSerializer(serializers.Serializer):
+    """
+    A serializer class for requesting the presigned upload of a document file.
+
+    Attributes:
+        file_name (CharField): The name of the file to upload, its extension is validated.
+        content_type (CharField): The content type the file will be uploaded with, optional.
+
+    """
+
+    file_name = serializers.CharField(max_length=255)
+    content_type = serializers.CharField(max_length=255, required=False)
+
+
+class DocumentFinalizeUploadSerializer(serializers.ModelSerializer):
+    """
+    A serializer class for creating a document from a file uploaded straight to the bucket.
+
+    It validates the same fields as DocumentCreateSerializer, without `link` since the uploaded file is the
+    document, and with the `upload_token` returned with the upload url.
+
+    Attributes:
+        upload_token (CharField): The token of the presigned upload.
+
+    Meta:
+        model (Document): The Document model that the serializer is based on.
+        fields (list): The fields to validate.
+        extra_kwargs (dict): Additional keyword arguments for the serializer fields.
+
+    """
+
+    upload_token = serializers.CharField()
+
+    class Meta:
+        model = Document
+        fields = ["title", "priority", "status", "owner", "upload_token"]
+        extra_kwargs = {"owner": {"required": False}}
+
+
 class DocumentRetrieveSerializer(serializers.ModelSerializer):
     """
     A serializer class for retrieving a document.
 
-    This serializer is used to convert the Document model instance into a JSON representation for retrieving a document. It includes the fields 'id', 'title', 'priority', 'status', 'owner', 'link', 'is_file_uploaded', and 'file_name'.
+    This serializer is used to convert the Document model instance into a JSON representation for retrieving a document. It includes the fields 'id', 'title', 'priority', 'status', 'owner', 'link', 'is_file_uploaded', 'file_name', and 'permission_propagation_status'.
 
     Attributes:
         owner (SerializerMethodField): A serializer method field that retrieves the owner of the document.
@@ -58,7 +99,7 @@ class DocumentRetrieveSerializer(serializers.ModelSerializer):
     owner = serializers.SerializerMethodField()
 
     def get_owner(self, obj):
-        user_app_services = UserAppServices(log=self.context["log"])
+        user_app_services = get_service(UserAppServices, log=self.context["log"])
         return ResponsiblePersonSerializer(
             instance=user_app_services.get_user_by_pk(pk=obj.owner),
             context={"log": self.context["log"]},
@@ -75,9 +116,35 @@ class DocumentRetrieveSerializer(serializers.ModelSerializer):
             "link",
             "is_file_uploaded",
             "file_name",
+            "permission_propagation_status",
         ]
 
 
+class DocumentOwnerListSerializer(serializers.ListSerializer):
+    """
+    A list serializer that resolves the owners of a page of documents in one query.
+
+    Before the documents are serialized, it collects every owner ID of the page, fetches those users at once and serializes them with a single ResponsiblePersonSerializer pass. The result is stored in the context under "owners", keyed by owner ID, where the child serializer picks it up.
+
+    Methods:
+        to_representation(data): Resolves the owners of the page and serializes the documents.
+
+    """
+
+    def to_representation(self, data):
+        documents = list(data.all() if hasattr(data, "all") else data)
+        owner_ids = {str(document.owner) for document in documents}
+        user_app_services = get_service(UserAppServices, log=self.context["log"])
+        users = list(user_app_services.list_users().filter(id__in=owner_ids))
+        owners = ResponsiblePersonSerializer(
+            instance=users, many=True, context={"log": self.context["log"]}
+        ).data
+        self.context["owners"] = {
+            str(user.id): owner for user, owner in zip(users, owners)
+        }
+        return super().to_representation(documents)
+
+
 class DocumentListSerializer(DocumentRetrieveSerializer):
     """
     A serializer class for listing documents.
@@ -87,16 +154,27 @@ class DocumentListSerializer(DocumentRetrieveSerializer):
     Attributes:
         permissions (JSONField): A field that represents the permissions associated with the document.
 
+    Methods:
+        get_owner(obj): Retrieves the owner of the document from the owners resolved for the whole page, falling back to a single lookup.
+
     Meta:
         model (Document): The model class that the serializer is based on.
         fields (list): The fields to include in the serialized representation of the document, including the 'permissions' field.
+        list_serializer_class (DocumentOwnerListSerializer): The list serializer resolving the owners of a page in one query.
 
     """
 
     permissions = serializers.JSONField()
 
+    def get_owner(self, obj):
+        owners = self.context.get("owners")
+        if owners is None:
+            return super().get_owner(obj)
+        return owners.get(str(obj.owner))
+
     class Meta(DocumentRetrieveSerializer.Meta):
         fields = DocumentRetrieveSerializer.Meta.fields + ["permissions"]
+        list_serializer_class = DocumentOwnerListSerializer
 
 
 class DocumentUpdateSerializer(serializers.ModelSerializer):
@@ -122,3 +200,65 @@ class DocumentUpdateSerializer(serializers.ModelSerializer):
             "link": {"required": False},
             "owner": {"required": False},
         }
+
+
+class DocumentBulkUpdateItemSerializer(DocumentUpdateSerializer):
+    """
+    A serializer class for one update of a bulk update, the fields of DocumentUpdateSerializer with the `id` of the document.
+
+    Attributes:
+        id (UUIDField): The ID of the document to update.
+
+    """
+
+    id = serializers.UUIDField()
+
+    class Meta(DocumentUpdateSerializer.Meta):
+        fields = ["id"] + DocumentUpdateSerializer.Meta.fields
+
+
+class DocumentBulkSerializer(serializers.Serializer):
+    """
+    A serializer class for the body of a bulk create or update of documents.
+
+    Only the envelope is validated here; each item is validated on its own by the view, so an invalid item is
+    reported in its result instead of failing the whole request.
+
+    Attributes:
+        documents (ListField): The items, at most `settings.DOCUMENT_BULK_MAX_ITEMS`.
+
+    Methods:
+        validate_documents(value): Validates the number of items.
+
+    """
+
+    documents = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+    def validate_documents(self, value):
+        if len(value) > settings.DOCUMENT_BULK_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"Ensure this field has no more than {settings.DOCUMENT_BULK_MAX_ITEMS} elements."
+            )
+        return value
+
+
+class DocumentBulkDeleteSerializer(serializers.Serializer):
+    """
+    A serializer class for the body of a bulk delete of documents.
+
+    Attributes:
+        ids (ListField): The IDs of the documents to delete, at most `settings.DOCUMENT_BULK_MAX_ITEMS`.
+
+    Methods:
+        validate_ids(value): Validates the number of IDs.
+
+    """
+
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+
+    def validate_ids(self, value):
+        if len(value) > settings.DOCUMENT_BULK_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"Ensure this field has no more than {settings.DOCUMENT_BULK_MAX_ITEMS} elements."
+            )
+        return value
@@ -1,6 +1,11 @@
 import logging
+from urllib.parse import parse_qs, urlparse
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework.test import APITestCase, APIRequestFactory, force_authenticate
+from domain_driven_api.domain.document.models import Document
 from domain_driven_api.domain.user.models import UserBasePermissions, UserPersonalData
 from .views import DocumentViewSet
 from domain_driven_api.domain.user.services import UserServices
@@ -65,6 +70,9 @@ class DocumentViewSetTestCases(APITestCase):
         test_list_document(): Test case for the list method of the DocumentViewSet class.
         test_update_document(): Test case for the update method of the DocumentViewSet class.
         test_delete_document(): Test case for the delete_document method of the DocumentViewSet class.
+        test_bulk_create_document(): Test case for the bulk_create method of the DocumentViewSet class.
+        test_bulk_update_document(): Test case for the bulk_update method of the DocumentViewSet class.
+        test_bulk_delete_document(): Test case for the bulk_delete method of the DocumentViewSet class.
     """
 
     @classmethod
@@ -160,6 +168,7 @@ class DocumentViewSetTestCases(APITestCase):
             "link",
             "is_file_uploaded",
             "file_name",
+            "permission_propagation_status",
         ]
         document_data = {
             "title": "Test Doc",
@@ -226,6 +235,165 @@ class DocumentViewSetTestCases(APITestCase):
         response = self.document_view_set.as_view({"get": "list"})(request)
         self.assertEquals(response.status_code, 401)
 
+    def test_list_document_query_count_does_not_grow_with_page(self):
+        document_data = {
+            "title": "Test Doc",
+            "priority": "High",
+            "status": "Private",
+            "link": "https://www.google.com/",
+        }
+        query_params_data = dict(direct_report=str(self.direct_report.id), page_size=100)
+
+        def count_list_queries():
+            request = self.factory.get("/api/v0/document/", query_params_data)
+            force_authenticate(request=request, user=self.user_obj)
+            with CaptureQueriesContext(connection) as context:
+                response = self.document_view_set.as_view({"get": "list"})(request)
+            self.assertEquals(response.status_code, 200)
+            return len(context.captured_queries)
+
+        self.document_app_service.create_document_from_dict(
+            user=self.user_obj, data=document_data
+        )
+        queries_for_one_document = count_list_queries()
+        for _ in range(5):
+            self.document_app_service.create_document_from_dict(
+                user=self.user_obj, data=document_data
+            )
+        self.assertEquals(count_list_queries(), queries_for_one_document)
+
+    def test_list_document_cursor_pagination(self):
+        for index in range(7):
+            self.document_app_service.create_document_from_dict(
+                user=self.user_obj,
+                data={
+                    "title": f"Test Doc {index}",
+                    "priority": ["High", "Medium", "Low"][index % 3],
+                    "status": "Shared",
+                    "link": "https://www.google.com/",
+                },
+            )
+
+        def list_page(**query_params):
+            query_params_data = dict(
+                direct_report=str(self.direct_report.id),
+                pagination="cursor",
+                page_size=3,
+                **query_params,
+            )
+            request = self.factory.get("/api/v0/document/", query_params_data)
+            force_authenticate(request=request, user=self.user_obj)
+            response = self.document_view_set.as_view({"get": "list"})(request)
+            self.assertEquals(response.status_code, 200)
+            return response.data.get("data")
+
+        def cursor_of(link):
+            return parse_qs(urlparse(link).query)["cursor"][0]
+
+        for sort_by in ("-created_at", "priority", "-status", "owner_name"):
+            page = list_page(sort_by=sort_by, count="exact")
+            self.assertEquals(page["count"], 7)
+            self.assertIsNone(page["previous"])
+            first_page_ids = [document["id"] for document in page["results"]]
+            listed_ids = list(first_page_ids)
+            while page["next"]:
+                page = list_page(sort_by=sort_by, cursor=cursor_of(page["next"]))
+                self.assertIsNone(page["count"])
+                listed_ids += [document["id"] for document in page["results"]]
+            self.assertEquals(len(listed_ids), 7)
+            self.assertEquals(len(set(listed_ids)), 7)
+
+            second_page = list_page(
+                sort_by=sort_by, cursor=cursor_of(list_page(sort_by=sort_by)["next"])
+            )
+            previous_page = list_page(
+                sort_by=sort_by, cursor=cursor_of(second_page["previous"])
+            )
+            self.assertListEqual(
+                [document["id"] for document in previous_page["results"]],
+                first_page_ids,
+            )
+
+        # list with a broken cursor
+        request = self.factory.get(
+            "/api/v0/document/",
+            dict(
+                direct_report=str(self.direct_report.id),
+                pagination="cursor",
+                cursor="broken",
+            ),
+        )
+        force_authenticate(request=request, user=self.user_obj)
+        response = self.document_view_set.as_view({"get": "list"})(request)
+        self.assertEquals(response.status_code, 404)
+
+    def test_list_document_conditional_get(self):
+        document_data = {
+            "title": "Test Doc",
+            "priority": "High",
+            "status": "Private",
+            "link": "https://www.google.com/",
+        }
+        document = self.document_app_service.create_document_from_dict(
+            user=self.user_obj, data=document_data
+        )
+        query_params_data = dict(direct_report=str(self.direct_report.id))
+
+        def get(action, headers=None, **kwargs):
+            request = self.factory.get(
+                "/api/v0/document/", query_params_data, **(headers or {})
+            )
+            force_authenticate(request=request, user=self.user_obj)
+            return self.document_view_set.as_view({"get": action})(request, **kwargs)
+
+        response = get("list")
+        self.assertEquals(response.status_code, 200)
+        etag = response.headers["ETag"]
+        # a deletion may not move the latest modification, the list is only validated with its ETag
+        self.assertNotIn("Last-Modified", response.headers)
+        self.assertEquals(
+            get(
+                "list", dict(HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+            ).status_code,
+            200,
+        )
+
+        # an unchanged list is not serialized again
+        with CaptureQueriesContext(connection) as context:
+            response = get("list", dict(HTTP_IF_NONE_MATCH=etag))
+        self.assertEquals(response.status_code, 304)
+        self.assertEquals(response.headers["ETag"], etag)
+        self.assertFalse(
+            any(
+                'FROM "document"' in query["sql"] and "MAX(" not in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+
+        # a changed document changes the validators
+        self.document_app_service.update_document_from_dict(
+            user=self.user_obj, data=dict(title="New Title"), document_id=document.id
+        )
+        response = get("list", dict(HTTP_IF_NONE_MATCH=etag))
+        self.assertEquals(response.status_code, 200)
+
+        # a changed owner changes the validators, the owners are listed with the documents
+        etag = response.headers["ETag"]
+        UserServices().get_user_repo().filter(id=self.user_obj.id).update(
+            last_name="Renamed", modified_at=timezone.now()
+        )
+        self.assertEquals(get("list", dict(HTTP_IF_NONE_MATCH=etag)).status_code, 200)
+
+        response = get("retrieve", pk=str(document.id))
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.data.get("data")["title"], "New Title")
+        response = get(
+            "retrieve",
+            dict(HTTP_IF_NONE_MATCH=response.headers["ETag"]),
+            pk=str(document.id),
+        )
+        self.assertEquals(response.status_code, 304)
+
     def test_update_document(self):
         expected_response_keys = [
             "id",
@@ -236,6 +404,7 @@ class DocumentViewSetTestCases(APITestCase):
             "link",
             "is_file_uploaded",
             "file_name",
+            "permission_propagation_status",
         ]
         document_data = {
             "title": "Test Doc",
@@ -329,3 +498,146 @@ class DocumentViewSetTestCases(APITestCase):
             request, pk="3fa85f64-5717-4562-b3fc-2c963f66afa6"
         )
         self.assertEquals(response.status_code, 401)
+
+    def post_bulk(self, action, data, authenticate=True):
+        request = self.factory.post(
+            f"/api/v0/document/{action.replace('_', '-')}/", data, format="json"
+        )
+        if authenticate:
+            force_authenticate(request=request, user=self.user_obj)
+        return self.document_view_set.as_view({"post": action})(request)
+
+    def create_documents(self, *titles):
+        return [
+            self.document_app_service.create_document_from_dict(
+                user=self.user_obj,
+                data=dict(
+                    title=title,
+                    priority="High",
+                    status="Private",
+                    link="https://www.google.com/",
+                ),
+            )
+            for title in titles
+        ]
+
+    def test_bulk_create_document(self):
+        valid_document = dict(
+            title="Test Doc",
+            priority="High",
+            status="Private",
+            link="https://www.google.com/",
+        )
+        response = self.post_bulk(
+            "bulk_create",
+            dict(
+                documents=[
+                    valid_document,
+                    dict(valid_document, priority="Wrong"),
+                    dict(title="Test Doc", priority="High", status="Private"),
+                ]
+            ),
+        )
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.data.get("message"), "Successfully created documents.")
+        self.assertTrue(response.data.get("is_partially_processed"))
+        results = response.data["data"]["results"]
+        self.assertListEqual([result["index"] for result in results], [0, 1, 2])
+        self.assertListEqual(
+            [result["success"] for result in results], [True, False, False]
+        )
+        self.assertTrue(Document.objects.filter(id=results[0]["id"]).exists())
+        # the invalid item is reported with the serializer errors
+        self.assertEquals(results[1]["message"], "Invalid data")
+        self.assertIn("priority", results[1]["errors"])
+        self.assertEquals(results[2]["status_code"], 400)
+
+        # none of the documents is valid
+        response = self.post_bulk(
+            "bulk_create", dict(documents=[dict(valid_document, status="Important")])
+        )
+        self.assertEquals(response.status_code, 400)
+        self.assertEquals(
+            response.data.get("message"), "None of the documents could be processed."
+        )
+        self.assertFalse(response.data["errors"]["results"][0]["success"])
+
+        # an empty request
+        response = self.post_bulk("bulk_create", dict(documents=[]))
+        self.assertEquals(response.status_code, 400)
+        self.assertEquals(response.data.get("message"), "Invalid data")
+
+        # without authentication
+        response = self.post_bulk(
+            "bulk_create", dict(documents=[valid_document]), authenticate=False
+        )
+        self.assertEquals(response.status_code, 401)
+
+    def test_bulk_update_document(self):
+        (existing_document,) = self.create_documents("Test Doc")
+        missing_document_id = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+        response = self.post_bulk(
+            "bulk_update",
+            dict(
+                documents=[
+                    dict(id=str(existing_document.id), title="New Title"),
+                    dict(id=str(existing_document.id), status="Important"),
+                    dict(id=missing_document_id, title="New Title"),
+                ]
+            ),
+        )
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.data.get("message"), "Successfully updated documents.")
+        self.assertTrue(response.data.get("is_partially_processed"))
+        results = response.data["data"]["results"]
+        self.assertListEqual(
+            [result["success"] for result in results], [True, False, False]
+        )
+        self.assertEquals(results[0]["id"], str(existing_document.id))
+        self.assertIn("status", results[1]["errors"])
+        self.assertEquals(results[2]["status_code"], 403)
+        existing_document.refresh_from_db()
+        self.assertEquals(existing_document.title, "New Title")
+
+        # none of the documents can be updated
+        response = self.post_bulk(
+            "bulk_update", dict(documents=[dict(id=missing_document_id, title="Title")])
+        )
+        self.assertEquals(response.status_code, 400)
+        self.assertEquals(
+            response.data.get("message"), "None of the documents could be processed."
+        )
+
+    def test_bulk_delete_document(self):
+        first_document, second_document = self.create_documents("Doc 1", "Doc 2")
+        missing_document_id = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+        response = self.post_bulk(
+            "bulk_delete",
+            dict(ids=[str(first_document.id), missing_document_id]),
+        )
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.data.get("message"), "Successfully deleted documents.")
+        self.assertTrue(response.data.get("is_partially_processed"))
+        results = response.data["data"]["results"]
+        self.assertListEqual([result["success"] for result in results], [True, False])
+        self.assertEquals(results[0]["id"], str(first_document.id))
+        self.assertFalse(Document.objects.filter(id=first_document.id).exists())
+
+        # every document is deleted
+        response = self.post_bulk("bulk_delete", dict(ids=[str(second_document.id)]))
+        self.assertEquals(response.status_code, 200)
+        self.assertNotIn("is_partially_processed", response.data)
+
+        # none of the documents exists
+        response = self.post_bulk("bulk_delete", dict(ids=[missing_document_id]))
+        self.assertEquals(response.status_code, 400)
+        self.assertEquals(
+            response.data.get("message"), "None of the documents could be processed."
+        )
+
+        # an id that is not a uuid fails the whole request
+        response = self.post_bulk("bulk_delete", dict(ids=["not-a-uuid"]))
+        self.assertEquals(response.status_code, 400)
+        self.assertEquals(response.data.get("message"), "Invalid data")
@@ -1,4 +1,12 @@
+import hashlib
+from django.conf import settings
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
 from django.utils.decorators import decorator_from_middleware_with_args
+from django.utils.http import quote_etag
 from drf_spectacular.utils import extend_schema_view
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -9,24 +17,37 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 # local imports
 from .serializers import (
+    DocumentBulkDeleteSerializer,
+    DocumentBulkSerializer,
+    DocumentBulkUpdateItemSerializer,
     DocumentCreateSerializer,
+    DocumentFinalizeUploadSerializer,
     DocumentListSerializer,
     DocumentRetrieveSerializer,
     DocumentUpdateSerializer,
+    DocumentUploadUrlSerializer,
 )
 from . import open_api
-from .pagination import DocumentPagination
+from .pagination import DocumentCursorPagination, DocumentPagination
 from .filters import DocumentFilters
 
 # app imports
 from domain_driven_api.application.document.services import DocumentAppServices
+from domain_driven_api.domain.document.models import Document
+from domain_driven_api.infrastructure.service_container.services import get_service
+from domain_driven_api.infrastructure.storages.upload_handlers import (
+    S3StreamingUploadHandler,
+)
 
 from utils.django.exceptions import (
+    BaseExceptionWithLogs,
     DoNotHavePermissionException,
     InvalidModuleTypeException,
     DocumentException,
     DocumentNotExistsException,
+    DirectUploadException,
     FileExtensionNotAllowedException,
+    FileSizeNotAllowedException,
     UserNotExistException,
     NotFromSameCompanyException,
 )
@@ -39,8 +60,15 @@ from domain_driven_api.interface.access_control.middleware import MiddlewareWith
 @extend_schema_view(
     create=open_api.document_create_extension,
     list=open_api.document_list_extension,
+    retrieve=open_api.document_retrieve_extension,
     update=open_api.document_update_extension,
     delete_document=open_api.delete_document_extension,
+    permission_status=open_api.document_permission_status_extension,
+    upload_url=open_api.document_upload_url_extension,
+    finalize_upload=open_api.document_finalize_upload_extension,
+    bulk_create=open_api.document_bulk_create_extension,
+    bulk_update=open_api.document_bulk_update_extension,
+    bulk_delete=open_api.document_bulk_delete_extension,
 )
 class DocumentViewSet(viewsets.ViewSet):
     """
@@ -50,26 +78,52 @@ class DocumentViewSet(viewsets.ViewSet):
         authentication_classes (tuple): A tuple of authentication classes used for authentication.
         permission_classes (tuple): A tuple of permission classes used for authorization.
         pagination_class (class): The pagination class used for paginating the queryset.
+        cursor_pagination_class (class): The keyset pagination class used when the request asks for `pagination=cursor`.
         filter_class (class): The filter class used for filtering the queryset.
+        streaming_upload_actions (tuple): The actions whose document file is streamed to the bucket while the request is read.
         access_control (function): A decorator function used for applying access control middleware.
 
     Methods:
+        initialize_request(request): Adds the streaming upload handler for the actions uploading a document file.
         get_queryset(): Returns the queryset for retrieving documents.
         get_serializer_context(): Returns the context for the serializer.
         get_serializer_class(): Returns the serializer class based on the action.
+        get_paginator(): Returns the paginator selected by the `pagination` query parameter.
         create(request): Creates a new document.
-        list(request): Lists all documents.
+        list(request): Lists all documents, or answers 304 if the client's copy is current.
+        retrieve(request, pk): Retrieves a document, or answers 304 if the client's copy is current.
         update(request, pk): Updates an existing document.
         delete_document(request, pk): Deletes a document.
+        permission_status(request, pk): Returns whether the permissions of the latest change reached every user.
+        upload_url(request): Issues a presigned upload of a document file straight to the bucket.
+        finalize_upload(request): Creates a document from a file uploaded with `upload_url`.
+        bulk_create(request): Creates many link documents, with a result per document.
+        bulk_update(request): Updates many documents, with a result per document.
+        bulk_delete(request): Deletes many documents, with a result per document.
     """
 
     authentication_classes = (JWTAuthentication,)
     permission_classes = (IsAuthenticated,)
     pagination_class = DocumentPagination
+    cursor_pagination_class = DocumentCursorPagination
     filter_class = DocumentFilters
+    streaming_upload_actions = ("create", "update")
 
     access_control = decorator_from_middleware_with_args(MiddlewareWithLogger)
 
+    def initialize_request(self, request, *args, **kwargs):
+        # the handler has to be in place before the multipart body is parsed
+        drf_request = super().initialize_request(request, *args, **kwargs)
+        if (
+            settings.DOCUMENT_STREAMING_UPLOAD
+            and self.action in self.streaming_upload_actions
+        ):
+            request.upload_handlers = [
+                S3StreamingUploadHandler(request),
+                *request.upload_handlers,
+            ]
+        return drf_request
+
     @access_control()
     def get_queryset(self):
         """
@@ -86,15 +140,12 @@ class DocumentViewSet(viewsets.ViewSet):
         Raises:
             None
         """
-        document_app_services = DocumentAppServices(log=self.log)
-        queryset = (
-            document_app_services.list_documents(
-                user=self.request.user,
-                direct_report_id=self.request.query_params.get("direct_report"),
-            )
-            .distinct()
-            .order_by("-created_at")
-        )
+        document_app_services = get_service(DocumentAppServices, log=self.log)
+        # a single table queryset, the permissions are a semi-join so no row is duplicated
+        queryset = document_app_services.list_documents(
+            user=self.request.user,
+            direct_report_id=self.request.query_params.get("direct_report"),
+        ).order_by("-created_at", "-id")
         return self.filter_class(self.request.query_params, queryset=queryset).qs
 
     def get_serializer_context(self):
@@ -102,13 +153,130 @@ class DocumentViewSet(viewsets.ViewSet):
         context.update({"log": self.log})
         return context
 
+    def get_paginator(self):
+        if self.request.query_params.get("pagination") == "cursor":
+            return self.cursor_pagination_class()
+        return self.pagination_class()
+
     def get_serializer_class(self):
         if self.action == "create":
             return DocumentCreateSerializer
-        if self.action == "list":
+        if self.action in ("list", "retrieve"):
             return DocumentListSerializer
         if self.action == "update":
             return DocumentUpdateSerializer
+        if self.action == "upload_url":
+            return DocumentUploadUrlSerializer
+        if self.action == "finalize_upload":
+            return DocumentFinalizeUploadSerializer
+        if self.action in ("bulk_create", "bulk_update"):
+            return DocumentBulkSerializer
+        if self.action == "bulk_delete":
+            return DocumentBulkDeleteSerializer
+
+    def _check_conditional_request(self, queryset):
+        """
+        Returns the ETag validator of a set of documents, and a 304 response if the request's If-None-Match
+        matches it.
+
+        The validators come from aggregates of the documents, of the permissions they are listed with and of their
+        owners (see `DocumentAppServices.get_documents_version`), so a client polling an unchanged list is
+        answered before the documents are loaded or serialized. The ETag also covers the requesting user, the query string and
+        the language, which change the response body. No Last-Modified is sent: the latest modification of the
+        remaining documents does not move on a deletion, and an If-Modified-Since would get a stale 304.
+
+        Parameters:
+            queryset (QuerySet[Document]): The documents the response would hold.
+
+        Returns:
+            tuple: The validators as response headers, and the 304 response or None.
+        """
+        document_app_services = get_service(DocumentAppServices, log=self.log)
+        version = document_app_services.get_documents_version(
+            queryset=queryset,
+            direct_report_id=self.request.query_params.get("direct_report"),
+        )
+        etag = quote_etag(
+            hashlib.sha256(
+                "|".join(
+                    [
+                        version,
+                        str(self.request.user.id),
+                        self.request.get_full_path(),
+                        self.request.headers.get("Language", "en").lower(),
+                    ]
+                ).encode("utf-8")
+            ).hexdigest()[:32]
+        )
+        validators = {"ETag": etag}
+        not_modified = get_conditional_response(self.request, etag=etag)
+        if not_modified is not None:
+            self._set_validators(not_modified, validators)
+        return validators, not_modified
+
+    @staticmethod
+    def _set_validators(response, validators):
+        # the client keeps the response but revalidates it on every request, per user and language
+        for header, value in validators.items():
+            response.headers[header] = value
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Authorization", "Language"))
+        return response
+
+    def _validate_bulk_items(self, items, item_serializer):
+        """
+        Validates each item of a bulk request on its own.
+
+        Returns:
+            tuple: The (index, data) of the valid items, and the results of the request with the errors of the
+            invalid items filled in.
+        """
+        valid_items, results = [], [None] * len(items)
+        for index, item in enumerate(items):
+            serializer_data = item_serializer(data=item)
+            if serializer_data.is_valid():
+                valid_items.append((index, serializer_data.data))
+            else:
+                results[index] = dict(
+                    index=index,
+                    success=False,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="Invalid data",
+                    errors=serializer_data.errors,
+                )
+        return valid_items, results
+
+    def _get_bulk_result(self, index, result, document_id=None):
+        # the result of an item is the document, True for a deletion, or the exception that stopped it
+        if isinstance(result, BaseExceptionWithLogs):
+            return dict(
+                index=index,
+                success=False,
+                status_code=result.status_code,
+                message=result.message,
+                errors=result.error_data(),
+            )
+        return dict(
+            index=index,
+            success=True,
+            id=str(result.id) if isinstance(result, Document) else str(document_id),
+        )
+
+    def _get_bulk_response(self, results, message):
+        # a request whose items all failed is an error, one with some failed items is partially processed
+        processed_count = sum(result["success"] for result in results)
+        if not processed_count:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=dict(results=results),
+                message="None of the documents could be processed.",
+                for_error=True,
+            )
+        return APIResponse(
+            data=dict(results=results),
+            message=message,
+            is_partially_processed=processed_count < len(results),
+        )
 
     @access_control()
     def create(self, request):
@@ -125,15 +293,25 @@ class DocumentViewSet(viewsets.ViewSet):
 
         Raises:
             DocumentException: If there is an error related to the document.
-            FileExtensionNotAllowedException: If the file extension is not allowed.
+            FileExtensionNotAllowedException: If the file extension or content is not allowed.
+            FileSizeNotAllowedException: If the file is larger than `settings.DOCUMENT_MAX_UPLOAD_SIZE`.
             Exception: If there is a general error during the document creation process.
         """
         self.parser_classes = [MultiPartParser, FormParser]
         serializer = self.get_serializer_class()
-        serializer_data = serializer(data=request.data)
+        try:
+            # the document file is validated and streamed to the bucket while the body is parsed
+            serializer_data = serializer(data=request.data)
+        except (FileExtensionNotAllowedException, FileSizeNotAllowedException) as e:
+            return APIResponse(
+                status_code=e.status_code,
+                errors=e.error_data(),
+                message=e.message,
+                for_error=True,
+            )
         if serializer_data.is_valid():
             try:
-                document_app_services = DocumentAppServices(log=self.log)
+                document_app_services = get_service(DocumentAppServices, log=self.log)
                 document_obj = document_app_services.create_document_from_dict(
                     user=self.request.user,
                     data=serializer_data.data,
@@ -191,7 +369,10 @@ class DocumentViewSet(viewsets.ViewSet):
         """
         serializer = self.get_serializer_class()
         queryset = self.get_queryset()
-        paginator = self.pagination_class()
+        validators, not_modified = self._check_conditional_request(queryset)
+        if not_modified is not None:
+            return not_modified
+        paginator = self.get_paginator()
         paginated_queryset = paginator.paginate_queryset(queryset, request)
         serializer_data = serializer(
             paginated_queryset,
@@ -204,7 +385,58 @@ class DocumentViewSet(viewsets.ViewSet):
         )
         paginated_data = paginator.get_paginated_response(serializer_data.data).data
         message = "Successfully listed all documents."
-        return APIResponse(data=paginated_data, message=message)
+        return self._set_validators(
+            APIResponse(data=paginated_data, message=message), validators
+        )
+
+    @access_control(direct_report_required=True)
+    def retrieve(self, request, pk):
+        """
+        Retrieves a document listed through the direct report.
+
+        Like `list`, the response carries an ETag validator and a conditional request for an unchanged document
+        is answered with 304 before it is loaded.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+            pk (str): The primary key of the document.
+
+        Returns:
+            APIResponse: The API response object containing the document data and a success message.
+
+        Raises:
+            DocumentNotExistsException: If the document does not exist or is not listed through the direct report.
+        """
+        serializer = self.get_serializer_class()
+        queryset = self.get_queryset().filter(id=pk)
+        validators, not_modified = self._check_conditional_request(queryset)
+        if not_modified is not None:
+            return not_modified
+        document_obj = queryset.first()
+        if not document_obj:
+            e = DocumentNotExistsException(
+                "document-not-found-exception", "Document not found", self.log
+            )
+            return APIResponse(
+                status_code=e.status_code,
+                errors=e.error_data(),
+                message=e.message,
+                for_error=True,
+            )
+        serializer_data = serializer(
+            document_obj,
+            context={
+                "user": self.request.user,
+                "request": self.request,
+                "log": self.log,
+            },
+        )
+        return self._set_validators(
+            APIResponse(
+                data=serializer_data.data, message="Successfully fetched the document."
+            ),
+            validators,
+        )
 
     @access_control()
     def update(self, request, pk):
@@ -222,7 +454,8 @@ class DocumentViewSet(viewsets.ViewSet):
 
         Raises:
             DocumentNotExistsException: If the document does not exist.
-            FileExtensionNotAllowedException: If the file extension is not allowed.
+            FileExtensionNotAllowedException: If the file extension or content is not allowed.
+            FileSizeNotAllowedException: If the file is larger than `settings.DOCUMENT_MAX_UPLOAD_SIZE`.
             DocumentException: If there is an error related to the document.
             DoNotHavePermissionException: If the user does not have permission to update the document.
             InvalidModuleTypeException: If the module type is invalid.
@@ -233,10 +466,18 @@ class DocumentViewSet(viewsets.ViewSet):
             Exception: If there is a general error during the document update process.
         """
         serializer = self.get_serializer_class()
-        serializer_data = serializer(data=request.data)
+        try:
+            serializer_data = serializer(data=request.data)
+        except (FileExtensionNotAllowedException, FileSizeNotAllowedException) as e:
+            return APIResponse(
+                status_code=e.status_code,
+                errors=e.error_data(),
+                message=e.message,
+                for_error=True,
+            )
         if serializer_data.is_valid():
             try:
-                document_app_services = DocumentAppServices(log=self.log)
+                document_app_services = get_service(DocumentAppServices, log=self.log)
                 document_obj = document_app_services.update_document_from_dict(
                     user=self.request.user,
                     data=serializer_data.data,
@@ -310,7 +551,7 @@ class DocumentViewSet(viewsets.ViewSet):
             Exception: If there is a general error during the document deletion process.
         """
         try:
-            document_app_services = DocumentAppServices(log=self.log)
+            document_app_services = get_service(DocumentAppServices, log=self.log)
             document_app_services.delete_document_by_id(
                 user=self.request.user,
                 document_id=pk,
@@ -336,3 +577,331 @@ class DocumentViewSet(viewsets.ViewSet):
                 for_error=True,
                 general_error=True,
             )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="permission-status",
+        name="permission_status",
+    )
+    @access_control()
+    def permission_status(self, request, pk):
+        """
+        Returns the permission propagation status of a document.
+
+        When the permissions are propagated in a celery task, the create and update responses return the status
+        "Pending"; this endpoint is polled until it is "Completed" (or "Failed").
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+            pk (str): The primary key of the document.
+
+        Returns:
+            APIResponse: The API response object containing the document id and its permission propagation status.
+
+        Raises:
+            DocumentNotExistsException: If the document does not exist.
+        """
+        try:
+            document_app_services = get_service(DocumentAppServices, log=self.log)
+            document_status = (
+                document_app_services.get_document_permission_propagation_status(
+                    user=self.request.user,
+                    document_id=pk,
+                    company_id=self.request.query_params.get("company_id"),
+                )
+            )
+            return APIResponse(
+                data=document_status,
+                message="Successfully fetched the document permission status.",
+            )
+        except DocumentNotExistsException as e:
+            return APIResponse(
+                status_code=e.status_code,
+                errors=e.error_data(),
+                message=e.message,
+                for_error=True,
+            )
+        except Exception as e:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=e,
+                for_error=True,
+                general_error=True,
+            )
+
+    @action(detail=False, methods=["post"], url_path="upload-url", name="upload_url")
+    @access_control()
+    def upload_url(self, request):
+        """
+        Issues a presigned upload of a document file.
+
+        The client posts the file with the returned `fields` to `upload_url`, straight to the bucket, then calls
+        `finalize_upload` with the `upload_token` to create the document. The file never goes through the workers.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            APIResponse: The API response object containing the upload url, its form fields and the upload token.
+
+        Raises:
+            DirectUploadException: If the media files are not stored in a bucket.
+            FileExtensionNotAllowedException: If the file extension is not allowed.
+        """
+        serializer = self.get_serializer_class()
+        serializer_data = serializer(data=request.data)
+        if serializer_data.is_valid():
+            try:
+                document_app_services = get_service(DocumentAppServices, log=self.log)
+                upload = document_app_services.create_document_upload(
+                    user=self.request.user,
+                    file_name=serializer_data.validated_data["file_name"],
+                    content_type=serializer_data.validated_data.get("content_type"),
+                )
+                return APIResponse(
+                    data=upload, message="Successfully created the upload url."
+                )
+            except (DirectUploadException, FileExtensionNotAllowedException) as e:
+                return APIResponse(
+                    status_code=e.status_code,
+                    errors=e.error_data(),
+                    message=e.message,
+                    for_error=True,
+                )
+        return APIResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            errors=serializer_data.errors,
+            message="Invalid data",
+            for_error=True,
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="finalize-upload",
+        name="finalize_upload",
+    )
+    @access_control()
+    def finalize_upload(self, request):
+        """
+        Creates a document from a file uploaded with `upload_url`.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            APIResponse: The API response object containing the created document data and a success message.
+
+        Raises:
+            DirectUploadException: If the upload token is invalid or expired, or the file was not uploaded.
+            FileExtensionNotAllowedException: If the content of the file does not match its extension.
+            FileSizeNotAllowedException: If the file is larger than `settings.DOCUMENT_MAX_UPLOAD_SIZE`.
+            DocumentException: If there is an error related to the document.
+            Exception: If there is a general error during the document creation process.
+        """
+        serializer = self.get_serializer_class()
+        serializer_data = serializer(data=request.data)
+        if serializer_data.is_valid():
+            try:
+                document_app_services = get_service(DocumentAppServices, log=self.log)
+                document_obj = document_app_services.finalize_document_upload(
+                    user=self.request.user,
+                    data=serializer_data.data,
+                    upload_token=serializer_data.validated_data["upload_token"],
+                    company_id=self.request.query_params.get("company_id"),
+                    is_success_manager=self.request.is_success_manager,
+                )
+                response = DocumentRetrieveSerializer(
+                    document_obj,
+                    context={
+                        "user": self.request.user,
+                        "request": self.request,
+                        "log": self.log,
+                    },
+                )
+                return APIResponse(
+                    data=response.data, message="Successfully created document."
+                )
+            except (
+                DirectUploadException,
+                DocumentException,
+                FileExtensionNotAllowedException,
+                FileSizeNotAllowedException,
+            ) as e:
+                return APIResponse(
+                    status_code=e.status_code,
+                    errors=e.error_data(),
+                    message=e.message,
+                    for_error=True,
+                )
+            except Exception as e:
+                return APIResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    errors=e,
+                    for_error=True,
+                    general_error=True,
+                )
+        return APIResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            errors=serializer_data.errors,
+            message="Invalid data",
+            for_error=True,
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk-create", name="bulk_create")
+    @access_control()
+    def bulk_create(self, request):
+        """
+        Creates many link documents.
+
+        Every document is validated, then the valid ones are created together; the response holds a result per
+        document, in the order of the request. Files are uploaded one at a time with `upload_url`.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            APIResponse: The API response object containing the result of each document, partially processed if some failed.
+
+        Exceptions:
+            Exception: If there is a general error during the documents creation process.
+        """
+        serializer = self.get_serializer_class()
+        serializer_data = serializer(data=request.data)
+        if not serializer_data.is_valid():
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=serializer_data.errors,
+                message="Invalid data",
+                for_error=True,
+            )
+        try:
+            valid_items, results = self._validate_bulk_items(
+                serializer_data.validated_data["documents"], DocumentCreateSerializer
+            )
+            if valid_items:
+                document_app_services = get_service(DocumentAppServices, log=self.log)
+                document_results = document_app_services.bulk_create_documents_from_list(
+                    user=self.request.user,
+                    items=[item for _, item in valid_items],
+                    company_id=self.request.query_params.get("company_id"),
+                    is_success_manager=self.request.is_success_manager,
+                )
+                for (index, _), result in zip(valid_items, document_results):
+                    results[index] = self._get_bulk_result(index, result)
+            return self._get_bulk_response(
+                results, message="Successfully created documents."
+            )
+        except Exception as e:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=e,
+                for_error=True,
+                general_error=True,
+            )
+
+    @action(detail=False, methods=["post"], url_path="bulk-update", name="bulk_update")
+    @access_control()
+    def bulk_update(self, request):
+        """
+        Updates many documents.
+
+        Every update is validated, then applied in its own transaction; the response holds a result per
+        document, in the order of the request.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            APIResponse: The API response object containing the result of each document, partially processed if some failed.
+
+        Exceptions:
+            Exception: If there is a general error during the documents update process.
+        """
+        serializer = self.get_serializer_class()
+        serializer_data = serializer(data=request.data)
+        if not serializer_data.is_valid():
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=serializer_data.errors,
+                message="Invalid data",
+                for_error=True,
+            )
+        try:
+            valid_items, results = self._validate_bulk_items(
+                serializer_data.validated_data["documents"],
+                DocumentBulkUpdateItemSerializer,
+            )
+            if valid_items:
+                document_app_services = get_service(DocumentAppServices, log=self.log)
+                document_results = document_app_services.bulk_update_documents_from_list(
+                    user=self.request.user,
+                    items=[item for _, item in valid_items],
+                    company_id=self.request.query_params.get("company_id"),
+                    is_success_manager=self.request.is_success_manager,
+                )
+                for (index, _), result in zip(valid_items, document_results):
+                    results[index] = self._get_bulk_result(index, result)
+            return self._get_bulk_response(
+                results, message="Successfully updated documents."
+            )
+        except Exception as e:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=e,
+                for_error=True,
+                general_error=True,
+            )
+
+    @action(detail=False, methods=["post"], url_path="bulk-delete", name="bulk_delete")
+    @access_control()
+    def bulk_delete(self, request):
+        """
+        Deletes many documents.
+
+        The documents the user can write are deleted together; the response holds a result per ID, in the order
+        of the request.
+
+        Parameters:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            APIResponse: The API response object containing the result of each document, partially processed if some failed.
+
+        Exceptions:
+            Exception: If there is a general error during the documents deletion process.
+        """
+        serializer = self.get_serializer_class()
+        serializer_data = serializer(data=request.data)
+        if not serializer_data.is_valid():
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=serializer_data.errors,
+                message="Invalid data",
+                for_error=True,
+            )
+        try:
+            document_ids = serializer_data.validated_data["ids"]
+            document_app_services = get_service(DocumentAppServices, log=self.log)
+            document_results = document_app_services.bulk_delete_documents_by_ids(
+                user=self.request.user,
+                document_ids=document_ids,
+                company_id=self.request.query_params.get("company_id"),
+            )
+            results = [
+                self._get_bulk_result(index, result, document_id=document_id)
+                for index, (document_id, result) in enumerate(
+                    zip(document_ids, document_results)
+                )
+            ]
+            return self._get_bulk_response(
+                results, message="Successfully deleted documents."
+            )
+        except Exception as e:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                errors=e,
+                for_error=True,
+                general_error=True,
+            )
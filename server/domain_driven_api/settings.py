@@ -58,11 +58,16 @@ INSTALLED_APPS = [
     "django_pgviews",
     # app modules
     "domain_driven_api.domain.document",
+    "domain_driven_api.domain.instance_permission",
+    "domain_driven_api.domain.stored_object",
     "widget_tweaks",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "domain_driven_api.infrastructure.middlewares.query_instrumentation_middleware.QueryInstrumentationMiddleware",
+    "domain_driven_api.infrastructure.middlewares.identity_map_middleware.IdentityMapMiddleware",
+    "domain_driven_api.infrastructure.middlewares.service_container_middleware.ServiceContainerMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -147,7 +152,17 @@ DATABASES = {
 }
 
 
-from datetime import date, timedelta
+# file handlers only queue the records, a background thread formats and writes
+# them in batches to a file named after the current date
+ASYNC_FILE_HANDLER = (
+    "domain_driven_api.infrastructure.logger.handlers.AsyncDailyFileHandler"
+)
+ASYNC_FILE_HANDLER_OPTIONS = {
+    "max_queue_size": int(os.getenv("LOGGER_MAX_QUEUE_SIZE", 10000)),
+    "batch_size": int(os.getenv("LOGGER_BATCH_SIZE", 500)),
+    # one of "drop_newest", "drop_oldest" or "block"
+    "overflow_policy": os.getenv("LOGGER_OVERFLOW_POLICY", "drop_newest"),
+}
 
 LOGGER_HANDLERS = os.getenv(
     "LOGGER_HANDLERS",
@@ -182,27 +197,31 @@ LOGGING = {
     "handlers": {
         "debug_file": {
             "level": "DEBUG",
-            "class": "logging.FileHandler",
-            "filename": f"logs/debug/{date.today()}_logger.log",
+            "class": ASYNC_FILE_HANDLER,
+            "filename_pattern": "logs/debug/{date}_logger.log",
             "formatter": "json",
+            **ASYNC_FILE_HANDLER_OPTIONS,
         },
         "info_file": {
             "level": "INFO",
-            "class": "logging.FileHandler",
-            "filename": f"logs/info/{date.today()}_info.log",
+            "class": ASYNC_FILE_HANDLER,
+            "filename_pattern": "logs/info/{date}_info.log",
             "formatter": "json",
+            **ASYNC_FILE_HANDLER_OPTIONS,
         },
         "warn_file": {
             "level": "WARNING",
-            "class": "logging.FileHandler",
-            "filename": f"logs/warning/{date.today()}_warn.log",
+            "class": ASYNC_FILE_HANDLER,
+            "filename_pattern": "logs/warning/{date}_warn.log",
             "formatter": "json",
+            **ASYNC_FILE_HANDLER_OPTIONS,
         },
         "error_file": {
             "level": "ERROR",
-            "class": "logging.FileHandler",
-            "filename": f"logs/error/{date.today()}_error.log",
+            "class": ASYNC_FILE_HANDLER,
+            "filename_pattern": "logs/error/{date}_error.log",
             "formatter": "json",
+            **ASYNC_FILE_HANDLER_OPTIONS,
         },
         "console": {
             "class": "logging.StreamHandler",
@@ -210,9 +229,10 @@ LOGGING = {
         },
         "db_query_file": {
             "level": "DEBUG",
-            "class": "logging.FileHandler",
+            "class": ASYNC_FILE_HANDLER,
             "formatter": "custom_format_with_counter",
-            "filename": f"logs/db_query/{date.today()}_debug.log",
+            "filename_pattern": "logs/db_query/{date}_debug.log",
+            **ASYNC_FILE_HANDLER_OPTIONS,
         },
     },
     "loggers": {
@@ -221,9 +241,20 @@ LOGGING = {
             "level": "DEBUG",
             "propagate": False,
         },
+        # every statement is only logged here when DEBUG is on and DB_QUERY_LOG_LEVEL is DEBUG
         "django.db.backends": {
             "handlers": ["db_query_file"],
-            "level": "DEBUG",
+            "level": os.getenv("DB_QUERY_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+        "domain_driven_api.infrastructure.query_instrumentation": {
+            "handlers": ["db_query_file"],
+            "level": "INFO",
+            "propagate": False,
+        },
+        "domain_driven_api.infrastructure.middlewares.query_instrumentation_middleware": {
+            "handlers": ["db_query_file"],
+            "level": "INFO",
             "propagate": False,
         },
     },
@@ -372,6 +403,44 @@ CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = bool(int(os.getenv("CELERY_TASK_TRACK_STARTED")))
 
+# share a document with the seniors or reportees of its owner in a celery task instead of in the request
+DOCUMENT_PERMISSION_PROPAGATION_ASYNC = bool(
+    int(os.getenv("DOCUMENT_PERMISSION_PROPAGATION_ASYNC", "0"))
+)
+# seconds after which a document still pending has its permission propagation queued again
+DOCUMENT_PERMISSION_PROPAGATION_STALE_AFTER = int(
+    os.getenv("DOCUMENT_PERMISSION_PROPAGATION_STALE_AFTER", 30 * 60)
+)
+
+# cache settings
+
+REDIS_CACHE_URL = os.getenv("REDIS_CACHE_URL", "redis://127.0.0.1:6379/1")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_CACHE_URL,
+    }
+}
+
+# permission decision cache settings
+
+PERMISSION_DECISION_CACHE_ALIAS = "default"
+# bounds the staleness of the decisions the permission versions do not track, e.g. role changes
+PERMISSION_DECISION_CACHE_TIMEOUT = int(
+    os.getenv("PERMISSION_DECISION_CACHE_TIMEOUT", 300)
+)
+
+# translation settings
+
+TRANSLATION_CACHE_ALIAS = "default"
+TRANSLATION_CACHE_MAX_SIZE = int(os.getenv("TRANSLATION_CACHE_MAX_SIZE", 2048))
+# None keeps translations in the shared cache until they are evicted
+TRANSLATION_CACHE_TIMEOUT = None
+TRANSLATION_REMOTE_WORKERS = int(os.getenv("TRANSLATION_REMOTE_WORKERS", 2))
+TRANSLATION_WARM_UP_LANGUAGES = os.getenv("TRANSLATION_WARM_UP_LANGUAGES", "de").split(
+    ","
+)
+
 # default threshold
 
 DEFAULT_THRESHOLD_FOR_RECURRING_ACTIVITY_RECORDS = int(
@@ -384,19 +453,42 @@ LOWEST_PROGRESS_THRESHOLD = float(os.getenv("LOWEST_PROGRESS_THRESHOLD"))
 COMMON_DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
-from django.db.backends.signals import connection_created
-
-
-# Set up a listener to connect the logger to the database
-def connect_db_logger(sender, connection, **kwargs):
-    connection.use_debug_cursor = True
+# query instrumentation settings
 
-
-connection_created.connect(connect_db_logger)
+QUERY_INSTRUMENTATION_ENABLED = bool(int(os.getenv("QUERY_INSTRUMENTATION_ENABLED", 1)))
+# share of the requests whose queries are timed, between 0 and 1
+QUERY_INSTRUMENTATION_SAMPLE_RATE = float(
+    os.getenv("QUERY_INSTRUMENTATION_SAMPLE_RATE", 0.05)
+)
+QUERY_INSTRUMENTATION_SLOW_QUERY_MS = float(
+    os.getenv("QUERY_INSTRUMENTATION_SLOW_QUERY_MS", 200)
+)
+QUERY_INSTRUMENTATION_REPORT_INTERVAL = int(
+    os.getenv("QUERY_INSTRUMENTATION_REPORT_INTERVAL", 100)
+)
 
 
 ALLOWED_FILE_EXTENSIONS = os.getenv("ALLOWED_FILE_EXTENSIONS").split(",")
 
+# stream the document files of the create and update requests to the bucket while the request is read
+DOCUMENT_STREAMING_UPLOAD = ENABLE_AWS_S3_BUCKET and bool(
+    int(os.getenv("DOCUMENT_STREAMING_UPLOAD", "1"))
+)
+DOCUMENT_MAX_UPLOAD_SIZE = int(os.getenv("DOCUMENT_MAX_UPLOAD_SIZE", 50 * 1024 * 1024))
+# the parts of a multipart upload, S3 needs at least 5 MB for every part but the last
+DOCUMENT_UPLOAD_PART_SIZE = max(
+    int(os.getenv("DOCUMENT_UPLOAD_PART_SIZE", 8 * 1024 * 1024)), 5 * 1024 * 1024
+)
+# seconds a presigned upload url is valid, the upload has to be finalized within twice this time
+DOCUMENT_DIRECT_UPLOAD_EXPIRY = int(os.getenv("DOCUMENT_DIRECT_UPLOAD_EXPIRY", 15 * 60))
+# seconds after which an uploaded object never moved to its final name is deleted, longer than a finalization
+DOCUMENT_UPLOAD_MAX_AGE = max(
+    int(os.getenv("DOCUMENT_UPLOAD_MAX_AGE", 24 * 60 * 60)),
+    DOCUMENT_DIRECT_UPLOAD_EXPIRY * 2 + 60 * 60,
+)
+# the most documents a bulk create, update or delete request may hold
+DOCUMENT_BULK_MAX_ITEMS = int(os.getenv("DOCUMENT_BULK_MAX_ITEMS", 500))
+
 ALLOWED_PROFILE_PICTURE_FILE_EXTENSIONS = os.getenv(
     "ALLOWED_PROFILE_PICTURE_FILE_EXTENSIONS"
 ).split(",")
@@ -417,6 +509,8 @@ CEO = "ceo"
 CORS_ORIGIN_ALLOW_ALL = True
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_HEADERS = ALLOWED_HOSTS
+# the validator of the conditional requests, readable by the client
+CORS_EXPOSE_HEADERS = ["ETag"]
 
 CSRF_TRUSTED_ORIGINS = os.getenv("CSRF_TRUSTED_ORIGINS").split(",")
 
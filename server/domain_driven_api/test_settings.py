@@ -6,3 +6,10 @@ LOGGING = {
     "version": 1,
     "disable_existing_loggers": True,
 }
+
+# Keep caches in memory during tests
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
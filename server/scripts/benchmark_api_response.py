@@ -0,0 +1,63 @@
+import inspect
+import timeit
+from domain_driven_api.infrastructure.custom_response.response_and_error import (
+    APIResponse,
+)
+
+NUMBER_OF_RESPONSES = 2000
+
+
+def build_response_with_stack_inspection():
+    """
+    Reproduce the previous per-response overhead: two full `inspect.stack()` walks on top of building the response.
+    """
+    inspect.stack()[1].function
+    inspect.stack()[1].function
+    return APIResponse(data={}, message="Successfully listed all documents.")
+
+
+def build_response_with_message():
+    return APIResponse(data={}, message="Successfully listed all documents.")
+
+
+def build_response_with_default_message():
+    return APIResponse(data={})
+
+
+def measure(callback) -> float:
+    """
+    Measure the average time in microseconds spent to build one response.
+
+    Parameters:
+        callback (function): The function building a response.
+
+    Returns:
+        float: The average time per response in microseconds.
+    """
+    total_time = timeit.timeit(callback, number=NUMBER_OF_RESPONSES)
+    return total_time / NUMBER_OF_RESPONSES * 1_000_000
+
+
+def run():
+    """
+    Print the per-response overhead of APIResponse before and after dropping `inspect.stack()`.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+
+    Example:
+        ./manage.py runscript benchmark_api_response
+    """
+    results = {
+        "before (inspect.stack x2)": measure(build_response_with_stack_inspection),
+        "after (explicit message)": measure(build_response_with_message),
+        "after (default message)": measure(build_response_with_default_message),
+    }
+    for name, microseconds in results.items():
+        print(f"{name:<30} {microseconds:>10.1f} us/response")
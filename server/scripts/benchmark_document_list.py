@@ -0,0 +1,119 @@
+import statistics
+import time
+import uuid
+from django.db import transaction
+from django.http import QueryDict
+from domain_driven_api.domain.document.models import Document, DocumentFactory
+from domain_driven_api.domain.instance_permission.models import InstancePermission
+from domain_driven_api.interface.document.filters import DocumentFilters
+from utils.global_methods.global_value_objects import UserID
+
+NUMBER_OF_DOCUMENTS = 20000
+NUMBER_OF_OWNERS = 100
+NUMBER_OF_RUNS = 20
+PAGE_SIZE = 5
+QUERY_PARAMS = "priority=High,Medium&status=Shared&sort_by=-priority"
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(user_id: uuid.UUID) -> None:
+    """
+    Create the documents of the benchmark, all readable by the given user.
+    """
+    owner_ids = [uuid.uuid4() for _ in range(NUMBER_OF_OWNERS)]
+    documents = []
+    for index in range(NUMBER_OF_DOCUMENTS):
+        document = DocumentFactory.build_entity_with_id(
+            title=f"Benchmark document {index}",
+            priority=[Document.LOW, Document.MEDIUM, Document.HIGH][index % 3],
+            status=[Document.PRIVATE, Document.SHARED][index % 2],
+            owner=UserID(value=owner_ids[index % NUMBER_OF_OWNERS]),
+            link="https://www.google.com/",
+            is_file_uploaded=False,
+        )
+        document.refresh_sort_keys()
+        documents.append(document)
+    Document.objects.bulk_create(documents, batch_size=1000)
+    InstancePermission.objects.bulk_create(
+        [
+            InstancePermission(
+                user_id=user_id,
+                module_type="documents",
+                instance_id=document.id,
+                permissions=InstancePermission.build_permissions(
+                    read_permission=True, write_permission=False
+                ),
+            )
+            for document in documents
+        ],
+        batch_size=1000,
+    )
+
+
+def list_page(user_id: uuid.UUID, distinct: bool) -> None:
+    """
+    Run the list pipeline of DocumentViewSet and fetch a page, with the previous DISTINCT passes when `distinct` is set.
+    """
+    queryset = Document.objects.annotate_by_instance_permission(
+        permissions=InstancePermission.objects.filter(
+            user_id=user_id, module_type="documents", is_active=True
+        ),
+        filters=dict(is_active=True),
+    ).order_by("-created_at", "-id")
+    if distinct:
+        queryset = queryset.distinct()
+    queryset = DocumentFilters(QueryDict(QUERY_PARAMS), queryset=queryset).qs
+    if distinct:
+        # priority_type_filter and status_filter each chained a DISTINCT
+        queryset = queryset.distinct().distinct()
+    queryset.count()
+    list(queryset[:PAGE_SIZE])
+
+
+def measure(user_id: uuid.UUID, distinct: bool) -> float:
+    """
+    Returns the median time in milliseconds to count and fetch a page.
+    """
+    durations = []
+    for _ in range(NUMBER_OF_RUNS):
+        start = time.perf_counter()
+        list_page(user_id=user_id, distinct=distinct)
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def run():
+    """
+    Print the latency of the document list query with and without the DISTINCT passes, on a seeded data set.
+
+    The documents are created in a transaction that is rolled back at the end.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+
+    Example:
+        ./manage.py runscript benchmark_document_list
+    """
+    user_id = uuid.uuid4()
+    try:
+        with transaction.atomic():
+            seed(user_id=user_id)
+            results = {
+                "before (DISTINCT x3)": measure(user_id=user_id, distinct=True),
+                "after (no DISTINCT)": measure(user_id=user_id, distinct=False),
+            }
+            raise Rollback()
+    except Rollback:
+        pass
+    print(f"{NUMBER_OF_DOCUMENTS} documents, {QUERY_PARAMS}")
+    for name, milliseconds in results.items():
+        print(f"{name:<25} {milliseconds:>10.1f} ms/page")
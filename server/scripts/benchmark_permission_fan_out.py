@@ -0,0 +1,117 @@
+import logging
+import time
+import uuid
+from django.db import transaction
+from django.test.utils import override_settings
+from domain_driven_api.application.instance_permission.services import (
+    InstancePermissionAppServices,
+)
+from domain_driven_api.domain.direct_report.services import DirectReportServices
+from domain_driven_api.domain.user.models import UserBasePermissions, UserPersonalData
+from domain_driven_api.domain.user.services import UserServices
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from utils.global_methods.global_value_objects import UserID
+from utils.global_methods.instance_permissions_generator import (
+    generate_permissions_for_all_users,
+)
+
+NUMBERS_OF_REPORTEES = [10, 100, 1000, 10000]
+
+log = AttributeLogger(logging.getLogger(__name__))
+
+
+class Rollback(Exception):
+    pass
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+def seed_reportees(number_of_reportees: int):
+    """
+    Create the users of the benchmark with their direct reports, and return the users.
+    """
+    user_factory = UserServices().get_user_factory()
+    direct_report_factory = DirectReportServices().get_direct_report_factory()
+    users = []
+    for index in range(number_of_reportees):
+        user = user_factory.build_entity_with_id(
+            password="Benchmark@1234",
+            personal_data=UserPersonalData(
+                username=f"benchmark_{index}_{uuid.uuid4().hex}@ymail.com",
+                first_name="Benchmark",
+                last_name=str(index),
+                email=f"benchmark_{index}_{uuid.uuid4().hex}@ymail.com",
+            ),
+            base_permissions=UserBasePermissions(is_staff=False, is_active=True),
+        )
+        users.append(user)
+    users = UserServices().get_user_repo().bulk_create(users, batch_size=1000)
+    DirectReportServices().get_direct_report_repo().bulk_create(
+        [
+            direct_report_factory.build_entity_with_id(user_id=UserID(value=user.id))
+            for user in users
+        ],
+        batch_size=1000,
+    )
+    return users
+
+
+def fan_out_per_user(owner, user_ids):
+    """
+    Reproduce the previous fan-out: the direct report of every user is updated on its own.
+    """
+    generate_permissions_for_all_users(
+        log=log,
+        user=owner,
+        instance_id=str(uuid.uuid4()),
+        module_type="documents",
+        read_permission=True,
+        write_permission=False,
+        users_list=[str(user_id) for user_id in user_ids],
+    )
+
+
+def fan_out_set_based(owner, user_ids):
+    InstancePermissionAppServices(log=log).propagate_instance_permissions(
+        user_ids=user_ids,
+        module_type="documents",
+        instance_ids=[str(uuid.uuid4())],
+        read_permission=True,
+        write_permission=False,
+    )
+
+
+def measure(callback, owner, user_ids) -> float:
+    start = time.perf_counter()
+    callback(owner, user_ids)
+    return (time.perf_counter() - start) * 1000
+
+
+def run():
+    """
+    Print the time spent to share a document with 10, 100, 1k and 10k reportees, with the per-user fan-out and
+    with the set-based propagation. The data is created in transactions that are rolled back.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+
+    Example:
+        ./manage.py runscript benchmark_permission_fan_out
+    """
+    print(f"{'reportees':>10} {'per user (ms)':>15} {'set based (ms)':>15}")
+    for number_of_reportees in NUMBERS_OF_REPORTEES:
+        try:
+            with transaction.atomic():
+                users = seed_reportees(number_of_reportees=number_of_reportees)
+                owner, user_ids = users[0], [user.id for user in users]
+                per_user = measure(fan_out_per_user, owner, user_ids)
+                set_based = measure(fan_out_set_based, owner, user_ids)
+                raise Rollback()
+        except Rollback:
+            pass
+        print(f"{number_of_reportees:>10} {per_user:>15.1f} {set_based:>15.1f}")
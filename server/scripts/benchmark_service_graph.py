@@ -0,0 +1,97 @@
+import logging
+import statistics
+import time
+import tracemalloc
+from domain_driven_api.application.document.services import DocumentAppServices
+from domain_driven_api.application.user.services import UserAppServices
+from domain_driven_api.infrastructure.logger.models import AttributeLogger
+from domain_driven_api.infrastructure.service_container.services import (
+    get_service,
+    service_container_scope,
+)
+
+NUMBER_OF_RUNS = 200
+PAGE_SIZE = 100
+# the collaborators built by the previous eager DocumentAppServices.__init__
+COLLABORATORS = [
+    "user_app_services",
+    "file_app_services",
+    "user_roles_app_service",
+    "direct_report_app_services",
+    "company_division_app_service",
+    "instance_access_permission",
+    "instance_permission_app_services",
+]
+# the collaborators used by a list request
+LIST_COLLABORATORS = ["direct_report_app_services", "instance_permission_app_services"]
+
+
+def build_list_request_services_before(log: AttributeLogger) -> None:
+    """
+    Reproduce the service graph previously built by a list request: an eager DocumentAppServices in
+    get_queryset and one UserAppServices per serialized row.
+    """
+    document_app_services = DocumentAppServices(log=log)
+    for collaborator in COLLABORATORS:
+        getattr(document_app_services, collaborator)
+    for _ in range(PAGE_SIZE):
+        UserAppServices(log=log)
+
+
+def build_list_request_services_after(log: AttributeLogger) -> None:
+    with service_container_scope():
+        document_app_services = get_service(DocumentAppServices, log=log)
+        for collaborator in LIST_COLLABORATORS:
+            getattr(document_app_services, collaborator)
+        for _ in range(PAGE_SIZE):
+            get_service(UserAppServices, log=log)
+
+
+def measure(callback, log: AttributeLogger) -> dict:
+    """
+    Returns the median latency in microseconds and the memory allocated in KiB to build the services of one request.
+    """
+    durations = []
+    for _ in range(NUMBER_OF_RUNS):
+        start = time.perf_counter()
+        callback(log)
+        durations.append((time.perf_counter() - start) * 1_000_000)
+    tracemalloc.start()
+    callback(log)
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict(
+        latency_us=statistics.median(durations),
+        allocated_kib=allocated / 1024,
+        peak_kib=peak / 1024,
+    )
+
+
+def run():
+    """
+    Print the latency and the allocations of the app services built by a documents list request, before and
+    after the lazy per-request service container.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+
+    Example:
+        ./manage.py runscript benchmark_service_graph
+    """
+    log = AttributeLogger(logging.getLogger(__name__))
+    results = {
+        "before (eager, per row)": measure(build_list_request_services_before, log),
+        "after (lazy, per request)": measure(build_list_request_services_after, log),
+    }
+    print(f"list request with {PAGE_SIZE} rows")
+    for name, result in results.items():
+        print(
+            f"{name:<28} {result['latency_us']:>10.1f} us "
+            f"{result['allocated_kib']:>8.1f} KiB allocated {result['peak_kib']:>8.1f} KiB peak"
+        )
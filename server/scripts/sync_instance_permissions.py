@@ -0,0 +1,65 @@
+from django.db import transaction
+from domain_driven_api.domain.direct_report.models import DirectReport
+from domain_driven_api.domain.instance_permission.models import (
+    InstancePermission,
+    InstancePermissionFactory,
+)
+from utils.global_methods.global_value_objects import UserID
+
+MODULE_TYPES = ["documents"]
+BATCH_SIZE = 1000
+
+
+def sync_instance_permissions_of_direct_report(direct_report: DirectReport):
+    """
+    Copy the permission entries of a direct report into the instance permission store.
+
+    Parameters:
+        direct_report (DirectReport): The direct report whose permission entries are copied.
+
+    Returns:
+        None
+
+    """
+    instance_permissions = []
+    for module_type in MODULE_TYPES:
+        for item in getattr(direct_report, module_type) or []:
+            instance_permissions.append(
+                InstancePermissionFactory.build_entity_with_id(
+                    user_id=UserID(value=direct_report.user_id),
+                    module_type=module_type,
+                    instance_id=item["id"],
+                    permissions=item["permissions"],
+                )
+            )
+    with transaction.atomic():
+        InstancePermission.objects.filter(
+            user_id=direct_report.user_id, module_type__in=MODULE_TYPES
+        ).delete()
+        InstancePermission.objects.bulk_create(
+            instance_permissions, batch_size=BATCH_SIZE
+        )
+
+
+def run():
+    """
+    Rebuild the instance permission store from the permission entries of every direct report, and then print a success message.
+
+    The store is filled by the migration `instance_permission/0002`; this rebuilds it after the direct reports
+    were changed outside of `InstancePermissionAppServices`.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+
+    Example:
+        ./manage.py runscript sync_instance_permissions
+    """
+    for direct_report in DirectReport.objects.all().iterator(chunk_size=BATCH_SIZE):
+        sync_instance_permissions_of_direct_report(direct_report=direct_report)
+    print("Successfully synced instance permissions of all direct reports.")
@@ -0,0 +1,58 @@
+from django.conf import settings
+from domain_driven_api.infrastructure.translator.services import (
+    CustomTranslator,
+    load_translation_catalog,
+)
+
+
+def warm_translation_cache(translator: CustomTranslator, languages: list):
+    """
+    Store the translations of every catalog message in the shared translation cache.
+
+    Messages translated in the local catalog are stored as they are; the other languages are translated
+    once with Google Translate, so responses never wait on a remote call for these messages.
+
+    Parameters:
+        translator (CustomTranslator): The translator owning the translation cache.
+        languages (list): The language codes to warm up.
+
+    Returns:
+        None
+
+    """
+    catalog = load_translation_catalog()
+    messages = {message for translations in catalog.values() for message in translations}
+    for language in languages:
+        translations = catalog.get(language, {})
+        for message in messages:
+            if message in translations:
+                translator.translation_cache.set(
+                    message=message,
+                    target_language=language,
+                    translation=translations[message],
+                )
+            else:
+                translator.translate_text(text=message, target_language=language)
+
+
+def run():
+    """
+    Run the 'warm_translation_cache' function for the configured languages, and then print a success message.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+
+    Example:
+        ./manage.py runscript warm_translation_cache
+    """
+    warm_translation_cache(
+        translator=CustomTranslator(),
+        languages=settings.TRANSLATION_WARM_UP_LANGUAGES,
+    )
+    print("Successfully warmed up the translation cache.")
@@ -4,6 +4,7 @@
 import json
 from typing import List, Dict, Any
 from django.db import models
+from django.db.models.query import QuerySet
 
 
 class ActivityTracking(models.Model):
@@ -38,6 +39,16 @@ class DirectReportPermissionAnnotateMixin(models.Model):
             Returns:
                 QuerySet: The annotated queryset.
 
+        annotate_by_instance_permission(permissions: QuerySet, filters: Dict[str, Any] = dict()) -> QuerySet:
+            Restricts the queryset to the instances present in the given permission rows and annotates their permissions.
+
+            Args:
+                permissions (QuerySet): A queryset of instance permission rows exposing "instance_id" and "permissions".
+                filters (Dict[str, Any], optional): Additional filters to apply to the queryset. Defaults to an empty dictionary.
+
+            Returns:
+                QuerySet: The annotated queryset.
+
     """
 
     class DirectReportPermissionAnnotateManager(models.Manager):
@@ -66,6 +77,19 @@ class DirectReportPermissionAnnotateMixin(models.Model):
                 )
             )
 
+        def annotate_by_instance_permission(
+            self, permissions: QuerySet, filters: Dict[str, Any] = dict()
+        ):
+            instance_permission = permissions.filter(instance_id=models.OuterRef("id"))
+            return self.filter(
+                id__in=permissions.values("instance_id"), **filters
+            ).annotate(
+                permissions=models.Subquery(
+                    instance_permission.values("permissions")[:1],
+                    output_field=models.JSONField(),
+                )
+            )
+
     objects = DirectReportPermissionAnnotateManager()
 
     class Meta:
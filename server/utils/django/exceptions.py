@@ -565,6 +565,10 @@ class FileException(BaseExceptionWithLogs):
     pass
 
 
+class DirectUploadException(BaseExceptionWithLogs):
+    pass
+
+
 class FileInstanceNotFoundException(Status404Exception):
     pass
 
@@ -0,0 +1,82 @@
+import json
+from typing import Any, Dict, List, Union
+from django.db.models import F, Func, JSONField, Value
+
+# the elements of a jsonb array column, without the elements with one of the given "id"s
+ELEMENTS_WITHOUT_IDS = (
+    "COALESCE((SELECT jsonb_agg(element) FROM jsonb_array_elements(COALESCE(%(field)s, '[]'::jsonb)) AS element "
+    "WHERE NOT element->>'id' = ANY(%(element_ids)s)), '[]'::jsonb)"
+)
+
+
+class JSONBArrayFunc(Func):
+    """
+    Base class of the expressions rewriting a jsonb array column inside the database.
+
+    The column is rewritten in the UPDATE statement itself, so many rows are updated with a single statement
+    and without loading their JSON into Python.
+    """
+
+    output_field = JSONField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql_parts, params = [], []
+        for expression in self.get_source_expressions():
+            expression_sql, expression_params = compiler.compile(expression)
+            sql_parts.append(expression_sql)
+            params.extend(expression_params)
+        return self.template % dict(zip(self.arguments, sql_parts)), params
+
+
+class JSONBArrayUpsert(JSONBArrayFunc):
+    """
+    Replaces, or appends, the elements with the given "id"s in a jsonb array column. The elements are written at the end of the array.
+
+    Parameters:
+        field_name (str): The name of the jsonb array column, e.g. "documents".
+        elements (Union[Dict[str, Any], List[Dict[str, Any]]]): The element, or the elements, to write, with an "id" key.
+
+    Example:
+        DirectReport.objects.filter(user_id__in=user_ids).update(
+            documents=JSONBArrayUpsert("documents", {"id": document_id, "permissions": permissions})
+        )
+    """
+
+    template = ELEMENTS_WITHOUT_IDS + " || %(elements)s::jsonb"
+    arguments = ["field", "element_ids", "elements"]
+
+    def __init__(
+        self, field_name: str, elements: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ):
+        if isinstance(elements, dict):
+            elements = [elements]
+        super().__init__(
+            F(field_name),
+            Value([str(element["id"]) for element in elements]),
+            Value(json.dumps(elements, default=str)),
+        )
+
+
+class JSONBArrayRemove(JSONBArrayFunc):
+    """
+    Removes the elements with the given "id"s from a jsonb array column.
+
+    Parameters:
+        field_name (str): The name of the jsonb array column, e.g. "documents".
+        element_ids (Union[Any, List[Any]]): The "id", or the "id"s, of the elements to remove.
+
+    Example:
+        DirectReport.objects.filter(documents__contains=[{"id": document_id}]).update(
+            documents=JSONBArrayRemove("documents", document_id)
+        )
+    """
+
+    template = ELEMENTS_WITHOUT_IDS
+    arguments = ["field", "element_ids"]
+
+    def __init__(self, field_name: str, element_ids: Union[Any, List[Any]]):
+        if not isinstance(element_ids, (list, tuple, set)):
+            element_ids = [element_ids]
+        super().__init__(
+            F(field_name), Value([str(element_id) for element_id in element_ids])
+        )
@@ -0,0 +1,70 @@
+import json
+from typing import Any, Dict, Iterable, List
+from django.db import connections
+from django.db.models.query import QuerySet
+
+
+def explain_queryset(queryset: QuerySet) -> Dict[str, Any]:
+    """
+    Returns the root node of the Postgres query plan of a queryset, as given by `EXPLAIN (FORMAT JSON)`.
+
+    Parameters:
+        queryset (QuerySet): The queryset to explain.
+
+    Returns:
+        Dict[str, Any]: The root plan node, with its children under "Plans".
+    """
+    connection = connections[queryset.db]
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def find_sequential_scans(queryset: QuerySet, relations: Iterable[str]) -> List[str]:
+    """
+    Returns the relations among the given ones that the Postgres query plan of a queryset reads with a sequential scan.
+
+    Parameters:
+        queryset (QuerySet): The queryset to explain.
+        relations (Iterable[str]): The table names to look for, e.g. the large tables.
+
+    Returns:
+        List[str]: The relations read with a sequential scan, empty when the plan only uses indexes on them.
+
+    Example:
+        find_sequential_scans(Document.objects.filter(owner=user_id), relations=["document"])
+    """
+    relations = set(relations)
+    sequential_scans = []
+    nodes = [explain_queryset(queryset)]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in relations:
+            sequential_scans.append(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return sequential_scans
+
+
+def estimate_queryset_count(queryset: QuerySet) -> int:
+    """
+    Estimate the number of rows of a queryset from the query planner instead of running a COUNT(*).
+
+    The estimate comes from `EXPLAIN` on Postgres and is only as accurate as the table statistics;
+    on other databases it falls back to an exact count.
+
+    Parameters:
+        queryset (QuerySet): The queryset to estimate.
+
+    Returns:
+        int: The estimated number of rows.
+
+    Example:
+        estimate_queryset_count(Document.objects.filter(is_active=True))
+    """
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.count()
+    return int(explain_queryset(queryset)["Plan Rows"])